@@ -1,5 +1,9 @@
+import asyncio
+import gc
 import logging
 import os
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
@@ -8,6 +12,7 @@ from api.ai.controllers.ai_controller import ai
 from api.config import config
 from api.database import engine
 from api.events.controllers.events_controller import events
+from api.events.jobs.occurrence_horizon_job import run_occurrence_horizon_job
 from api.integrations.controllers.integration_controller import integrations
 from api.middleware import error_handling_middleware, request_logging_middleware
 from api.system.models.models import Base
@@ -19,10 +24,24 @@ logging.basicConfig(
 )
 
 
+@asynccontextmanager
+async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+    # Modules, routes and metadata loaded at startup live for the whole
+    # process. Freezing them keeps full collections from rescanning them every
+    # time a large listing allocates enough rows to trigger one.
+    gc.freeze()
+
+    occurrence_horizon_job = asyncio.create_task(run_occurrence_horizon_job())
+
+    yield
+
+    occurrence_horizon_job.cancel()
+
+
 def create_app() -> FastAPI:
     production = os.environ.get("ALLOCATE_ENV") == "production"
 
-    app = FastAPI()
+    app = FastAPI(lifespan=lifespan)
     app_config = config
 
     app.middleware("http")(request_logging_middleware)
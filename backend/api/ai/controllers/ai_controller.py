@@ -26,6 +26,7 @@ from api.events.use_cases.edit_event_use_case import EditEventUseCase
 from api.system.schemas.audio import AudioAnalysisOutput, AudioTranscriptionResponse
 from api.system.schemas.chat import ChatInput, ChatOutput
 from api.system.schemas.event import Event, EventBase
+from api.system.schemas.user import CurrentUser
 
 ai = APIRouter()
 
@@ -37,7 +38,7 @@ async def transcribe_audio(
         TranscribeAudioUseCase,
         Depends(transcribe_audio_use_case),
     ],
-    current_user: Annotated[str, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
 ):
     return await transcribe_audio_use_case.execute(
         current_user,
@@ -53,7 +54,7 @@ async def analyse_audio(
         AnalyseAudioUseCase,
         Depends(analyse_audio_use_case),
     ],
-    current_user: Annotated[str, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
 ):
     return await analyse_audio_use_case.execute(
         current_user,
@@ -82,7 +83,7 @@ def apply_recommendations(  # noqa: PLR0913
         DeleteEventUseCase,
         Depends(delete_event_use_case),
     ],
-    current_user: Annotated[str, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
 ):
     return apply_recommendations_use_case.execute(
         current_user,
@@ -101,7 +102,7 @@ async def analyse_chat(
         AnalyseChatUseCase,
         Depends(analyse_chat_use_case),
     ],
-    current_user: Annotated[str, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
 ):
     return await analyse_chat_use_case.execute(
         current_user,
@@ -14,7 +14,6 @@ from api.ai.use_cases.apply_recommendations_use_case import (
     ApplyRecommendationsUseCase,
 )
 from api.ai.use_cases.transcribe_audio_use_case import TranscribeAudioUseCase
-from api.dependencies import UserRepository, get_user_repository
 from api.integrations.dependencies import search_integration_use_case
 from api.integrations.use_cases.search_integration_use_case import (
     SearchIntegrationUseCase,
@@ -60,44 +59,28 @@ def scheduling_service(
 
 
 def transcribe_audio_use_case(
-    user_repository: Annotated[UserRepository, Depends(get_user_repository)],
     transcription_service: Annotated[
         TranscriptionService,
         Depends(transcription_service),
     ],
 ) -> TranscribeAudioUseCase:
-    return TranscribeAudioUseCase(
-        user_repository,
-        transcription_service,
-    )
+    return TranscribeAudioUseCase(transcription_service)
 
 
 def analyse_audio_use_case(
-    user_repository: Annotated[UserRepository, Depends(get_user_repository)],
     scheduling_service: Annotated[
         SchedulingService,
         Depends(scheduling_service),
     ],
 ) -> AnalyseAudioUseCase:
-    return AnalyseAudioUseCase(
-        user_repository,
-        scheduling_service,
-    )
+    return AnalyseAudioUseCase(scheduling_service)
 
 
-def apply_recommendations_use_case(
-    user_repository: Annotated[UserRepository, Depends(get_user_repository)],
-) -> ApplyRecommendationsUseCase:
-    return ApplyRecommendationsUseCase(
-        user_repository,
-    )
+def apply_recommendations_use_case() -> ApplyRecommendationsUseCase:
+    return ApplyRecommendationsUseCase()
 
 
 def analyse_chat_use_case(
-    user_repository: Annotated[UserRepository, Depends(get_user_repository)],
     chat_service: Annotated[ChatService, Depends(chat_service)],
 ) -> AnalyseChatUseCase:
-    return AnalyseChatUseCase(
-        user_repository,
-        chat_service,
-    )
+    return AnalyseChatUseCase(chat_service)
@@ -7,6 +7,7 @@ from langgraph.prebuilt import create_react_agent
 from api.ai.connectors.openrouter_connector import OpenRouterConnector
 from api.ai.services.tools_service import ToolsService
 from api.ai.services.transcription_service import TranscriptionService
+from api.system.schemas.user import CurrentUser
 
 LLM_MODEL: str = "openai/gpt-oss-120b"
 LLM_TEMPERATURE: float = 0
@@ -27,7 +28,7 @@ class SchedulingService:
         self,
         current_time: str,
         events_by_date: dict[str, list[dict]],
-        current_user: str,
+        current_user: CurrentUser,
     ) -> Any:  # noqa: ANN401
         llm = OpenRouterConnector(
             model=LLM_MODEL,
@@ -48,7 +49,7 @@ class SchedulingService:
         current_time: str,
         user_message: str,
         events_by_date: dict[str, list[dict]],
-        current_user: str,
+        current_user: CurrentUser,
         langfuse_session_id: str,
     ) -> str:
         agent = self._create_scheduling_agent(
@@ -63,7 +64,7 @@ class SchedulingService:
                 "callbacks": [handler],
                 "metadata": {
                     "langfuse_session_id": langfuse_session_id,
-                    "langfuse_user_id": current_user,
+                    "langfuse_user_id": current_user.email_address,
                 },
             },
         )
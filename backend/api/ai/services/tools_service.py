@@ -6,6 +6,7 @@ from api.ai.services.search_service import SearchService
 from api.integrations.use_cases.search_integration_use_case import (
     SearchIntegrationUseCase,
 )
+from api.system.schemas.user import CurrentUser
 
 NOTION_PROVIDER = "notion"
 LINEAR_PROVIDER = "linear"
@@ -20,7 +21,7 @@ class ToolsService:
         self.search_integration_use_case = search_integration_use_case
         self.search_service = search_service
 
-    def get_tools_for_user(self, current_user: str) -> list:
+    def get_tools_for_user(self, current_user: CurrentUser) -> list:
         @tool
         async def search_notion(query: str) -> dict[str, Any]:
             """Search user's Notion workspace for documents, pages, or databases."""
@@ -6,8 +6,7 @@ from api.ai.utils.event_utils import group_events_by_date, parse_events
 from api.system.interfaces.use_cases import UseCase
 from api.system.schemas.audio import AudioAnalysisOutput
 from api.system.schemas.event import Event
-from api.users.errors.user_not_found_error import UserNotFoundError
-from api.users.repositories.user_repository import UserRepository
+from api.system.schemas.user import CurrentUser
 
 TIME_FORMAT: str = "%H:%M"
 SEPARATOR: str = "|"
@@ -17,25 +16,17 @@ BASE_ERROR_MESSAGE = "LLM output is invalid"
 class AnalyseAudioUseCase(UseCase):
     def __init__(
         self,
-        user_repository: UserRepository,
         scheduling_service: SchedulingService,
     ) -> None:
-        self.user_repository = user_repository
         self.scheduling_service = scheduling_service
 
     async def execute(
         self,
-        current_user: str,
+        current_user: CurrentUser,
         transcription_response: str,
         session_id: str,
         events: list[Event] | None = None,
     ) -> AudioAnalysisOutput:
-        user = self.user_repository.find_by_email(current_user)
-
-        if user is None:
-            msg = "User not found"
-            raise UserNotFoundError(msg)
-
         try:
             current_time = datetime.now().strftime(TIME_FORMAT)  # noqa: DTZ005
             parsed_events = parse_events(events)
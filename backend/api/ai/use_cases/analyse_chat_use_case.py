@@ -6,8 +6,7 @@ from api.ai.utils.event_utils import group_events_by_date, parse_events
 from api.system.interfaces.use_cases import UseCase
 from api.system.schemas.chat import ChatInput, ChatOutput
 from api.system.schemas.event import Event
-from api.users.errors.user_not_found_error import UserNotFoundError
-from api.users.repositories.user_repository import UserRepository
+from api.system.schemas.user import CurrentUser
 
 TIME_FORMAT: str = "%H:%M"
 
@@ -15,24 +14,16 @@ TIME_FORMAT: str = "%H:%M"
 class AnalyseChatUseCase(UseCase):
     def __init__(
         self,
-        user_repository: UserRepository,
         chat_service: ChatService,
     ) -> None:
-        self.user_repository = user_repository
         self.chat_service = chat_service
 
     async def execute(
         self,
-        current_user: str,
+        current_user: CurrentUser,
         chat: ChatInput,
         events: list[Event] | None = None,
     ) -> ChatOutput:
-        user = self.user_repository.find_by_email(current_user)
-
-        if user is None:
-            msg = "User not found"
-            raise UserNotFoundError(msg)
-
         try:
             current_time = datetime.now(tz=UTC).strftime(TIME_FORMAT)
 
@@ -43,7 +34,7 @@ class AnalyseChatUseCase(UseCase):
                 current_time,
                 chat.user_input,
                 events_by_date,
-                current_user,
+                current_user.email_address,
             )
 
             return ChatOutput(response=response)
@@ -6,8 +6,7 @@ from api.events.use_cases.delete_event_use_case import DeleteEventUseCase
 from api.events.use_cases.edit_event_use_case import EditEventUseCase
 from api.system.interfaces.use_cases import UseCase
 from api.system.schemas.event import DeleteEvent, EditEvent, EventBase
-from api.users.errors.user_not_found_error import UserNotFoundError
-from api.users.repositories.user_repository import UserRepository
+from api.system.schemas.user import CurrentUser
 
 MAX_PARTS: int = 3
 TIME_FORMAT: str = "%H:%M"
@@ -17,26 +16,14 @@ DESCRIPTION_INDEX: int = 6
 
 
 class ApplyRecommendationsUseCase(UseCase):
-    def __init__(
-        self,
-        user_repository: UserRepository,
-    ) -> None:
-        self.user_repository = user_repository
-
     def execute(
         self,
-        current_user: str,
+        current_user: CurrentUser,
         recommendations: str,
         create_event_use_case: CreateEventUseCase,
         edit_event_use_case: EditEventUseCase,
         delete_event_use_case: DeleteEventUseCase,
     ) -> list[EventBase]:
-        user = self.user_repository.find_by_email(current_user)
-
-        if user is None:
-            msg = "User not found"
-            raise UserNotFoundError(msg)
-
         try:
             return (
                 ApplyRecommendationsUseCase._transform_llm_output_to_pydantic_objects(
@@ -57,7 +44,7 @@ class ApplyRecommendationsUseCase(UseCase):
         create_event_use_case: CreateEventUseCase,
         edit_event_use_case: EditEventUseCase,
         delete_event_use_case: DeleteEventUseCase,
-        current_user: str,
+        current_user: CurrentUser,
     ) -> list[EventBase]:
         events = []
 
@@ -114,7 +101,7 @@ class ApplyRecommendationsUseCase(UseCase):
     def _handle_add_action(
         parts: list[str],
         create_event_use_case: CreateEventUseCase,
-        current_user: str,
+        current_user: CurrentUser,
     ) -> EventBase | None:
         parsed_inputs = ApplyRecommendationsUseCase._parse_llm_line(parts)
 
@@ -153,7 +140,7 @@ class ApplyRecommendationsUseCase(UseCase):
     def _handle_edit_action(
         parts: list[str],
         edit_event_use_case: EditEventUseCase,
-        current_user: str,
+        current_user: CurrentUser,
     ) -> None:
         parsed_inputs = ApplyRecommendationsUseCase._parse_llm_line(parts)
 
@@ -200,7 +187,7 @@ class ApplyRecommendationsUseCase(UseCase):
     def _handle_delete_action(
         parts: list[str],
         delete_event_use_case: DeleteEventUseCase,
-        current_user: str,
+        current_user: CurrentUser,
     ) -> None:
         parsed_inputs = ApplyRecommendationsUseCase._parse_llm_line(parts)
 
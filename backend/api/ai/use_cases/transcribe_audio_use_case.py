@@ -8,8 +8,7 @@ from api.ai.errors.audio_transcription_error import AudioTranscriptionError
 from api.ai.services.transcription_service import TranscriptionService
 from api.system.interfaces.use_cases import UseCase
 from api.system.schemas.audio import AudioTranscriptionResponse
-from api.users.errors.user_not_found_error import UserNotFoundError
-from api.users.repositories.user_repository import UserRepository
+from api.system.schemas.user import CurrentUser
 
 AUDIO_FILE_NAME: str = "_user_audio_file.mp3"
 
@@ -17,23 +16,15 @@ AUDIO_FILE_NAME: str = "_user_audio_file.mp3"
 class TranscribeAudioUseCase(UseCase):
     def __init__(
         self,
-        user_repository: UserRepository,
         transcription_service: TranscriptionService,
     ) -> None:
-        self.user_repository = user_repository
         self.transcription_service = transcription_service
 
     async def execute(
         self,
-        current_user: str,
+        current_user: CurrentUser,
         file: UploadFile,
     ) -> AudioTranscriptionResponse:
-        user = self.user_repository.find_by_email(current_user)
-
-        if user is None:
-            msg = "User not found"
-            raise UserNotFoundError(msg)
-
         session_id = TranscribeAudioUseCase.generate_session_id()
 
         try:
@@ -41,7 +32,7 @@ class TranscribeAudioUseCase(UseCase):
             transcription = await self.transcription_service.transcribe_audio(
                 buffer,
                 session_id,
-                current_user,
+                current_user.email_address,
             )
 
             return AudioTranscriptionResponse(
@@ -4,6 +4,11 @@ import os
 class Config:
     DATABASE_URL: str | None = os.environ.get("ALLOCATE_DATABASE")
 
+    REDIS_URL: str | None = os.environ.get("ALLOCATE_REDIS_URL")
+    CALENDAR_CACHE_TTL_SECONDS: int = int(
+        os.environ.get("ALLOCATE_CALENDAR_CACHE_TTL_SECONDS", "300"),
+    )
+
     PLUNK_API_KEY: str | None = os.environ.get("ALLOCATE_PLUNK_API_KEY")
 
     LANGFUSE_PUBLIC_KEY: str | None = os.environ.get("LANGFUSE_PUBLIC_KEY")
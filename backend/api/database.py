@@ -1,5 +1,8 @@
-from sqlalchemy import create_engine
+import sqlite3
+
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import ConnectionPoolEntry
 
 from api.config import config
 
@@ -7,7 +10,23 @@ database_url = config.DATABASE_URL
 
 if database_url:
     engine = create_engine(database_url)
-    SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    if engine.dialect.name == "sqlite":
+        # Event deletes rely on ON DELETE CASCADE for their exdates and
+        # occurrences, which SQLite only enforces when asked per connection.
+        @event.listens_for(engine, "connect")
+        def enable_foreign_keys(
+            dbapi_connection: sqlite3.Connection,
+            _: ConnectionPoolEntry,
+        ) -> None:
+            dbapi_connection.execute("PRAGMA foreign_keys=ON")
+
+    SessionLocal = sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+        bind=engine,
+    )
 
 
 def get_db():
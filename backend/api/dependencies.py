@@ -8,18 +8,35 @@ from sqlalchemy.orm import Session
 
 from api.config import config
 from api.database import get_db
+from api.events.caches.calendar_cache import CalendarCache, calendar_cache
+from api.events.caches.recurrence_cache import RecurrenceCache, recurrence_cache
+from api.events.metrics.recurrence_metrics import (
+    RecurrenceMetrics,
+    recurrence_metrics,
+)
+from api.events.repositories.event_change_repository import EventChangeRepository
+from api.events.repositories.event_occurrence_repository import (
+    EventOccurrenceRepository,
+)
 from api.events.repositories.event_repository import EventRepository
 from api.integrations.repositories.integration_repository import (
     IntegrationRepository,
 )
+from api.system.interfaces.units_of_work import UnitOfWork
+from api.system.schemas.user import CurrentUser
+from api.system.units_of_work.session_unit_of_work import SessionUnitOfWork
 from api.users.errors.invalid_token_error import InvalidTokenError
 from api.users.errors.missing_token_error import MissingTokenError
-from api.users.errors.refresh_token_error import RefreshTokenError
 from api.users.repositories.user_repository import UserRepository
+from api.users.utils.token_utils import current_user_from_claims
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/users/login", scheme_name="JWT")
 
 
+def get_unit_of_work(db: Annotated[Session, Depends(get_db)]) -> UnitOfWork:
+    return SessionUnitOfWork(db)
+
+
 def get_user_repository(db: Annotated[Session, Depends(get_db)]) -> UserRepository:
     return UserRepository(db)
 
@@ -28,13 +45,37 @@ def get_event_repository(db: Annotated[Session, Depends(get_db)]) -> EventReposi
     return EventRepository(db)
 
 
+def get_event_occurrence_repository(
+    db: Annotated[Session, Depends(get_db)],
+) -> EventOccurrenceRepository:
+    return EventOccurrenceRepository(db)
+
+
+def get_event_change_repository(
+    db: Annotated[Session, Depends(get_db)],
+) -> EventChangeRepository:
+    return EventChangeRepository(db)
+
+
 def get_integration_repository(
     db: Annotated[Session, Depends(get_db)],
 ) -> IntegrationRepository:
     return IntegrationRepository(db)
 
 
-def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]) -> str:
+def get_recurrence_cache() -> RecurrenceCache:
+    return recurrence_cache
+
+
+def get_calendar_cache() -> CalendarCache:
+    return calendar_cache
+
+
+def get_recurrence_metrics() -> RecurrenceMetrics:
+    return recurrence_metrics
+
+
+def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]) -> CurrentUser:
     if not token:
         raise MissingTokenError
 
@@ -50,10 +91,9 @@ def get_current_user(token: Annotated[str, Depends(oauth2_scheme)]) -> str:
     except PyJWTError as err:
         raise InvalidTokenError from err
     else:
-        subject = payload.get("sub")
+        current_user = current_user_from_claims(payload)
 
-        if not isinstance(subject, str) or not subject:
-            msg = "Invalid refresh token"
-            raise RefreshTokenError(msg)
+        if current_user is None:
+            raise InvalidTokenError
 
-        return subject
+        return current_user
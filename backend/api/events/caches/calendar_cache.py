@@ -0,0 +1,45 @@
+from datetime import date
+
+from api.config import config
+from api.system.caches.in_memory_cache_backend import InMemoryCacheBackend
+from api.system.caches.redis_cache_backend import RedisCacheBackend
+from api.system.interfaces.cache_backends import CacheBackend
+
+KEY_PREFIX: str = "allocate:calendar"
+
+
+class CalendarCache:
+    def __init__(self, backend: CacheBackend, ttl_seconds: int) -> None:
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+
+    def key(
+        self,
+        user_id: int,
+        calendar_version: int,
+        start_date: date,
+        end_date: date,
+    ) -> str:
+        return (
+            f"{KEY_PREFIX}:{user_id}:{calendar_version}:"
+            f"{start_date:%Y%m%d}:{end_date:%Y%m%d}"
+        )
+
+    def get(self, key: str) -> bytes | None:
+        return self.backend.get(key)
+
+    def set(self, key: str, content: bytes) -> None:
+        self.backend.set(key, content, self.ttl_seconds)
+
+
+def build_calendar_cache() -> CalendarCache:
+    backend: CacheBackend = (
+        RedisCacheBackend(config.REDIS_URL)
+        if config.REDIS_URL
+        else InMemoryCacheBackend()
+    )
+
+    return CalendarCache(backend, config.CALENDAR_CACHE_TTL_SECONDS)
+
+
+calendar_cache = build_calendar_cache()
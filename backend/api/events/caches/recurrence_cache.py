@@ -0,0 +1,87 @@
+import threading
+from collections import OrderedDict
+from datetime import date
+
+MAX_ENTRIES: int = 4096
+
+CacheKey = tuple[int, str, tuple[date, ...], date, date]
+
+
+class RecurrenceCache:
+    def __init__(self, max_entries: int = MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+
+        self._entries: OrderedDict[CacheKey, tuple[date, ...]] = OrderedDict()
+        self._keys_by_event: dict[int, set[CacheKey]] = {}
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @staticmethod
+    def key(
+        event_id: int,
+        rrule: str,
+        exdates: tuple[date, ...],
+        start_date: date,
+        end_date: date,
+    ) -> CacheKey:
+        return (event_id, rrule, exdates, start_date, end_date)
+
+    def get(self, key: CacheKey) -> tuple[date, ...] | None:
+        with self._lock:
+            occurrences = self._entries.get(key)
+
+            if occurrences is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.hits += 1
+
+            return occurrences
+
+    def set(self, key: CacheKey, occurrences: tuple[date, ...]) -> None:
+        with self._lock:
+            self._entries[key] = occurrences
+            self._entries.move_to_end(key)
+            self._keys_by_event.setdefault(key[0], set()).add(key)
+
+            while len(self._entries) > self.max_entries:
+                evicted_key, _ = self._entries.popitem(last=False)
+                self._discard_key(evicted_key)
+                self.evictions += 1
+
+    def invalidate(self, event_id: int) -> None:
+        with self._lock:
+            for key in self._keys_by_event.pop(event_id, set()):
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_event.clear()
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+    def _discard_key(self, key: CacheKey) -> None:
+        event_keys = self._keys_by_event.get(key[0])
+
+        if event_keys is None:
+            return
+
+        event_keys.discard(key)
+
+        if not event_keys:
+            del self._keys_by_event[key[0]]
+
+
+recurrence_cache = RecurrenceCache()
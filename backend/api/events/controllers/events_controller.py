@@ -1,46 +1,164 @@
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, File, UploadFile
+from fastapi import APIRouter, Depends, File, Header, UploadFile
+from fastapi.responses import Response
 
 from api.dependencies import get_current_user
 from api.events.dependencies import (
+    create_event_batch_use_case,
     create_event_use_case,
+    delete_event_batch_use_case,
     delete_event_use_case,
+    detect_conflicts_use_case,
+    edit_event_batch_use_case,
     edit_event_use_case,
+    get_event_page_use_case,
     get_events_for_user_use_case,
+    get_free_busy_use_case,
     import_events_use_case,
+    sync_events_use_case,
 )
+from api.events.use_cases.create_event_batch_use_case import CreateEventBatchUseCase
 from api.events.use_cases.create_event_use_case import CreateEventUseCase
+from api.events.use_cases.delete_event_batch_use_case import DeleteEventBatchUseCase
 from api.events.use_cases.delete_event_use_case import DeleteEventUseCase
+from api.events.use_cases.detect_conflicts_use_case import DetectConflictsUseCase
+from api.events.use_cases.edit_event_batch_use_case import EditEventBatchUseCase
 from api.events.use_cases.edit_event_use_case import EditEventUseCase
+from api.events.use_cases.get_event_page_use_case import GetEventPageUseCase
 from api.events.use_cases.get_events_for_user_use_case import GetEventsForUserUseCase
+from api.events.use_cases.get_free_busy_use_case import GetFreeBusyUseCase
 from api.events.use_cases.import_events_use_case import ImportEventsUseCase
+from api.events.use_cases.sync_events_use_case import SyncEventsUseCase
 from api.system.schemas import event
+from api.system.schemas.user import CurrentUser
 
 events = APIRouter()
 
 
-@events.post("/api/v1/events", response_model=event.Event)
+@events.post("/api/v1/events", response_model=event.EventWithConflicts)
 def create_event(
     request: event.EventBase,
     create_event_use_case: Annotated[
         CreateEventUseCase,
         Depends(create_event_use_case),
     ],
-    current_user: Annotated[str, Depends(get_current_user)],
+    detect_conflicts_use_case: Annotated[
+        DetectConflictsUseCase,
+        Depends(detect_conflicts_use_case),
+    ],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    options: Annotated[event.ConflictCheck, Depends()],
+):
+    return create_event_use_case.execute(
+        request,
+        current_user,
+        detect_conflicts_use_case if options.check_conflicts else None,
+    )
+
+
+@events.post("/api/v1/events/batch", response_model=event.EventBatchResult)
+def create_event_batch(
+    request: event.EventBatch,
+    create_event_batch_use_case: Annotated[
+        CreateEventBatchUseCase,
+        Depends(create_event_batch_use_case),
+    ],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+):
+    return create_event_batch_use_case.execute(request, current_user)
+
+
+@events.put("/api/v1/events/batch", response_model=event.EventBatchResult)
+def edit_event_batch(
+    request: event.EventBatchEdit,
+    edit_event_batch_use_case: Annotated[
+        EditEventBatchUseCase,
+        Depends(edit_event_batch_use_case),
+    ],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
 ):
-    return create_event_use_case.execute(request, current_user)
+    return edit_event_batch_use_case.execute(request, current_user)
+
+
+@events.delete("/api/v1/events/batch", response_model=None)
+def delete_event_batch(
+    request: event.EventBatchDelete,
+    delete_event_batch_use_case: Annotated[
+        DeleteEventBatchUseCase,
+        Depends(delete_event_batch_use_case),
+    ],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+):
+    delete_event_batch_use_case.execute(request, current_user)
+    return {"Message": "Events deleted successfully"}
 
 
 @events.get("/api/v1/events", response_model=event.EventList)
 def get_events(
+    window: Annotated[event.GetEvent, Depends()],
     get_events_for_user_use_case: Annotated[
         GetEventsForUserUseCase,
         Depends(get_events_for_user_use_case),
     ],
-    current_user: Annotated[str, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    if_none_match: Annotated[str | None, Header()] = None,
+):
+    payload = get_events_for_user_use_case.execute(
+        current_user,
+        window.start_date,
+        window.end_date,
+        if_none_match,
+    )
+    headers = {"ETag": payload.etag, "Cache-Control": "private, no-cache"}
+
+    if payload.content is None:
+        return Response(status_code=304, headers=headers)
+
+    return Response(
+        content=payload.content,
+        media_type="application/json",
+        headers=headers,
+    )
+
+
+@events.get("/api/v1/events/page", response_model=event.EventPage)
+def get_event_page(
+    request: Annotated[event.GetEventPage, Depends()],
+    get_event_page_use_case: Annotated[
+        GetEventPageUseCase,
+        Depends(get_event_page_use_case),
+    ],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+):
+    return Response(
+        content=get_event_page_use_case.execute(current_user, request),
+        media_type="application/json",
+    )
+
+
+@events.get("/api/v1/events/freebusy", response_model=event.FreeBusy)
+def get_free_busy(
+    request: Annotated[event.GetFreeBusy, Depends()],
+    get_free_busy_use_case: Annotated[
+        GetFreeBusyUseCase,
+        Depends(get_free_busy_use_case),
+    ],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
 ):
-    return get_events_for_user_use_case.execute(current_user)
+    return get_free_busy_use_case.execute(current_user, request)
+
+
+@events.get("/api/v1/events/sync", response_model=event.EventSync)
+def sync_events(
+    sync: Annotated[event.SyncEvents, Depends()],
+    sync_events_use_case: Annotated[
+        SyncEventsUseCase,
+        Depends(sync_events_use_case),
+    ],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+):
+    return sync_events_use_case.execute(current_user, sync.sync_token)
 
 
 @events.delete("/api/v1/events/{event_id}", response_model=None)
@@ -50,20 +168,30 @@ def delete_event(
         DeleteEventUseCase,
         Depends(delete_event_use_case),
     ],
-    current_user: Annotated[str, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
 ):
     delete_event_use_case.execute(event, current_user)
     return {"Message": "Event deleted successfully"}
 
 
-@events.put("/api/v1/events/{event_id}", response_model=event.Event)
-def edit_event(
+@events.put("/api/v1/events/{event_id}", response_model=event.EventWithConflicts)
+def edit_event(  # noqa: PLR0913
     event_id: int,
     request: event.EditEvent,
     edit_event_use_case: Annotated[EditEventUseCase, Depends(edit_event_use_case)],
-    current_user: Annotated[str, Depends(get_current_user)],
+    detect_conflicts_use_case: Annotated[
+        DetectConflictsUseCase,
+        Depends(detect_conflicts_use_case),
+    ],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
+    options: Annotated[event.ConflictCheck, Depends()],
 ):
-    return edit_event_use_case.execute(event_id, request, current_user)
+    return edit_event_use_case.execute(
+        event_id,
+        request,
+        current_user,
+        detect_conflicts_use_case if options.check_conflicts else None,
+    )
 
 
 @events.post("/api/v1/events/import", response_model=event.ImportReport)
@@ -77,6 +205,6 @@ def import_events(
         CreateEventUseCase,
         Depends(create_event_use_case),
     ],
-    current_user: Annotated[str, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
 ):
     return import_events_use_case.execute(current_user, file, create_event_use_case)
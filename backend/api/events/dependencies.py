@@ -3,48 +3,203 @@ from typing import Annotated
 from fastapi import Depends
 
 from api.dependencies import (
+    CalendarCache,
+    EventChangeRepository,
+    EventOccurrenceRepository,
     EventRepository,
+    RecurrenceCache,
+    RecurrenceMetrics,
+    UnitOfWork,
     UserRepository,
+    get_calendar_cache,
+    get_event_change_repository,
+    get_event_occurrence_repository,
     get_event_repository,
+    get_recurrence_cache,
+    get_recurrence_metrics,
+    get_unit_of_work,
     get_user_repository,
 )
+from api.events.services.occurrence_service import OccurrenceService
+from api.events.use_cases.create_event_batch_use_case import CreateEventBatchUseCase
 from api.events.use_cases.create_event_use_case import CreateEventUseCase
+from api.events.use_cases.delete_event_batch_use_case import DeleteEventBatchUseCase
 from api.events.use_cases.delete_event_use_case import DeleteEventUseCase
+from api.events.use_cases.detect_conflicts_use_case import DetectConflictsUseCase
+from api.events.use_cases.edit_event_batch_use_case import EditEventBatchUseCase
 from api.events.use_cases.edit_event_use_case import EditEventUseCase
+from api.events.use_cases.get_event_page_use_case import GetEventPageUseCase
 from api.events.use_cases.get_events_for_user_use_case import GetEventsForUserUseCase
+from api.events.use_cases.get_free_busy_use_case import GetFreeBusyUseCase
 from api.events.use_cases.import_events_use_case import ImportEventsUseCase
+from api.events.use_cases.sync_events_use_case import SyncEventsUseCase
 
 
-def create_event_use_case(
+def occurrence_service(
+    event_occurrence_repository: Annotated[
+        EventOccurrenceRepository,
+        Depends(get_event_occurrence_repository),
+    ],
+) -> OccurrenceService:
+    return OccurrenceService(event_occurrence_repository)
+
+
+def create_event_use_case(  # noqa: PLR0913
     event_repository: Annotated[EventRepository, Depends(get_event_repository)],
     user_repository: Annotated[UserRepository, Depends(get_user_repository)],
+    recurrence_cache: Annotated[RecurrenceCache, Depends(get_recurrence_cache)],
+    occurrence_service: Annotated[OccurrenceService, Depends(occurrence_service)],
+    unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
+    recurrence_metrics: Annotated[RecurrenceMetrics, Depends(get_recurrence_metrics)],
 ) -> CreateEventUseCase:
-    return CreateEventUseCase(event_repository, user_repository)
+    return CreateEventUseCase(
+        event_repository,
+        user_repository,
+        recurrence_cache,
+        occurrence_service,
+        unit_of_work,
+        recurrence_metrics,
+    )
+
+
+def create_event_batch_use_case(  # noqa: PLR0913
+    event_repository: Annotated[EventRepository, Depends(get_event_repository)],
+    user_repository: Annotated[UserRepository, Depends(get_user_repository)],
+    recurrence_cache: Annotated[RecurrenceCache, Depends(get_recurrence_cache)],
+    occurrence_service: Annotated[OccurrenceService, Depends(occurrence_service)],
+    unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
+    recurrence_metrics: Annotated[RecurrenceMetrics, Depends(get_recurrence_metrics)],
+) -> CreateEventBatchUseCase:
+    return CreateEventBatchUseCase(
+        event_repository,
+        user_repository,
+        recurrence_cache,
+        occurrence_service,
+        unit_of_work,
+        recurrence_metrics,
+    )
 
 
-def get_events_for_user_use_case(
+def get_events_for_user_use_case(  # noqa: PLR0913
     event_repository: Annotated[EventRepository, Depends(get_event_repository)],
     user_repository: Annotated[UserRepository, Depends(get_user_repository)],
+    recurrence_cache: Annotated[RecurrenceCache, Depends(get_recurrence_cache)],
+    calendar_cache: Annotated[CalendarCache, Depends(get_calendar_cache)],
+    event_occurrence_repository: Annotated[
+        EventOccurrenceRepository,
+        Depends(get_event_occurrence_repository),
+    ],
+    recurrence_metrics: Annotated[RecurrenceMetrics, Depends(get_recurrence_metrics)],
 ) -> GetEventsForUserUseCase:
-    return GetEventsForUserUseCase(event_repository, user_repository)
+    return GetEventsForUserUseCase(
+        event_repository,
+        user_repository,
+        recurrence_cache,
+        calendar_cache,
+        event_occurrence_repository,
+        recurrence_metrics,
+    )
+
+
+def get_event_page_use_case(
+    get_events_for_user_use_case: Annotated[
+        GetEventsForUserUseCase,
+        Depends(get_events_for_user_use_case),
+    ],
+) -> GetEventPageUseCase:
+    return GetEventPageUseCase(get_events_for_user_use_case)
+
+
+def get_free_busy_use_case(
+    get_events_for_user_use_case: Annotated[
+        GetEventsForUserUseCase,
+        Depends(get_events_for_user_use_case),
+    ],
+) -> GetFreeBusyUseCase:
+    return GetFreeBusyUseCase(get_events_for_user_use_case)
+
+
+def detect_conflicts_use_case(
+    get_events_for_user_use_case: Annotated[
+        GetEventsForUserUseCase,
+        Depends(get_events_for_user_use_case),
+    ],
+) -> DetectConflictsUseCase:
+    return DetectConflictsUseCase(get_events_for_user_use_case)
+
+
+def sync_events_use_case(
+    event_repository: Annotated[EventRepository, Depends(get_event_repository)],
+    event_change_repository: Annotated[
+        EventChangeRepository,
+        Depends(get_event_change_repository),
+    ],
+) -> SyncEventsUseCase:
+    return SyncEventsUseCase(event_repository, event_change_repository)
 
 
 def delete_event_use_case(
     event_repository: Annotated[EventRepository, Depends(get_event_repository)],
     user_repository: Annotated[UserRepository, Depends(get_user_repository)],
+    recurrence_cache: Annotated[RecurrenceCache, Depends(get_recurrence_cache)],
+    unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
 ) -> DeleteEventUseCase:
-    return DeleteEventUseCase(event_repository, user_repository)
+    return DeleteEventUseCase(
+        event_repository,
+        user_repository,
+        recurrence_cache,
+        unit_of_work,
+    )
 
 
 def edit_event_use_case(
     event_repository: Annotated[EventRepository, Depends(get_event_repository)],
     user_repository: Annotated[UserRepository, Depends(get_user_repository)],
+    recurrence_cache: Annotated[RecurrenceCache, Depends(get_recurrence_cache)],
+    occurrence_service: Annotated[OccurrenceService, Depends(occurrence_service)],
+    unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
 ) -> EditEventUseCase:
-    return EditEventUseCase(event_repository, user_repository)
+    return EditEventUseCase(
+        event_repository,
+        user_repository,
+        recurrence_cache,
+        occurrence_service,
+        unit_of_work,
+    )
 
 
-def import_events_use_case(
+def delete_event_batch_use_case(
+    event_repository: Annotated[EventRepository, Depends(get_event_repository)],
+    user_repository: Annotated[UserRepository, Depends(get_user_repository)],
+    recurrence_cache: Annotated[RecurrenceCache, Depends(get_recurrence_cache)],
+    unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
+) -> DeleteEventBatchUseCase:
+    return DeleteEventBatchUseCase(
+        event_repository,
+        user_repository,
+        recurrence_cache,
+        unit_of_work,
+    )
+
+
+def edit_event_batch_use_case(
     event_repository: Annotated[EventRepository, Depends(get_event_repository)],
     user_repository: Annotated[UserRepository, Depends(get_user_repository)],
+    recurrence_cache: Annotated[RecurrenceCache, Depends(get_recurrence_cache)],
+    occurrence_service: Annotated[OccurrenceService, Depends(occurrence_service)],
+    unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
+) -> EditEventBatchUseCase:
+    return EditEventBatchUseCase(
+        event_repository,
+        user_repository,
+        recurrence_cache,
+        occurrence_service,
+        unit_of_work,
+    )
+
+
+def import_events_use_case(
+    event_repository: Annotated[EventRepository, Depends(get_event_repository)],
+    recurrence_metrics: Annotated[RecurrenceMetrics, Depends(get_recurrence_metrics)],
 ) -> ImportEventsUseCase:
-    return ImportEventsUseCase(event_repository, user_repository)
+    return ImportEventsUseCase(event_repository, recurrence_metrics)
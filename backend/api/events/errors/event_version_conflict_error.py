@@ -0,0 +1,3 @@
+class EventVersionConflictError(Exception):
+    def __init__(self, message: str) -> None:
+        self.message = message
@@ -0,0 +1,3 @@
+class InvalidEventWindowError(Exception):
+    def __init__(self, message: str) -> None:
+        self.message = message
@@ -0,0 +1,3 @@
+class InvalidRecurrenceRuleError(Exception):
+    def __init__(self, message: str) -> None:
+        self.message = message
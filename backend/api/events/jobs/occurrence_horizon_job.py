@@ -0,0 +1,59 @@
+import asyncio
+import logging
+
+from api.database import SessionLocal
+from api.events.caches.recurrence_cache import recurrence_cache
+from api.events.metrics.recurrence_metrics import recurrence_metrics
+from api.events.repositories.event_occurrence_repository import (
+    EventOccurrenceRepository,
+)
+from api.events.services.occurrence_service import OccurrenceService
+from api.events.use_cases.extend_occurrence_horizon_use_case import (
+    ExtendOccurrenceHorizonUseCase,
+)
+from api.system.units_of_work.session_unit_of_work import SessionUnitOfWork
+
+JOB_INTERVAL_SECONDS: int = 60 * 60 * 6
+
+logger = logging.getLogger(__name__)
+
+
+def extend_occurrence_horizon() -> int:
+    db = SessionLocal()
+    try:
+        event_occurrence_repository = EventOccurrenceRepository(db)
+        occurrence_service = OccurrenceService(event_occurrence_repository)
+
+        return ExtendOccurrenceHorizonUseCase(
+            event_occurrence_repository,
+            occurrence_service,
+            SessionUnitOfWork(db),
+        ).execute()
+    finally:
+        db.close()
+
+
+def log_recurrence_stats() -> None:
+    logger.info(
+        "Recurrence cache: %(entries)s entries, %(hits)s hits, "
+        "%(misses)s misses, %(evictions)s evictions",
+        recurrence_cache.stats(),
+    )
+    logger.info(
+        "Recurrence guards: %(rejected)s rules rejected, "
+        "%(truncated)s expansions truncated",
+        recurrence_metrics.stats(),
+    )
+
+
+async def run_occurrence_horizon_job() -> None:
+    while True:
+        try:
+            extended_count = await asyncio.to_thread(extend_occurrence_horizon)
+            logger.info("Extended occurrence horizon for %s events", extended_count)
+        except Exception:
+            logger.exception("Occurrence horizon job failed")
+
+        log_recurrence_stats()
+
+        await asyncio.sleep(JOB_INTERVAL_SECONDS)
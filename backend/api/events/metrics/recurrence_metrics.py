@@ -0,0 +1,34 @@
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class RecurrenceMetrics:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+
+        self.rejected = 0
+        self.truncated = 0
+
+    def record_rejected(self, rrule: str) -> None:
+        with self._lock:
+            self.rejected += 1
+
+        logger.warning("Rejected recurrence rule %r", rrule)
+
+    def record_truncated(self, user_id: int) -> None:
+        with self._lock:
+            self.truncated += 1
+
+        logger.warning("Truncated recurrence expansion for user %s", user_id)
+
+    def stats(self) -> dict[str, int]:
+        with self._lock:
+            return {
+                "rejected": self.rejected,
+                "truncated": self.truncated,
+            }
+
+
+recurrence_metrics = RecurrenceMetrics()
@@ -0,0 +1,42 @@
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+
+from api.system.interfaces.repositories import Repository
+from api.system.models.models import EventChange
+
+
+class EventChangeRepository(Repository):
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def add(self, entity: EventChange) -> None:
+        self.db.add(entity)
+        self.db.flush()
+
+    def find_by_id(self, entity_id: int) -> EventChange | None:
+        return self.db.query(EventChange).filter_by(id=entity_id).first()
+
+    def get_changes(
+        self,
+        user_id: int,
+        after_id: int,
+        limit: int,
+    ) -> list[EventChange]:
+        return (
+            self.db.query(EventChange)
+            .filter(EventChange.user_id == user_id, EventChange.id > after_id)
+            .order_by(EventChange.id)
+            .limit(limit)
+            .all()
+        )
+
+    def get_latest_id(self, user_id: int) -> int:
+        return (
+            self.db.query(func.max(EventChange.id))
+            .filter(EventChange.user_id == user_id)
+            .scalar()
+        ) or 0
+
+    def delete(self, entity: EventChange) -> None:
+        self.db.delete(entity)
+        self.db.flush()
@@ -0,0 +1,303 @@
+from datetime import date, datetime, time, timedelta
+
+from sqlalchemy import (
+    Row,
+    and_,
+    func,
+    insert,
+    literal_column,
+    or_,
+    select,
+    tuple_,
+)
+from sqlalchemy.orm import Query, Session
+
+from api.events.utils.interval_utils import occurrence_interval
+from api.system.interfaces.repositories import Repository
+from api.system.models.models import Event, EventOccurrence
+
+TIME_RANGE = literal_column("event_occurrences.time_range")
+
+
+class EventOccurrenceRepository(Repository):
+    def __init__(self, db: Session) -> None:
+        self.db = db
+
+    def add(self, entity: EventOccurrence) -> None:
+        self.db.add(entity)
+        self.db.flush()
+
+    def find_by_id(self, entity_id: int) -> EventOccurrence | None:
+        return self.db.query(EventOccurrence).filter_by(id=entity_id).first()
+
+    def get_occurrences(
+        self,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+    ) -> list[Row]:
+        return self._occurrences_query(user_id, start_date, end_date).all()
+
+    def get_occurrence_page(
+        self,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+        after: tuple[date, time, int] | None,
+        limit: int,
+    ) -> list[Row]:
+        query = self._occurrences_query(user_id, start_date, end_date)
+
+        if after is not None:
+            query = query.filter(
+                tuple_(
+                    EventOccurrence.occurrence_date,
+                    EventOccurrence.start_time,
+                    EventOccurrence.event_id,
+                )
+                > tuple_(*after),
+            )
+
+        return (
+            query.order_by(
+                EventOccurrence.occurrence_date,
+                EventOccurrence.start_time,
+                EventOccurrence.event_id,
+            )
+            .limit(limit)
+            .all()
+        )
+
+    def get_occurrence_times(
+        self,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+    ) -> list[Row]:
+        return (
+            self.db.query(
+                EventOccurrence.occurrence_date,
+                EventOccurrence.start_time,
+                EventOccurrence.end_time,
+                EventOccurrence.event_id,
+            )
+            .filter(
+                EventOccurrence.user_id == user_id,
+                EventOccurrence.occurrence_date >= start_date,
+                EventOccurrence.occurrence_date <= end_date,
+            )
+            .order_by(EventOccurrence.occurrence_date, EventOccurrence.start_time)
+            .all()
+        )
+
+    def find_overlapping(
+        self,
+        user_id: int,
+        start: datetime,
+        end: datetime,
+    ) -> list[int]:
+        if self._has_time_range():
+            return self._find_by_time_range(user_id, start, end, "&&")
+
+        return sorted(
+            {
+                event_id
+                for event_id, occurrence_start, occurrence_end in self._find_near(
+                    user_id,
+                    start,
+                    end,
+                )
+                if occurrence_start < end and occurrence_end > start
+            },
+        )
+
+    def find_contained(
+        self,
+        user_id: int,
+        start: datetime,
+        end: datetime,
+    ) -> list[int]:
+        if self._has_time_range():
+            return self._find_by_time_range(user_id, start, end, "<@")
+
+        return sorted(
+            {
+                event_id
+                for event_id, occurrence_start, occurrence_end in self._find_near(
+                    user_id,
+                    start,
+                    end,
+                )
+                if occurrence_start >= start and occurrence_end <= end
+            },
+        )
+
+    def has_pending_series(
+        self,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+    ) -> bool:
+        return self.db.query(
+            self.db.query(Event.id)
+            .filter(
+                Event.user_id == user_id,
+                Event.date <= end_date,
+                or_(Event.series_end >= start_date, Event.series_end.is_(None)),
+                or_(
+                    Event.occurrences_until.is_(None),
+                    and_(
+                        Event.rrule.is_not(None),
+                        Event.rrule != "DNR",
+                        Event.occurrences_until < end_date,
+                        or_(
+                            Event.series_end.is_(None),
+                            Event.series_end > Event.occurrences_until,
+                        ),
+                    ),
+                ),
+            )
+            .exists(),
+        ).scalar()
+
+    def get_events_to_extend(self, horizon: date, limit: int) -> list[Event]:
+        # Lock the batch so a request cannot replace an event's occurrences
+        # while the job extends them, and skip events a request holds.
+        return (
+            self.db.query(Event)
+            .filter(
+                or_(
+                    Event.occurrences_until.is_(None),
+                    and_(
+                        Event.rrule.is_not(None),
+                        Event.rrule != "DNR",
+                        Event.occurrences_until < horizon,
+                        or_(
+                            Event.series_end.is_(None),
+                            Event.series_end > Event.occurrences_until,
+                        ),
+                    ),
+                ),
+            )
+            .order_by(Event.id)
+            .limit(limit)
+            .with_for_update(skip_locked=True)
+            .all()
+        )
+
+    def replace_for_event(
+        self,
+        event: Event,
+        occurrence_dates: list[date],
+        occurrences_until: date,
+    ) -> None:
+        self.db.query(EventOccurrence).filter_by(event_id=event.id).delete()
+        self._insert_occurrences(event, occurrence_dates)
+        event.occurrences_until = occurrences_until  # type: ignore  # noqa: PGH003
+
+        self.db.flush()
+
+    def extend_for_event(
+        self,
+        event: Event,
+        occurrence_dates: list[date],
+        occurrences_until: date,
+    ) -> None:
+        self._insert_occurrences(event, occurrence_dates)
+        event.occurrences_until = occurrences_until  # type: ignore  # noqa: PGH003
+
+        self.db.flush()
+
+    def delete(self, entity: EventOccurrence) -> None:
+        self.db.delete(entity)
+        self.db.flush()
+
+    def _occurrences_query(
+        self,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+    ) -> Query:
+        return (
+            self.db.query(
+                Event.id,
+                Event.title,
+                Event.description,
+                Event.location,
+                EventOccurrence.occurrence_date,
+                EventOccurrence.start_time,
+                EventOccurrence.end_time,
+                Event.colour,
+                Event.rrule,
+                Event.date,
+                Event.version,
+            )
+            .join(Event, EventOccurrence.event_id == Event.id)
+            .filter(
+                EventOccurrence.user_id == user_id,
+                EventOccurrence.occurrence_date >= start_date,
+                EventOccurrence.occurrence_date <= end_date,
+            )
+        )
+
+    def _has_time_range(self) -> bool:
+        return self.db.get_bind().dialect.name == "postgresql"
+
+    def _find_by_time_range(
+        self,
+        user_id: int,
+        start: datetime,
+        end: datetime,
+        operator: str,
+    ) -> list[int]:
+        return list(
+            self.db.scalars(
+                select(EventOccurrence.event_id)
+                .where(
+                    EventOccurrence.user_id == user_id,
+                    TIME_RANGE.op(operator)(func.tsrange(start, end)),
+                )
+                .distinct()
+                .order_by(EventOccurrence.event_id),
+            ),
+        )
+
+    def _find_near(
+        self,
+        user_id: int,
+        start: datetime,
+        end: datetime,
+    ) -> list[tuple[int, datetime, datetime]]:
+        rows = self.db.query(
+            EventOccurrence.event_id,
+            EventOccurrence.occurrence_date,
+            EventOccurrence.start_time,
+            EventOccurrence.end_time,
+        ).filter(
+            EventOccurrence.user_id == user_id,
+            EventOccurrence.occurrence_date >= start.date() - timedelta(days=1),
+            EventOccurrence.occurrence_date <= end.date(),
+        )
+
+        return [
+            (event_id, *occurrence_interval(occurrence_date, start_time, end_time))
+            for event_id, occurrence_date, start_time, end_time in rows
+        ]
+
+    def _insert_occurrences(self, event: Event, occurrence_dates: list[date]) -> None:
+        if not occurrence_dates:
+            return
+
+        self.db.execute(
+            insert(EventOccurrence),
+            [
+                {
+                    "event_id": event.id,
+                    "user_id": event.user_id,
+                    "occurrence_date": occurrence_date,
+                    "start_time": event.start_time,
+                    "end_time": event.end_time,
+                }
+                for occurrence_date in occurrence_dates
+            ],
+        )
@@ -1,10 +1,66 @@
 from datetime import date
+from typing import Any
 
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    and_,
+    case,
+    delete,
+    insert,
+    literal,
+    or_,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.orm import Session
 
 from api.system.interfaces.repositories import Repository
-from api.system.models.models import Event
-from api.system.schemas.event import EventBase
+from api.system.models.models import (
+    EVENT_CHANGE_DELETE,
+    EVENT_CHANGE_EXDATE,
+    EVENT_CHANGE_UPSERT,
+    Event,
+    EventChange,
+    EventExdate,
+    EventOccurrence,
+)
+from api.system.schemas.event import EditEvent
+from api.system.utils.insert_utils import insert_for_dialect
+
+EVENT_COLUMNS: tuple[str, ...] = (
+    "title",
+    "description",
+    "location",
+    "date",
+    "start_time",
+    "end_time",
+    "rrule",
+    "colour",
+    "occurrences_until",
+    "series_end",
+    "user_id",
+)
+
+EDITABLE_COLUMNS: tuple[str, ...] = (
+    "title",
+    "description",
+    "location",
+    "date",
+    "start_time",
+    "end_time",
+    "colour",
+)
+
+IS_RECURRING = and_(Event.rrule.is_not(None), Event.rrule != "DNR")
+
+
+def _overlaps_window(start_date: date, end_date: date) -> ColumnElement[bool]:
+    return and_(
+        Event.date <= end_date,
+        or_(Event.series_end >= start_date, Event.series_end.is_(None)),
+    )
 
 
 class EventRepository(Repository):
@@ -13,46 +69,431 @@ class EventRepository(Repository):
 
     def add(self, entity: Event) -> None:
         self.db.add(entity)
-        self.db.commit()
-        self.db.refresh(entity)
+        self.db.flush()
+        self._record_change(entity, EVENT_CHANGE_UPSERT)
+        self.db.flush()
+
+    def add_many(self, entities: list[Event]) -> list[int]:
+        return self._insert_events(entities)
 
     def find_by_id(self, entity_id: int) -> Event | None:
         return self.db.query(Event).filter_by(id=entity_id).first()
 
-    def get_events(self, user_id: int, start_date: date, end_date: date) -> list[Event]:
+    def find_by_ids(self, entity_ids: list[int]) -> list[Event]:
+        if not entity_ids:
+            return []
+
+        return self.db.query(Event).filter(Event.id.in_(entity_ids)).all()
+
+    def find_by_id_for_user(self, user_id: int, entity_id: int) -> Event | None:
+        return self.db.query(Event).filter_by(id=entity_id, user_id=user_id).first()
+
+    def find_by_ids_for_user(self, user_id: int, entity_ids: list[int]) -> list[Event]:
+        if not entity_ids:
+            return []
+
         return (
             self.db.query(Event)
+            .filter(Event.user_id == user_id, Event.id.in_(entity_ids))
+            .all()
+        )
+
+    def find_by_user_id(self, user_id: int) -> list[Event]:
+        return self.db.query(Event).filter_by(user_id=user_id).all()
+
+    def get_events(self, user_id: int, start_date: date, end_date: date) -> list[Row]:
+        return (
+            self.db.query(
+                Event.id,
+                Event.title,
+                Event.description,
+                Event.location,
+                Event.date,
+                Event.start_time,
+                Event.end_time,
+                Event.colour,
+                Event.rrule,
+                Event.version,
+            )
             .filter(
                 Event.user_id == user_id,
-                Event.date >= start_date,
-                Event.date <= end_date,
+                _overlaps_window(start_date, end_date),
             )
             .all()
         )
 
-    def edit(self, entity: Event, updates: EventBase) -> Event:
-        for key, value in updates:
-            if hasattr(entity, key):
-                setattr(entity, key, value)
+    def get_exdates(self, event_ids: list[int]) -> dict[int, list[date]]:
+        exdates: dict[int, list[date]] = {}
 
-        self.db.commit()
-        self.db.refresh(entity)
+        if not event_ids:
+            return exdates
+
+        rows = (
+            self.db.query(EventExdate.event_id, EventExdate.exdate)
+            .filter(EventExdate.event_id.in_(event_ids))
+            .all()
+        )
+
+        for event_id, exdate in rows:
+            exdates.setdefault(event_id, []).append(exdate)
+
+        return exdates
+
+    def edit_for_user(
+        self,
+        user_id: int,
+        entity_id: int,
+        request: EditEvent,
+    ) -> Event | None:
+        updates = {
+            column: getattr(request, column)
+            for column in EDITABLE_COLUMNS
+            if getattr(request, column)
+        }
+
+        statement = update(Event).where(
+            Event.id == entity_id,
+            Event.user_id == user_id,
+            ~IS_RECURRING,
+        )
+
+        if request.version is not None:
+            statement = statement.where(Event.version == request.version)
+
+        entity = self.db.scalars(
+            statement.values(
+                **updates,
+                rrule=None,
+                series_end=updates.get("date", Event.date),
+                version=Event.version + 1,
+            ).returning(Event),
+        ).first()
+
+        if entity is not None:
+            self._record_changes(user_id, [(entity_id, EVENT_CHANGE_UPSERT, None)])
 
         return entity
 
-    def add_exdate(self, entity: Event, exdate_entry: str) -> Event:
-        if entity.exdate is not None:
-            existing = set(entity.exdate.split(","))
-            if exdate_entry not in existing:
-                entity.exdate = f"{entity.exdate},{exdate_entry}"  # type: ignore  # noqa: PGH003
-        else:
-            entity.exdate = exdate_entry  # type: ignore  # noqa: PGH003
+    def bump_series_versions(self, user_id: int, versions: dict[int, int]) -> bool:
+        if not versions:
+            return True
+
+        bumped = self.db.execute(
+            update(Event.__table__)
+            .where(
+                Event.user_id == user_id,
+                IS_RECURRING,
+                tuple_(Event.id, Event.version).in_(versions.items()),
+            )
+            .values(version=Event.version + 1)
+            .returning(Event.id),
+        ).all()
+
+        return len(bumped) == len(versions)
+
+    def add_exdate(self, entity: Event, exdate: date) -> Event:
+        self.db.execute(
+            insert_for_dialect(self.db, EventExdate)
+            .values(event_id=entity.id, exdate=exdate)
+            .on_conflict_do_nothing(),
+        )
+
+        self.db.query(EventOccurrence).filter_by(
+            event_id=entity.id,
+            occurrence_date=exdate,
+        ).delete()
 
-        self.db.commit()
-        self.db.refresh(entity)
+        self._record_change(entity, EVENT_CHANGE_EXDATE, exdate)
+        self.db.flush()
 
         return entity
 
+    def update_many(
+        self,
+        user_id: int,
+        updates: dict[int, dict[str, Any]],
+        versions: dict[int, int],
+    ) -> bool:
+        if not updates:
+            return True
+
+        columns = next(iter(updates.values())).keys()
+        table = Event.__table__
+
+        # One UPDATE with a CASE per column rather than an executemany, so
+        # RETURNING can confirm every row matched its expected version.
+        updated = self.db.scalars(
+            update(table)
+            .where(
+                Event.user_id == user_id,
+                tuple_(Event.id, Event.version).in_(
+                    [(entity_id, versions[entity_id]) for entity_id in updates],
+                ),
+            )
+            .values(
+                {
+                    column: case(
+                        {
+                            entity_id: values[column]
+                            for entity_id, values in updates.items()
+                        },
+                        value=Event.id,
+                        else_=table.c[column],
+                    )
+                    for column in columns
+                }
+                | {"version": Event.version + 1},
+            )
+            .returning(Event.id),
+        ).all()
+
+        if len(updated) != len(updates):
+            return False
+
+        self.db.query(EventOccurrence).filter(
+            EventOccurrence.user_id == user_id,
+            EventOccurrence.event_id.in_(updates),
+        ).delete(synchronize_session=False)
+        self.db.execute(
+            insert(EventOccurrence),
+            [
+                {
+                    "event_id": entity_id,
+                    "user_id": user_id,
+                    "occurrence_date": values["date"],
+                    "start_time": values["start_time"],
+                    "end_time": values["end_time"],
+                }
+                for entity_id, values in updates.items()
+            ],
+        )
+
+        self._record_changes(
+            user_id,
+            [(entity_id, EVENT_CHANGE_UPSERT, None) for entity_id in updates],
+        )
+
+        return True
+
+    def edit_many(
+        self,
+        user_id: int,
+        exdates: list[tuple[int, date]],
+        entities: list[Event],
+    ) -> list[int]:
+        self._add_exdates(user_id, exdates)
+
+        return self._insert_events(entities)
+
     def delete(self, entity: Event) -> None:
+        self._record_change(entity, EVENT_CHANGE_DELETE)
         self.db.delete(entity)
-        self.db.commit()
+        self.db.flush()
+
+    def delete_for_user(
+        self,
+        user_id: int,
+        entity_id: int,
+        occurrence_date: date | None = None,
+    ) -> bool:
+        statement = delete(Event.__table__).where(
+            Event.id == entity_id,
+            Event.user_id == user_id,
+        )
+
+        if occurrence_date is not None:
+            statement = statement.where(
+                or_(~IS_RECURRING, Event.date == occurrence_date),
+            )
+
+        deleted = self.db.execute(statement.returning(Event.id)).first()
+
+        if deleted is None:
+            return False
+
+        self._record_changes(user_id, [(entity_id, EVENT_CHANGE_DELETE, None)])
+
+        return True
+
+    def exclude_occurrence_for_user(
+        self,
+        user_id: int,
+        entity_id: int,
+        exdate: date,
+    ) -> bool:
+        excluded = self.db.execute(
+            insert_for_dialect(self.db, EventExdate)
+            .from_select(
+                ["event_id", "exdate"],
+                select(Event.id, literal(exdate)).where(
+                    Event.id == entity_id,
+                    Event.user_id == user_id,
+                    Event.date != exdate,
+                    IS_RECURRING,
+                ),
+            )
+            .on_conflict_do_nothing()
+            .returning(EventExdate.event_id),
+        ).first()
+
+        if excluded is None:
+            return False
+
+        self.db.query(EventOccurrence).filter_by(
+            event_id=entity_id,
+            occurrence_date=exdate,
+        ).delete(synchronize_session=False)
+
+        self._record_changes(user_id, [(entity_id, EVENT_CHANGE_EXDATE, exdate)])
+
+        return True
+
+    def has_exdate_for_user(self, user_id: int, entity_id: int, exdate: date) -> bool:
+        return (
+            self.db.query(EventExdate.event_id)
+            .join(Event)
+            .filter(
+                Event.user_id == user_id,
+                EventExdate.event_id == entity_id,
+                EventExdate.exdate == exdate,
+            )
+            .first()
+            is not None
+        )
+
+    def delete_many(
+        self,
+        user_id: int,
+        entity_ids: list[int],
+        exdates: list[tuple[int, date]],
+    ) -> None:
+        self._add_exdates(user_id, exdates)
+
+        if entity_ids:
+            self._record_changes(
+                user_id,
+                [(entity_id, EVENT_CHANGE_DELETE, None) for entity_id in entity_ids],
+            )
+            self.db.query(EventOccurrence).filter(
+                EventOccurrence.user_id == user_id,
+                EventOccurrence.event_id.in_(entity_ids),
+            ).delete(synchronize_session=False)
+            self.db.query(EventExdate).filter(
+                EventExdate.event_id.in_(entity_ids),
+            ).delete(synchronize_session=False)
+            self.db.query(Event).filter(
+                Event.user_id == user_id,
+                Event.id.in_(entity_ids),
+            ).delete(synchronize_session=False)
+
+    def _insert_events(self, entities: list[Event]) -> list[int]:
+        if not entities:
+            return []
+
+        entity_ids = list(
+            self.db.scalars(
+                insert(Event)
+                .returning(Event.id, sort_by_parameter_order=True)
+                .execution_options(render_nulls=True),
+                [
+                    {column: getattr(entity, column) for column in EVENT_COLUMNS}
+                    for entity in entities
+                ],
+            ),
+        )
+
+        exdates = [
+            {"event_id": entity_id, "exdate": exdate.exdate}
+            for entity_id, entity in zip(entity_ids, entities, strict=True)
+            for exdate in entity.exdates
+        ]
+        occurrences = [
+            {
+                "event_id": entity_id,
+                "user_id": occurrence.user_id,
+                "occurrence_date": occurrence.occurrence_date,
+                "start_time": occurrence.start_time,
+                "end_time": occurrence.end_time,
+            }
+            for entity_id, entity in zip(entity_ids, entities, strict=True)
+            for occurrence in entity.occurrences
+        ]
+
+        if exdates:
+            self.db.execute(insert(EventExdate), exdates)
+        if occurrences:
+            self.db.execute(insert(EventOccurrence), occurrences)
+
+        self.db.execute(
+            insert(EventChange),
+            [
+                {
+                    "event_id": entity_id,
+                    "user_id": entity.user_id,
+                    "change_type": EVENT_CHANGE_UPSERT,
+                }
+                for entity_id, entity in zip(entity_ids, entities, strict=True)
+            ],
+        )
+
+        return entity_ids
+
+    def _add_exdates(self, user_id: int, exdates: list[tuple[int, date]]) -> None:
+        if not exdates:
+            return
+
+        self.db.execute(
+            insert_for_dialect(self.db, EventExdate).on_conflict_do_nothing(),
+            [
+                {"event_id": event_id, "exdate": exdate}
+                for event_id, exdate in sorted(set(exdates))
+            ],
+        )
+
+        self.db.query(EventOccurrence).filter(
+            EventOccurrence.user_id == user_id,
+            tuple_(EventOccurrence.event_id, EventOccurrence.occurrence_date).in_(
+                exdates,
+            ),
+        ).delete(synchronize_session=False)
+
+        self._record_changes(
+            user_id,
+            [
+                (event_id, EVENT_CHANGE_EXDATE, exdate)
+                for event_id, exdate in sorted(set(exdates))
+            ],
+        )
+
+    def _record_changes(
+        self,
+        user_id: int,
+        changes: list[tuple[int, str, date | None]],
+    ) -> None:
+        self.db.execute(
+            insert(EventChange),
+            [
+                {
+                    "event_id": event_id,
+                    "user_id": user_id,
+                    "change_type": change_type,
+                    "occurrence_date": occurrence_date,
+                }
+                for event_id, change_type, occurrence_date in changes
+            ],
+        )
+
+    def _record_change(
+        self,
+        entity: Event,
+        change_type: str,
+        occurrence_date: date | None = None,
+    ) -> None:
+        self.db.add(
+            EventChange(
+                event_id=entity.id,
+                user_id=entity.user_id,
+                change_type=change_type,
+                occurrence_date=occurrence_date,
+            ),
+        )
@@ -0,0 +1,127 @@
+from datetime import UTC, date, datetime, timedelta
+
+from api.events.repositories.event_occurrence_repository import (
+    EventOccurrenceRepository,
+)
+from api.events.utils.expansion_budget import ExpansionBudget
+from api.events.utils.recurrence_utils import expand_occurrence_dates, is_recurring
+from api.system.models.models import Event, EventOccurrence
+
+OCCURRENCE_HORIZON_DAYS: int = 400
+OCCURRENCE_READ_HORIZON_DAYS: int = 365
+OCCURRENCE_HISTORY_DAYS: int = 365
+
+
+class OccurrenceService:
+    def __init__(
+        self,
+        event_occurrence_repository: EventOccurrenceRepository,
+    ) -> None:
+        self.event_occurrence_repository = event_occurrence_repository
+
+    def materialize(self, event: Event, budget: ExpansionBudget | None = None) -> None:
+        occurrence_dates, occurrences_until = self._occurrence_dates(
+            event,
+            budget or ExpansionBudget(),
+        )
+
+        self.event_occurrence_repository.replace_for_event(
+            event,
+            occurrence_dates,
+            occurrences_until,
+        )
+
+    def attach(self, event: Event, budget: ExpansionBudget | None = None) -> None:
+        occurrence_dates, occurrences_until = self._occurrence_dates(
+            event,
+            budget or ExpansionBudget(),
+        )
+
+        event.occurrences = [
+            EventOccurrence(
+                user_id=event.user_id,
+                occurrence_date=occurrence_date,
+                start_time=event.start_time,
+                end_time=event.end_time,
+            )
+            for occurrence_date in occurrence_dates
+        ]
+        event.occurrences_until = occurrences_until  # type: ignore  # noqa: PGH003
+
+    def extend(self, event: Event, horizon: date, budget: ExpansionBudget) -> None:
+        if event.occurrences_until is None:
+            self.materialize(event, budget)
+            return
+
+        occurrence_dates, occurrences_until = self._expand(
+            event,
+            max(
+                event.occurrences_until + timedelta(days=1),  # type: ignore  # noqa: PGH003
+                OccurrenceService.floor(),
+            ),
+            horizon,
+            budget,
+        )
+
+        self.event_occurrence_repository.extend_for_event(
+            event,
+            occurrence_dates,
+            occurrences_until,
+        )
+
+    def _occurrence_dates(
+        self,
+        event: Event,
+        budget: ExpansionBudget,
+    ) -> tuple[list[date], date]:
+        if not is_recurring(event.rrule):  # type: ignore  # noqa: PGH003
+            return [event.date], event.date  # type: ignore  # noqa: PGH003
+
+        occurrence_dates, occurrences_until = self._expand(
+            event,
+            max(event.date, OccurrenceService.floor()),  # type: ignore  # noqa: PGH003
+            OccurrenceService.horizon(),
+            budget,
+        )
+
+        return [event.date, *occurrence_dates], occurrences_until  # type: ignore  # noqa: PGH003
+
+    def _expand(
+        self,
+        event: Event,
+        start_date: date,
+        end_date: date,
+        budget: ExpansionBudget,
+    ) -> tuple[list[date], date]:
+        expanded = tuple(
+            expand_occurrence_dates(
+                event,
+                start_date,
+                end_date,
+                limit=budget.remaining + 1,
+            ),
+        )
+        occurrence_dates = budget.take(expanded)
+
+        if len(occurrence_dates) == len(expanded):
+            return list(occurrence_dates), end_date
+
+        # Record how far the series got so the horizon job resumes from there.
+        if not occurrence_dates:
+            return [], start_date - timedelta(days=1)
+
+        return list(occurrence_dates), occurrence_dates[-1]
+
+    @staticmethod
+    def floor() -> date:
+        return datetime.now(tz=UTC).date() - timedelta(days=OCCURRENCE_HISTORY_DAYS)
+
+    @staticmethod
+    def horizon() -> date:
+        return datetime.now(tz=UTC).date() + timedelta(days=OCCURRENCE_HORIZON_DAYS)
+
+    @staticmethod
+    def read_horizon() -> date:
+        return datetime.now(tz=UTC).date() + timedelta(
+            days=OCCURRENCE_READ_HORIZON_DAYS,
+        )
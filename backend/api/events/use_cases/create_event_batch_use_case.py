@@ -0,0 +1,58 @@
+from api.events.caches.recurrence_cache import RecurrenceCache
+from api.events.metrics.recurrence_metrics import RecurrenceMetrics
+from api.events.repositories.event_repository import EventRepository
+from api.events.services.occurrence_service import OccurrenceService
+from api.events.use_cases.create_event_use_case import CreateEventUseCase
+from api.events.utils.expansion_budget import ExpansionBudget
+from api.system.interfaces.units_of_work import UnitOfWork
+from api.system.interfaces.use_cases import UseCase
+from api.system.schemas.event import EventBatch, EventBatchResult
+from api.system.schemas.user import CurrentUser
+from api.users.repositories.user_repository import UserRepository
+
+
+class CreateEventBatchUseCase(UseCase):
+    def __init__(  # noqa: PLR0913
+        self,
+        event_repository: EventRepository,
+        user_repository: UserRepository,
+        recurrence_cache: RecurrenceCache,
+        occurrence_service: OccurrenceService,
+        unit_of_work: UnitOfWork,
+        recurrence_metrics: RecurrenceMetrics,
+    ) -> None:
+        self.event_repository = event_repository
+        self.user_repository = user_repository
+        self.recurrence_cache = recurrence_cache
+        self.occurrence_service = occurrence_service
+        self.unit_of_work = unit_of_work
+        self.recurrence_metrics = recurrence_metrics
+
+    def execute(
+        self,
+        request: EventBatch,
+        current_user: CurrentUser,
+    ) -> EventBatchResult:
+        for event in request.events:
+            CreateEventUseCase.check_rule(event.rrule, self.recurrence_metrics)
+            CreateEventUseCase.check_exdate(event.exdate)
+
+        events = [
+            CreateEventUseCase.build_event(event, current_user.id)
+            for event in request.events
+        ]
+
+        budget = ExpansionBudget()
+
+        for event in events:
+            self.occurrence_service.attach(event, budget)
+
+        with self.unit_of_work:
+            self.user_repository.bump_calendar_version(current_user.id)
+
+            event_ids = self.event_repository.add_many(events)
+
+        for event_id in event_ids:
+            self.recurrence_cache.invalidate(event_id)
+
+        return EventBatchResult(ids=event_ids)
@@ -1,57 +1,108 @@
 import random
-from typing import Any
 
+from api.events.caches.recurrence_cache import RecurrenceCache
+from api.events.errors.invalid_exdate_error import InvalidExdateError
+from api.events.errors.invalid_recurrence_rule_error import (
+    InvalidRecurrenceRuleError,
+)
+from api.events.metrics.recurrence_metrics import RecurrenceMetrics
 from api.events.repositories.event_repository import EventRepository
+from api.events.services.occurrence_service import OccurrenceService
+from api.events.use_cases.detect_conflicts_use_case import DetectConflictsUseCase
+from api.events.utils.recurrence_utils import (
+    parse_exdates,
+    series_end,
+    within_instance_limit,
+)
+from api.system.interfaces.units_of_work import UnitOfWork
 from api.system.interfaces.use_cases import UseCase
-from api.system.models.models import Event
-from api.system.schemas.event import Event as EventSchema
-from api.system.schemas.event import EventBase
-from api.users.errors.user_not_found_error import UserNotFoundError
+from api.system.models.models import Event, EventExdate
+from api.system.schemas.event import EventBase, EventWithConflicts
+from api.system.schemas.user import CurrentUser
 from api.users.repositories.user_repository import UserRepository
 
 
 class CreateEventUseCase(UseCase):
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         event_repository: EventRepository,
         user_repository: UserRepository,
+        recurrence_cache: RecurrenceCache,
+        occurrence_service: OccurrenceService,
+        unit_of_work: UnitOfWork,
+        recurrence_metrics: RecurrenceMetrics,
     ) -> None:
         self.event_repository = event_repository
         self.user_repository = user_repository
+        self.recurrence_cache = recurrence_cache
+        self.occurrence_service = occurrence_service
+        self.unit_of_work = unit_of_work
+        self.recurrence_metrics = recurrence_metrics
 
     def execute(
         self,
         request: EventBase,
-        current_user: str,
-    ) -> EventSchema:
-        user = self.user_repository.find_by_email(current_user)
+        current_user: CurrentUser,
+        detect_conflicts_use_case: DetectConflictsUseCase | None = None,
+    ) -> EventWithConflicts:
+        CreateEventUseCase.check_rule(request.rrule, self.recurrence_metrics)
+        CreateEventUseCase.check_exdate(request.exdate)
+        event = CreateEventUseCase.build_event(request, current_user.id)
 
-        if user is None:
-            msg = "User not found"
-            raise UserNotFoundError(msg)
+        with self.unit_of_work:
+            self.user_repository.bump_calendar_version(current_user.id)
 
-        event_data: dict[str, Any] = {
-            "title": request.title,
-            "date": request.date,
-            "start_time": request.start_time,
-            "end_time": request.end_time,
-            "colour": request.colour if request.colour else "#8D85D2",
-            "user_id": user.id,
-            "user": user,
-        }
+            self.event_repository.add(event)
+            self.occurrence_service.materialize(event)
 
-        if request.description is not None:
-            event_data["description"] = request.description
-        if request.location is not None:
-            event_data["location"] = request.location
-        if request.rrule is not None:
-            event_data["rrule"] = request.rrule
+        self.recurrence_cache.invalidate(event.id)  # type: ignore  # noqa: PGH003
 
-        event = Event(**event_data)
+        conflicts = (
+            detect_conflicts_use_case.execute(event)
+            if detect_conflicts_use_case is not None
+            else None
+        )
 
-        self.event_repository.add(event)
+        return EventWithConflicts.model_validate(event).model_copy(
+            update={"conflicts": conflicts},
+        )
 
-        return EventSchema.model_validate(event)
+    @staticmethod
+    def check_rule(rrule: str | None, recurrence_metrics: RecurrenceMetrics) -> None:
+        if within_instance_limit(rrule):
+            return
+
+        recurrence_metrics.record_rejected(rrule)  # type: ignore  # noqa: PGH003
+        msg = "Recurrence rule is invalid or too frequent"
+        raise InvalidRecurrenceRuleError(msg)
+
+    @staticmethod
+    def check_exdate(exdate: str | None) -> None:
+        try:
+            parse_exdates(exdate)
+        except (ValueError, OverflowError) as error:
+            msg = "Excluded dates are invalid"
+            raise InvalidExdateError(msg) from error
+
+    @staticmethod
+    def build_event(request: EventBase, user_id: int) -> Event:
+        return Event(
+            title=request.title,
+            description=request.description,
+            location=request.location,
+            date=request.date,
+            start_time=request.start_time,
+            end_time=request.end_time,
+            rrule=request.rrule,
+            series_end=series_end(request.rrule, request.date, request.start_time),
+            colour=request.colour if request.colour else "#8D85D2",
+            user_id=user_id,
+            exdates=[
+                EventExdate(exdate=exdate) for exdate in parse_exdates(request.exdate)
+            ]
+            if request.exdate is not None
+            else [],
+        )
 
     @staticmethod
     def random_background_colour() -> str:
@@ -0,0 +1,66 @@
+from api.events.caches.recurrence_cache import RecurrenceCache
+from api.events.errors.event_not_found_error import EventNotFoundError
+from api.events.repositories.event_repository import EventRepository
+from api.events.utils.recurrence_utils import is_recurring
+from api.system.interfaces.units_of_work import UnitOfWork
+from api.system.interfaces.use_cases import UseCase
+from api.system.schemas.event import EventBatchDelete
+from api.system.schemas.user import CurrentUser
+from api.users.repositories.user_repository import UserRepository
+
+
+class DeleteEventBatchUseCase(UseCase):
+    def __init__(
+        self,
+        event_repository: EventRepository,
+        user_repository: UserRepository,
+        recurrence_cache: RecurrenceCache,
+        unit_of_work: UnitOfWork,
+    ) -> None:
+        self.event_repository = event_repository
+        self.user_repository = user_repository
+        self.recurrence_cache = recurrence_cache
+        self.unit_of_work = unit_of_work
+
+    def execute(self, request: EventBatchDelete, current_user: CurrentUser) -> None:
+        event_ids = sorted({event.event_id for event in request.events})
+        db_events = {
+            db_event.id: db_event
+            for db_event in self.event_repository.find_by_ids_for_user(
+                current_user.id,
+                event_ids,
+            )
+        }
+
+        if len(db_events) != len(event_ids):
+            msg = "Event not found"
+            raise EventNotFoundError(msg)
+
+        instance_deletes = {
+            (event.event_id, event.date)
+            for event in request.events
+            if is_recurring(db_events[event.event_id].rrule)  # type: ignore  # noqa: PGH003
+            and event.date is not None
+            and event.date != db_events[event.event_id].date
+        }
+        deleted_ids = {
+            event.event_id
+            for event in request.events
+            if (event.event_id, event.date) not in instance_deletes
+        }
+
+        with self.unit_of_work:
+            self.user_repository.bump_calendar_version(current_user.id)
+
+            self.event_repository.delete_many(
+                current_user.id,
+                sorted(deleted_ids),
+                sorted(
+                    instance_delete
+                    for instance_delete in instance_deletes
+                    if instance_delete[0] not in deleted_ids
+                ),
+            )
+
+        for event_id in event_ids:
+            self.recurrence_cache.invalidate(event_id)
@@ -1,10 +1,10 @@
-from datetime import datetime
-
+from api.events.caches.recurrence_cache import RecurrenceCache
 from api.events.errors.event_not_found_error import EventNotFoundError
 from api.events.repositories.event_repository import EventRepository
+from api.system.interfaces.units_of_work import UnitOfWork
 from api.system.interfaces.use_cases import UseCase
 from api.system.schemas.event import DeleteEvent
-from api.users.errors.user_not_found_error import UserNotFoundError
+from api.system.schemas.user import CurrentUser
 from api.users.repositories.user_repository import UserRepository
 
 
@@ -13,40 +13,45 @@ class DeleteEventUseCase(UseCase):
         self,
         event_repository: EventRepository,
         user_repository: UserRepository,
+        recurrence_cache: RecurrenceCache,
+        unit_of_work: UnitOfWork,
     ) -> None:
         self.event_repository = event_repository
         self.user_repository = user_repository
-
-    def execute(self, event: DeleteEvent, current_user: str) -> None:
-        user = self.user_repository.find_by_email(current_user)
-
-        if user is None:
-            msg = "User not found"
-            raise UserNotFoundError(msg)
-
-        db_event = self.event_repository.find_by_id(event.event_id)
-
-        if db_event is None:
-            msg = "Event not found"
-            raise EventNotFoundError(msg)
-
-        if db_event.user_id != user.id:  # type: ignore  # noqa: PGH003
-            msg = "Event not found"
-            raise EventNotFoundError(msg)
-
-        if (
-            db_event.rrule is not None
-            and db_event.rrule != "DNR"  # type: ignore  # noqa: PGH003
-            and event.date is not None
-            and event.date != db_event.date
-        ):
-            exdate_entry = datetime.combine(
-                event.date,
-                db_event.start_time,  # type: ignore  # noqa: PGH003
-            ).strftime(  # type: ignore  # noqa: PGH003
-                "%Y%m%dT%H%M%SZ",
+        self.recurrence_cache = recurrence_cache
+        self.unit_of_work = unit_of_work
+
+    def execute(self, event: DeleteEvent, current_user: CurrentUser) -> None:
+        with self.unit_of_work:
+            self.user_repository.bump_calendar_version(current_user.id)
+
+            excluded = (
+                event.date is not None
+                and self.event_repository.exclude_occurrence_for_user(
+                    current_user.id,
+                    event.event_id,
+                    event.date,
+                )
             )
-            self.event_repository.add_exdate(db_event, exdate_entry)
-            return
 
-        self.event_repository.delete(db_event)
+            if (
+                not excluded
+                and not self.event_repository.delete_for_user(
+                    current_user.id,
+                    event.event_id,
+                    event.date,
+                )
+                # Deleting an instance that is already excluded is a no-op.
+                and not (
+                    event.date is not None
+                    and self.event_repository.has_exdate_for_user(
+                        current_user.id,
+                        event.event_id,
+                        event.date,
+                    )
+                )
+            ):
+                msg = "Event not found"
+                raise EventNotFoundError(msg)
+
+        self.recurrence_cache.invalidate(event.event_id)
@@ -0,0 +1,26 @@
+from api.events.use_cases.get_events_for_user_use_case import GetEventsForUserUseCase
+from api.events.utils.interval_utils import occurrence_interval
+from api.system.interfaces.use_cases import UseCase
+from api.system.models.models import Event
+
+
+class DetectConflictsUseCase(UseCase):
+    def __init__(self, get_events_for_user_use_case: GetEventsForUserUseCase) -> None:
+        self.get_events_for_user_use_case = get_events_for_user_use_case
+
+    def execute(self, event: Event) -> list[int]:
+        start, end = occurrence_interval(
+            event.date,  # type: ignore  # noqa: PGH003
+            event.start_time,  # type: ignore  # noqa: PGH003
+            event.end_time,  # type: ignore  # noqa: PGH003
+        )
+
+        return [
+            event_id
+            for event_id in self.get_events_for_user_use_case.get_overlapping_event_ids(
+                event.user_id,  # type: ignore  # noqa: PGH003
+                start,
+                end,
+            )
+            if event_id != event.id
+        ]
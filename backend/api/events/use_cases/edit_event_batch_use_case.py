@@ -0,0 +1,129 @@
+from typing import Any
+
+from api.events.caches.recurrence_cache import RecurrenceCache
+from api.events.errors.duplicate_batch_event_error import DuplicateBatchEventError
+from api.events.errors.event_not_found_error import EventNotFoundError
+from api.events.errors.event_version_conflict_error import (
+    EventVersionConflictError,
+)
+from api.events.errors.recurring_event_edit_error import RecurringEventEditError
+from api.events.repositories.event_repository import EventRepository
+from api.events.services.occurrence_service import OccurrenceService
+from api.events.use_cases.edit_event_use_case import EditEventUseCase
+from api.events.utils.recurrence_utils import is_recurring
+from api.system.interfaces.units_of_work import UnitOfWork
+from api.system.interfaces.use_cases import UseCase
+from api.system.models.models import Event
+from api.system.schemas.event import EventBatchEdit, EventBatchResult, EventEdit
+from api.system.schemas.user import CurrentUser
+from api.users.repositories.user_repository import UserRepository
+
+
+class EditEventBatchUseCase(UseCase):
+    def __init__(
+        self,
+        event_repository: EventRepository,
+        user_repository: UserRepository,
+        recurrence_cache: RecurrenceCache,
+        occurrence_service: OccurrenceService,
+        unit_of_work: UnitOfWork,
+    ) -> None:
+        self.event_repository = event_repository
+        self.user_repository = user_repository
+        self.recurrence_cache = recurrence_cache
+        self.occurrence_service = occurrence_service
+        self.unit_of_work = unit_of_work
+
+    def execute(
+        self,
+        request: EventBatchEdit,
+        current_user: CurrentUser,
+    ) -> EventBatchResult:
+        event_ids = sorted({event.event_id for event in request.events})
+
+        if len(event_ids) != len(request.events):
+            msg = "Duplicate event in batch"
+            raise DuplicateBatchEventError(msg)
+
+        db_events = {
+            db_event.id: db_event
+            for db_event in self.event_repository.find_by_ids_for_user(
+                current_user.id,
+                event_ids,
+            )
+        }
+
+        if len(db_events) != len(event_ids):
+            msg = "Event not found"
+            raise EventNotFoundError(msg)
+
+        updates: dict[int, dict[str, Any]] = {}
+        versions: dict[int, int] = {}
+        series_versions: dict[int, int] = {}
+        split_edits: list[EventEdit] = []
+        split_events: list[Event] = []
+
+        for event in request.events:
+            db_event = db_events[event.event_id]
+
+            if event.version is not None and event.version != db_event.version:
+                msg = "Event version conflict"
+                raise EventVersionConflictError(msg)
+
+            if not is_recurring(db_event.rrule):  # type: ignore  # noqa: PGH003
+                updated_fields = EditEventUseCase.merge_with_existing_event(
+                    db_event,
+                    event,
+                )
+                updates[event.event_id] = {
+                    key: value
+                    for key, value in updated_fields
+                    if key in Event.__table__.columns
+                } | {
+                    "occurrences_until": updated_fields.date,
+                    "series_end": updated_fields.date,
+                }
+                versions[event.event_id] = db_event.version  # type: ignore  # noqa: PGH003
+                continue
+
+            if event.previous_date is None or event.previous_date == db_event.date:
+                raise RecurringEventEditError
+
+            split_event = EditEventUseCase.build_split_event(db_event, event)
+            self.occurrence_service.attach(split_event)
+
+            series_versions[event.event_id] = db_event.version  # type: ignore  # noqa: PGH003
+            split_edits.append(event)
+            split_events.append(split_event)
+
+        with self.unit_of_work:
+            self.user_repository.bump_calendar_version(current_user.id)
+
+            if not self.event_repository.update_many(
+                current_user.id,
+                updates,
+                versions,
+            ) or not self.event_repository.bump_series_versions(
+                current_user.id,
+                series_versions,
+            ):
+                msg = "Event version conflict"
+                raise EventVersionConflictError(msg)
+
+            split_ids = iter(
+                self.event_repository.edit_many(
+                    current_user.id,
+                    [(event.event_id, event.previous_date) for event in split_edits],  # type: ignore  # noqa: PGH003
+                    split_events,
+                ),
+            )
+
+        for event_id in event_ids:
+            self.recurrence_cache.invalidate(event_id)
+
+        return EventBatchResult(
+            ids=[
+                event.event_id if event.event_id in updates else next(split_ids)
+                for event in request.events
+            ],
+        )
@@ -1,14 +1,19 @@
-from datetime import datetime
-
+from api.events.caches.recurrence_cache import RecurrenceCache
 from api.events.errors.event_not_found_error import EventNotFoundError
+from api.events.errors.event_version_conflict_error import (
+    EventVersionConflictError,
+)
 from api.events.errors.recurring_event_edit_error import RecurringEventEditError
 from api.events.repositories.event_repository import EventRepository
+from api.events.services.occurrence_service import OccurrenceService
+from api.events.use_cases.detect_conflicts_use_case import DetectConflictsUseCase
+from api.events.utils.recurrence_utils import is_recurring
+from api.system.interfaces.units_of_work import UnitOfWork
 from api.system.interfaces.use_cases import UseCase
 from api.system.models.models import Event as EventModel
 from api.system.schemas.event import EditEvent as EditEventSchema
-from api.system.schemas.event import Event as EventSchema
-from api.system.schemas.event import EventBase
-from api.users.errors.user_not_found_error import UserNotFoundError
+from api.system.schemas.event import EventBase, EventWithConflicts
+from api.system.schemas.user import CurrentUser
 from api.users.repositories.user_repository import UserRepository
 
 
@@ -17,71 +22,114 @@ class EditEventUseCase(UseCase):
         self,
         event_repository: EventRepository,
         user_repository: UserRepository,
+        recurrence_cache: RecurrenceCache,
+        occurrence_service: OccurrenceService,
+        unit_of_work: UnitOfWork,
     ) -> None:
         self.event_repository = event_repository
         self.user_repository = user_repository
+        self.recurrence_cache = recurrence_cache
+        self.occurrence_service = occurrence_service
+        self.unit_of_work = unit_of_work
 
     def execute(
         self,
         event_id: int,
         request: EditEventSchema,
-        current_user: str,
-    ) -> EventSchema:
-        user = self.user_repository.find_by_email(current_user)
+        current_user: CurrentUser,
+        detect_conflicts_use_case: DetectConflictsUseCase | None = None,
+    ) -> EventWithConflicts:
+        with self.unit_of_work:
+            self.user_repository.bump_calendar_version(current_user.id)
+
+            edited = self.event_repository.edit_for_user(
+                current_user.id,
+                event_id,
+                request,
+            )
 
-        if user is None:
-            msg = "User not found"
-            raise UserNotFoundError(msg)
+            if edited is not None:
+                self.occurrence_service.materialize(edited)
 
-        event = self.event_repository.find_by_id(event_id)
+        if edited is not None:
+            self.recurrence_cache.invalidate(event_id)
+            return self._with_conflicts(edited, detect_conflicts_use_case)
 
-        if event is None:
-            msg = "Event not found"
-            raise EventNotFoundError(msg)
+        event = self.event_repository.find_by_id_for_user(
+            current_user.id,
+            event_id,
+        )
 
-        if event.user_id != user.id:  # type: ignore  # noqa: PGH003
+        if event is None:
             msg = "Event not found"
             raise EventNotFoundError(msg)
 
-        if event.rrule is None or event.rrule == "DNR":  # type: ignore  # noqa: PGH003
-            updated_fields = self._merge_with_existing_event(event, request)
-            self.event_repository.edit(event, updated_fields)
-            return EventSchema.model_validate(event)
+        if not is_recurring(event.rrule):  # type: ignore  # noqa: PGH003
+            msg = "Event version conflict"
+            raise EventVersionConflictError(msg)
 
         if request.previous_date is not None and request.previous_date == event.date:  # type: ignore  # noqa: PGH003
             raise RecurringEventEditError
 
         if request.previous_date is not None:
-            exdate_entry = datetime.combine(
-                request.previous_date,
-                request.previous_start_time or event.start_time,  # type: ignore  # noqa: PGH003
-            ).strftime("%Y%m%dT%H%M%SZ")
-
-            self.event_repository.add_exdate(event, exdate_entry)
-
-            new_event = EventModel(
-                title=request.title if request.title else event.title,  # type: ignore  # noqa: PGH003
-                description=request.description
-                if request.description
-                else event.description,  # type: ignore  # noqa: PGH003
-                location=request.location if request.location else event.location,  # type: ignore  # noqa: PGH003
-                date=request.date if request.date else event.date,  # type: ignore  # noqa: PGH003
-                start_time=request.start_time
-                if request.start_time
-                else event.start_time,  # type: ignore  # noqa: PGH003
-                end_time=request.end_time if request.end_time else event.end_time,  # type: ignore  # noqa: PGH003
-                colour=request.colour if request.colour else event.colour,  # type: ignore  # noqa: PGH003
-                user_id=event.user_id,
-                user=event.user,
-            )
+            new_event = EditEventUseCase.build_split_event(event, request)
 
-            self.event_repository.add(new_event)
-            return EventSchema.model_validate(new_event)
+            version = event.version if request.version is None else request.version
+
+            with self.unit_of_work:
+                self.user_repository.bump_calendar_version(current_user.id)
+
+                if not self.event_repository.bump_series_versions(
+                    current_user.id,
+                    {event_id: version},  # type: ignore  # noqa: PGH003
+                ):
+                    msg = "Event version conflict"
+                    raise EventVersionConflictError(msg)
+
+                self.event_repository.add_exdate(event, request.previous_date)
+                self.event_repository.add(new_event)
+                self.occurrence_service.materialize(new_event)
+
+            self.recurrence_cache.invalidate(event_id)
+            return self._with_conflicts(new_event, detect_conflicts_use_case)
 
         raise RecurringEventEditError
 
-    def _merge_with_existing_event(
-        self, event: EventModel, request: EditEventSchema
+    def _with_conflicts(
+        self,
+        event: EventModel,
+        detect_conflicts_use_case: DetectConflictsUseCase | None,
+    ) -> EventWithConflicts:
+        conflicts = (
+            detect_conflicts_use_case.execute(event)
+            if detect_conflicts_use_case is not None
+            else None
+        )
+
+        return EventWithConflicts.model_validate(event).model_copy(
+            update={"conflicts": conflicts},
+        )
+
+    @staticmethod
+    def build_split_event(event: EventModel, request: EditEventSchema) -> EventModel:
+        return EventModel(
+            title=request.title if request.title else event.title,  # type: ignore  # noqa: PGH003
+            description=request.description
+            if request.description
+            else event.description,  # type: ignore  # noqa: PGH003
+            location=request.location if request.location else event.location,  # type: ignore  # noqa: PGH003
+            date=request.date if request.date else event.date,  # type: ignore  # noqa: PGH003
+            start_time=request.start_time if request.start_time else event.start_time,  # type: ignore  # noqa: PGH003
+            end_time=request.end_time if request.end_time else event.end_time,  # type: ignore  # noqa: PGH003
+            colour=request.colour if request.colour else event.colour,  # type: ignore  # noqa: PGH003
+            series_end=request.date if request.date else event.date,  # type: ignore  # noqa: PGH003
+            user_id=event.user_id,
+        )
+
+    @staticmethod
+    def merge_with_existing_event(
+        event: EventModel,
+        request: EditEventSchema,
     ) -> EventBase:
         return EventBase(
             title=request.title if request.title else event.title,  # type: ignore  # noqa: PGH003
@@ -0,0 +1,42 @@
+from api.events.repositories.event_occurrence_repository import (
+    EventOccurrenceRepository,
+)
+from api.events.services.occurrence_service import OccurrenceService
+from api.events.utils.expansion_budget import ExpansionBudget
+from api.system.interfaces.units_of_work import UnitOfWork
+from api.system.interfaces.use_cases import UseCase
+
+BATCH_SIZE: int = 500
+
+
+class ExtendOccurrenceHorizonUseCase(UseCase):
+    def __init__(
+        self,
+        event_occurrence_repository: EventOccurrenceRepository,
+        occurrence_service: OccurrenceService,
+        unit_of_work: UnitOfWork,
+    ) -> None:
+        self.event_occurrence_repository = event_occurrence_repository
+        self.occurrence_service = occurrence_service
+        self.unit_of_work = unit_of_work
+
+    def execute(self) -> int:
+        horizon = OccurrenceService.horizon()
+        extended_count = 0
+
+        while True:
+            events = self.event_occurrence_repository.get_events_to_extend(
+                horizon,
+                BATCH_SIZE,
+            )
+
+            if not events:
+                return extended_count
+
+            budget = ExpansionBudget()
+
+            with self.unit_of_work:
+                for event in events:
+                    self.occurrence_service.extend(event, horizon, budget)
+
+            extended_count += len(events)
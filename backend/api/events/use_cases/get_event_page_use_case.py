@@ -0,0 +1,35 @@
+from api.events.use_cases.get_events_for_user_use_case import GetEventsForUserUseCase
+from api.events.utils.event_rows import page_key, render_event_page
+from api.events.utils.page_cursor_utils import decode_page_cursor, encode_page_cursor
+from api.events.utils.window_utils import resolve_window
+from api.system.interfaces.use_cases import UseCase
+from api.system.schemas.event import GetEventPage
+from api.system.schemas.user import CurrentUser
+
+
+class GetEventPageUseCase(UseCase):
+    def __init__(
+        self,
+        get_events_for_user_use_case: GetEventsForUserUseCase,
+    ) -> None:
+        self.get_events_for_user_use_case = get_events_for_user_use_case
+
+    def execute(self, current_user: CurrentUser, request: GetEventPage) -> bytes:
+        start_date, end_date = resolve_window(request.start_date, request.end_date)
+        after = decode_page_cursor(request.cursor) if request.cursor else None
+
+        rows, truncated = self.get_events_for_user_use_case.get_event_page(
+            current_user.id,
+            start_date,
+            end_date,
+            after,
+            request.limit + 1,
+        )
+
+        next_cursor = None
+
+        if len(rows) > request.limit:
+            rows = rows[: request.limit]
+            next_cursor = encode_page_cursor(*page_key(rows[-1]))
+
+        return render_event_page(rows, next_cursor, truncated=truncated)
@@ -1,39 +1,223 @@
-from datetime import date, datetime, timedelta
+import heapq
+from datetime import date, datetime, time, timedelta
 
-from dateutil import parser as date_parser
-from dateutil.rrule import rrulestr
-from dateutil.tz import UTC
+from sqlalchemy import Row
 
+from api.events.caches.calendar_cache import CalendarCache
+from api.events.caches.recurrence_cache import RecurrenceCache
 from api.events.errors.events_not_found_error import EventsNotFoundError
+from api.events.metrics.recurrence_metrics import RecurrenceMetrics
+from api.events.repositories.event_occurrence_repository import (
+    EventOccurrenceRepository,
+)
 from api.events.repositories.event_repository import EventRepository
+from api.events.services.occurrence_service import OccurrenceService
+from api.events.utils.event_rows import (
+    EventRow,
+    ListedRow,
+    OccurrenceRow,
+    event_row,
+    page_key,
+    render_event_list,
+)
+from api.events.utils.expansion_budget import ExpansionBudget
+from api.events.utils.interval_utils import (
+    Interval,
+    IntervalIndex,
+    merge_intervals,
+    occurrence_interval,
+)
+from api.events.utils.page_cursor_utils import PageCursor
+from api.events.utils.recurrence_utils import (
+    expand_rule_dates,
+    format_exdates,
+    is_recurring,
+)
+from api.events.utils.window_utils import resolve_window
 from api.system.interfaces.use_cases import UseCase
-from api.system.schemas.event import Event, EventList
+from api.system.schemas.event import EventListPayload
+from api.system.schemas.user import CurrentUser
 from api.users.errors.user_not_found_error import UserNotFoundError
 from api.users.repositories.user_repository import UserRepository
 
 
 class GetEventsForUserUseCase(UseCase):
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         event_repository: EventRepository,
         user_repository: UserRepository,
+        recurrence_cache: RecurrenceCache,
+        calendar_cache: CalendarCache,
+        event_occurrence_repository: EventOccurrenceRepository,
+        recurrence_metrics: RecurrenceMetrics,
     ) -> None:
         self.event_repository = event_repository
         self.user_repository = user_repository
+        self.recurrence_cache = recurrence_cache
+        self.calendar_cache = calendar_cache
+        self.event_occurrence_repository = event_occurrence_repository
+        self.recurrence_metrics = recurrence_metrics
 
-    def execute(self, current_user: str) -> EventList:
-        user = self.user_repository.find_by_email(current_user)
+    def execute(
+        self,
+        current_user: CurrentUser,
+        start_date: date | None = None,
+        end_date: date | None = None,
+        if_none_match: str | None = None,
+    ) -> EventListPayload:
+        start_date, end_date = resolve_window(start_date, end_date)
+
+        calendar_version = self.user_repository.get_calendar_version(current_user.id)
 
-        if user is None:
+        if calendar_version is None:
             msg = "User not found"
             raise UserNotFoundError(msg)
 
-        today = datetime.now(tz=UTC).date()
-        start_date = today - timedelta(days=365)
-        end_date = today + timedelta(days=365)
+        etag = self._etag(current_user.id, calendar_version, start_date, end_date)
+
+        if self._etag_matches(if_none_match, etag):
+            return EventListPayload(etag=etag)
+
+        cache_key = self.calendar_cache.key(
+            current_user.id,
+            calendar_version,
+            start_date,
+            end_date,
+        )
+        content = self.calendar_cache.get(cache_key)
+
+        if content is None:
+            content = self._get_events(
+                current_user.id,
+                start_date,
+                end_date,
+            )
+            self.calendar_cache.set(cache_key, content)
+
+        return EventListPayload(etag=etag, content=content)
+
+    def get_event_page(
+        self,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+        after: PageCursor | None,
+        limit: int,
+    ) -> tuple[list[ListedRow], bool]:
+        if self._is_materialized(user_id, start_date, end_date):
+            occurrences = self.event_occurrence_repository.get_occurrence_page(
+                user_id,
+                start_date,
+                end_date,
+                after,
+                limit,
+            )
+
+            return self._materialized_rows(occurrences), False
+
+        rows, truncated = self._get_expanded_events(user_id, start_date, end_date)
 
+        if after is not None:
+            rows = [row for row in rows if page_key(row) > after]
+
+        return heapq.nsmallest(limit, rows, key=page_key), truncated
+
+    def get_busy_intervals(
+        self,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+    ) -> list[Interval]:
+        return merge_intervals(
+            sorted(
+                (start, end)
+                for start, end, _ in self.get_occurrence_intervals(
+                    user_id,
+                    start_date,
+                    end_date,
+                )
+            ),
+        )
+
+    def get_occurrence_intervals(
+        self,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+    ) -> list[tuple[datetime, datetime, int]]:
+        if self._is_materialized(user_id, start_date, end_date):
+            occurrence_times = self.event_occurrence_repository.get_occurrence_times(
+                user_id,
+                start_date,
+                end_date,
+            )
+        else:
+            occurrence_times = self._get_expanded_times(user_id, start_date, end_date)
+
+        return [
+            (*occurrence_interval(occurrence_date, start_time, end_time), event_id)
+            for occurrence_date, start_time, end_time, event_id in occurrence_times
+        ]
+
+    def get_overlapping_event_ids(
+        self,
+        user_id: int,
+        start: datetime,
+        end: datetime,
+    ) -> list[int]:
+        start_date = start.date() - timedelta(days=1)
+
+        if self._is_materialized(user_id, start_date, end.date()):
+            return self.event_occurrence_repository.find_overlapping(
+                user_id,
+                start,
+                end,
+            )
+
+        return IntervalIndex(
+            self.get_occurrence_intervals(user_id, start_date, end.date()),
+        ).overlapping(start, end)
+
+    def _get_events(self, user_id: int, start_date: date, end_date: date) -> bytes:
+        if self._is_materialized(user_id, start_date, end_date):
+            return render_event_list(
+                self._materialized_rows(
+                    self.event_occurrence_repository.get_occurrences(
+                        user_id,
+                        start_date,
+                        end_date,
+                    ),
+                ),
+            )
+
+        rows, truncated = self._get_expanded_events(user_id, start_date, end_date)
+
+        return render_event_list(rows, truncated=truncated)
+
+    def _is_materialized(
+        self,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+    ) -> bool:
+        return (
+            OccurrenceService.floor() <= start_date
+            and end_date <= OccurrenceService.read_horizon()
+            and not self.event_occurrence_repository.has_pending_series(
+                user_id,
+                start_date,
+                end_date,
+            )
+        )
+
+    def _get_expanded_events(
+        self,
+        user_id: int,
+        start_date: date,
+        end_date: date,
+    ) -> tuple[list[ListedRow], bool]:
         events = self.event_repository.get_events(
-            user.id,  # type: ignore  # noqa: PGH003
+            user_id,
             start_date,
             end_date,
         )
@@ -42,63 +226,230 @@ class GetEventsForUserUseCase(UseCase):
             msg = "Events not found"
             raise EventsNotFoundError(msg)
 
-        events_with_rrule: list[Event] = []
+        exdates = self.event_repository.get_exdates(
+            [event.id for event in events if is_recurring(event.rrule)],
+        )
+
+        budget = ExpansionBudget()
+        rows: list[ListedRow] = []
 
         for event in events:
-            if event.rrule is not None and event.rrule != "DNR":  # pyright: ignore[reportGeneralTypeIssues]
-                events_with_rrule.append(event)
-                events_with_rrule.extend(
-                    self._expand_rrule(event, start_date, end_date)
+            (
+                event_id,
+                title,
+                description,
+                location,
+                event_date,
+                start_time,
+                end_time,
+                colour,
+                rrule,
+                version,
+            ) = event
+            event_exdates = exdates.get(event_id, [])
+
+            if start_date <= event_date <= end_date:
+                rows.append(
+                    event_row(
+                        event_id,
+                        title,
+                        description,
+                        location,
+                        event_date,
+                        start_time,
+                        end_time,
+                        colour,
+                        rrule,
+                        format_exdates(event_exdates),
+                        version=version,
+                    ),
                 )
-            else:
-                events_with_rrule.append(event)
 
-        validated_events: list[Event] = [
-            Event.model_validate(event) for event in events_with_rrule
-        ]
+            if is_recurring(rrule):
+                series = event_row(
+                    event_id,
+                    title,
+                    description,
+                    location,
+                    event_date,
+                    start_time,
+                    end_time,
+                    colour,
+                    repeated=True,
+                    version=version,
+                )
+                rows.extend(
+                    OccurrenceRow(series, occ_date)
+                    for occ_date in self._expand_rrule(
+                        event,
+                        event_exdates,
+                        start_date,
+                        end_date,
+                        budget,
+                    )
+                )
 
-        return EventList(events=validated_events)
+        if budget.truncated:
+            self.recurrence_metrics.record_truncated(user_id)
 
-    def _expand_rrule(
+        return rows, budget.truncated
+
+    def _get_expanded_times(
         self,
-        event: Event,
+        user_id: int,
         start_date: date,
         end_date: date,
-    ) -> list[Event]:
-        dtstart = datetime.combine(event.date, event.start_time).replace(tzinfo=UTC)
-        rule = rrulestr(event.rrule, dtstart=dtstart)  # type: ignore  # noqa: PGH003
-
-        start_dt = datetime.combine(start_date, event.start_time).replace(tzinfo=UTC)
-        end_dt = datetime.combine(end_date, event.end_time).replace(tzinfo=UTC)
-
-        occurrences = rule.between(start_dt, end_dt, inc=True)
-        excluded = set()
-
-        if event.exdate:
-            for ex in event.exdate.split(","):
-                excluded_dt = date_parser.parse(ex)
-                if excluded_dt.tzinfo is None:
-                    excluded_dt = excluded_dt.replace(tzinfo=UTC)
-                excluded.add(excluded_dt.date())
-
-        expanded: list[Event] = []
-        for occ in occurrences:
-            occ_date = occ.date()
-            if occ_date == event.date or occ_date in excluded:
+    ) -> list[tuple[date, time, time, int]]:
+        events = self.event_repository.get_events(user_id, start_date, end_date)
+        exdates = self.event_repository.get_exdates(
+            [event.id for event in events if is_recurring(event.rrule)],
+        )
+
+        budget = ExpansionBudget()
+        occurrence_times: list[tuple[date, time, time, int]] = []
+
+        for event in events:
+            if start_date <= event.date <= end_date:
+                occurrence_times.append(
+                    (event.date, event.start_time, event.end_time, event.id),
+                )
+
+            if is_recurring(event.rrule):
+                start_time, end_time = event.start_time, event.end_time
+                occurrence_times.extend(
+                    (occ_date, start_time, end_time, event.id)
+                    for occ_date in self._expand_rrule(
+                        event,
+                        exdates.get(event.id, []),
+                        start_date,
+                        end_date,
+                        budget,
+                    )
+                )
+
+        if budget.truncated:
+            self.recurrence_metrics.record_truncated(user_id)
+
+        return occurrence_times
+
+    def _materialized_rows(self, occurrences: list[Row]) -> list[ListedRow]:
+        rows: list[ListedRow] = []
+        masters: dict[int, EventRow] = {}
+        series: dict[tuple[int, time, time], EventRow] = {}
+
+        for (
+            event_id,
+            title,
+            description,
+            location,
+            occurrence_date,
+            start_time,
+            end_time,
+            colour,
+            rrule,
+            event_date,
+            version,
+        ) in occurrences:
+            if occurrence_date == event_date:
+                row = event_row(
+                    event_id,
+                    title,
+                    description,
+                    location,
+                    occurrence_date,
+                    start_time,
+                    end_time,
+                    colour,
+                    rrule,
+                    version=version,
+                )
+                rows.append(row)
+
+                if is_recurring(rrule):
+                    masters[event_id] = row
                 continue
 
-            expanded.append(
-                Event(
-                    id=event.id,
-                    title=event.title,
-                    description=event.description,
-                    location=event.location,
-                    date=occ_date,
-                    start_time=event.start_time,
-                    end_time=event.end_time,
-                    colour=event.colour,
+            series_key = (event_id, start_time, end_time)
+
+            if series_key not in series:
+                series[series_key] = event_row(
+                    event_id,
+                    title,
+                    description,
+                    location,
+                    occurrence_date,
+                    start_time,
+                    end_time,
+                    colour,
                     repeated=True,
-                ),
-            )
+                    version=version,
+                )
+
+            rows.append(OccurrenceRow(series[series_key], occurrence_date))
+
+        exdates = self.event_repository.get_exdates(list(masters))
+
+        for event_id, event_exdates in exdates.items():
+            masters[event_id]["exdate"] = format_exdates(event_exdates)
+
+        return rows
+
+    def _etag(
+        self,
+        user_id: int,
+        calendar_version: int,
+        start_date: date,
+        end_date: date,
+    ) -> str:
+        return f'W/"{user_id}.{calendar_version}.{start_date:%Y%m%d}.{end_date:%Y%m%d}"'
+
+    def _etag_matches(self, if_none_match: str | None, etag: str) -> bool:
+        if if_none_match is None:
+            return False
+
+        candidates = {candidate.strip() for candidate in if_none_match.split(",")}
+
+        if "*" in candidates:
+            return True
+
+        return etag.removeprefix("W/") in {
+            candidate.removeprefix("W/") for candidate in candidates
+        }
+
+    def _expand_rrule(
+        self,
+        event: Row,
+        exdates: list[date],
+        start_date: date,
+        end_date: date,
+        budget: ExpansionBudget,
+    ) -> tuple[date, ...]:
+        cache_key = RecurrenceCache.key(
+            event.id,
+            event.rrule,
+            tuple(sorted(exdates)),
+            start_date,
+            end_date,
+        )
+        cached = self.recurrence_cache.get(cache_key)
+
+        if cached is not None:
+            return budget.take(cached)
+
+        expanded = tuple(
+            expand_rule_dates(
+                event.rrule,
+                event.date,
+                event.start_time,
+                event.end_time,
+                set(exdates),
+                start_date,
+                end_date,
+                limit=budget.remaining + 1,
+            ),
+        )
+
+        if len(expanded) <= budget.remaining:
+            self.recurrence_cache.set(cache_key, expanded)
 
-        return expanded
+        return budget.take(expanded)
@@ -0,0 +1,50 @@
+from datetime import datetime, time, timedelta
+
+from api.events.use_cases.get_events_for_user_use_case import GetEventsForUserUseCase
+from api.events.utils.interval_utils import clip_intervals, free_slots
+from api.events.utils.window_utils import resolve_window
+from api.system.interfaces.use_cases import UseCase
+from api.system.schemas.event import FreeBusy, GetFreeBusy, TimeInterval
+from api.system.schemas.user import CurrentUser
+
+FREE_BUSY_DEFAULT_DAYS: int = 7
+FREE_BUSY_MAX_DAYS: int = 92
+
+
+class GetFreeBusyUseCase(UseCase):
+    def __init__(
+        self,
+        get_events_for_user_use_case: GetEventsForUserUseCase,
+    ) -> None:
+        self.get_events_for_user_use_case = get_events_for_user_use_case
+
+    def execute(self, current_user: CurrentUser, request: GetFreeBusy) -> FreeBusy:
+        start_date, end_date = resolve_window(
+            request.start_date,
+            request.end_date,
+            FREE_BUSY_DEFAULT_DAYS,
+            FREE_BUSY_MAX_DAYS,
+        )
+        window_start = datetime.combine(start_date, time.min)
+        window_end = datetime.combine(end_date + timedelta(days=1), time.min)
+
+        busy = clip_intervals(
+            self.get_events_for_user_use_case.get_busy_intervals(
+                current_user.id,
+                start_date - timedelta(days=1),
+                end_date,
+            ),
+            window_start,
+            window_end,
+        )
+        free = free_slots(
+            busy,
+            window_start,
+            window_end,
+            timedelta(minutes=request.min_slot_minutes),
+        )
+
+        return FreeBusy(
+            busy=[TimeInterval(start=start, end=end) for start, end in busy],
+            free=[TimeInterval(start=start, end=end) for start, end in free],
+        )
@@ -5,35 +5,31 @@ from dateutil.rrule import rrulestr
 from fastapi import UploadFile
 from icalendar import Calendar
 
+from api.events.errors.invalid_exdate_error import InvalidExdateError
+from api.events.metrics.recurrence_metrics import RecurrenceMetrics
 from api.events.repositories.event_repository import EventRepository
 from api.events.use_cases.create_event_use_case import CreateEventUseCase
+from api.events.utils.recurrence_utils import within_instance_limit
 from api.system.interfaces.use_cases import UseCase
 from api.system.schemas.event import EventBase, ImportReport
-from api.users.errors.user_not_found_error import UserNotFoundError
-from api.users.repositories.user_repository import UserRepository
+from api.system.schemas.user import CurrentUser
 
 
 class ImportEventsUseCase(UseCase):
     def __init__(
         self,
         event_repository: EventRepository,
-        user_repository: UserRepository,
+        recurrence_metrics: RecurrenceMetrics,
     ) -> None:
         self.event_repository = event_repository
-        self.user_repository = user_repository
+        self.recurrence_metrics = recurrence_metrics
 
     def execute(
         self,
-        current_user: str,
+        current_user: CurrentUser,
         file: UploadFile,
         create_event_use_case: CreateEventUseCase,
     ) -> ImportReport:
-        user = self.user_repository.find_by_email(current_user)
-
-        if user is None:
-            msg = "User not found"
-            raise UserNotFoundError(msg)
-
         calendar_object = self._load_ics(file)
         return self._traverse_calendar(
             calendar_object,
@@ -50,7 +46,7 @@ class ImportEventsUseCase(UseCase):
         self,
         calendar_object: Any,  # noqa: ANN401
         create_event_use_case: CreateEventUseCase,
-        current_user: str,
+        current_user: CurrentUser,
     ) -> ImportReport:
         imported_count = 0
         skipped_count = 0
@@ -102,6 +98,19 @@ class ImportEventsUseCase(UseCase):
                     warnings.append("Skipped event with invalid RRULE")
                     continue
 
+                if not within_instance_limit(rrule_text):
+                    self.recurrence_metrics.record_rejected(rrule_text)
+                    skipped_count += 1
+                    warnings.append("Skipped event with too frequent RRULE")
+                    continue
+
+            try:
+                CreateEventUseCase.check_exdate(exdate_text)
+            except InvalidExdateError:
+                skipped_count += 1
+                warnings.append("Skipped event with invalid EXDATE")
+                continue
+
             event = EventBase(  # noqa: PLW2901
                 title=title,
                 description=description,
@@ -0,0 +1,99 @@
+from api.events.repositories.event_change_repository import EventChangeRepository
+from api.events.repositories.event_repository import EventRepository
+from api.events.utils.sync_token_utils import decode_sync_token, encode_sync_token
+from api.system.interfaces.use_cases import UseCase
+from api.system.models.models import (
+    EVENT_CHANGE_DELETE,
+    EVENT_CHANGE_EXDATE,
+    EventChange,
+)
+from api.system.schemas.event import Event, EventExdateTombstone, EventSync
+from api.system.schemas.user import CurrentUser
+
+SYNC_PAGE_SIZE: int = 500
+
+
+class SyncEventsUseCase(UseCase):
+    def __init__(
+        self,
+        event_repository: EventRepository,
+        event_change_repository: EventChangeRepository,
+    ) -> None:
+        self.event_repository = event_repository
+        self.event_change_repository = event_change_repository
+
+    def execute(
+        self,
+        current_user: CurrentUser,
+        sync_token: str | None = None,
+    ) -> EventSync:
+        if sync_token is None:
+            return self._initial_sync(current_user.id)
+
+        changes = self.event_change_repository.get_changes(
+            current_user.id,
+            decode_sync_token(sync_token),
+            SYNC_PAGE_SIZE + 1,
+        )
+
+        has_more = len(changes) > SYNC_PAGE_SIZE
+        changes = changes[:SYNC_PAGE_SIZE]
+
+        if not changes:
+            return EventSync(
+                events=[],
+                deleted=[],
+                exdates=[],
+                sync_token=sync_token,
+            )
+
+        return self._incremental_sync(changes, has_more=has_more)
+
+    def _initial_sync(self, user_id: int) -> EventSync:
+        latest_id = self.event_change_repository.get_latest_id(user_id)
+        events = self.event_repository.find_by_user_id(user_id)
+
+        return EventSync(
+            events=[Event.model_validate(event) for event in events],
+            deleted=[],
+            exdates=[],
+            sync_token=encode_sync_token(latest_id),
+        )
+
+    def _incremental_sync(
+        self,
+        changes: list[EventChange],
+        *,
+        has_more: bool,
+    ) -> EventSync:
+        upserted: set[int] = set()
+        deleted: set[int] = set()
+        exdates: list[EventExdateTombstone] = []
+
+        for change in changes:
+            event_id: int = change.event_id  # type: ignore  # noqa: PGH003
+
+            if change.change_type == EVENT_CHANGE_DELETE:  # type: ignore  # noqa: PGH003
+                upserted.discard(event_id)
+                deleted.add(event_id)
+            elif change.change_type == EVENT_CHANGE_EXDATE:  # type: ignore  # noqa: PGH003
+                exdates.append(
+                    EventExdateTombstone(
+                        event_id=event_id,
+                        date=change.occurrence_date,  # type: ignore  # noqa: PGH003
+                    ),
+                )
+            else:
+                deleted.discard(event_id)
+                upserted.add(event_id)
+
+        events = self.event_repository.find_by_ids(sorted(upserted))
+        deleted.update(upserted - {event.id for event in events})  # type: ignore  # noqa: PGH003
+
+        return EventSync(
+            events=[Event.model_validate(event) for event in events],
+            deleted=sorted(deleted),
+            exdates=[exdate for exdate in exdates if exdate.event_id not in deleted],
+            sync_token=encode_sync_token(changes[-1].id),  # type: ignore  # noqa: PGH003
+            has_more=has_more,
+        )
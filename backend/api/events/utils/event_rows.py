@@ -0,0 +1,88 @@
+from datetime import date, time
+from typing import Any
+
+import orjson
+
+EventRow = dict[str, Any]
+
+
+class OccurrenceRow:
+    __slots__ = ("occurrence_date", "series")
+
+    def __init__(self, series: EventRow, occurrence_date: date) -> None:
+        self.series = series
+        self.occurrence_date = occurrence_date
+
+    def __getitem__(self, key: str) -> Any:  # noqa: ANN401, D105
+        if key == "date":
+            return self.occurrence_date
+
+        return self.series[key]
+
+
+ListedRow = EventRow | OccurrenceRow
+
+
+def event_row(  # noqa: PLR0913
+    event_id: int,
+    title: str,
+    description: str | None,
+    location: str | None,
+    occurrence_date: date,
+    start_time: time,
+    end_time: time,
+    colour: str | None,
+    rrule: str | None = None,
+    exdate: str | None = None,
+    *,
+    repeated: bool = False,
+    version: int = 1,
+) -> EventRow:
+    return {
+        "title": title,
+        "description": description,
+        "location": location,
+        "date": occurrence_date,
+        "start_time": start_time,
+        "end_time": end_time,
+        "colour": colour,
+        "rrule": rrule,
+        "exdate": exdate,
+        "repeated": repeated,
+        "id": event_id,
+        "version": version,
+    }
+
+
+def render_event_list(rows: list[ListedRow], *, truncated: bool = False) -> bytes:
+    return orjson.dumps(
+        {"events": rows, "truncated": truncated},
+        default=_serialize_row,
+    )
+
+
+def render_event_page(
+    rows: list[ListedRow],
+    next_cursor: str | None,
+    *,
+    truncated: bool = False,
+) -> bytes:
+    return orjson.dumps(
+        {"events": rows, "truncated": truncated, "next_cursor": next_cursor},
+        default=_serialize_row,
+    )
+
+
+def page_key(row: ListedRow) -> tuple[date, time, int]:
+    return row["date"], row["start_time"], row["id"]
+
+
+def _serialize_row(value: object) -> EventRow:
+    # orjson calls this once per occurrence, so keep it to one frame. Copying
+    # the shared series dict is cheaper than unpacking it into a new one.
+    if type(value) is OccurrenceRow:
+        row = value.series.copy()
+        row["date"] = value.occurrence_date
+        return row
+
+    raise TypeError
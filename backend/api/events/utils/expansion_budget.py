@@ -0,0 +1,18 @@
+from datetime import date
+
+EXPANSION_BUDGET: int = 50_000
+
+
+class ExpansionBudget:
+    def __init__(self, limit: int = EXPANSION_BUDGET) -> None:
+        self.remaining = limit
+        self.truncated = False
+
+    def take(self, occurrences: tuple[date, ...]) -> tuple[date, ...]:
+        if len(occurrences) > self.remaining:
+            occurrences = occurrences[: self.remaining]
+            self.truncated = True
+
+        self.remaining -= len(occurrences)
+
+        return occurrences
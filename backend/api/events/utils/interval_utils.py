@@ -0,0 +1,93 @@
+from bisect import bisect_left
+from collections.abc import Iterable
+from datetime import date, datetime, time, timedelta
+
+Interval = tuple[datetime, datetime]
+
+
+class IntervalIndex:
+    def __init__(self, intervals: Iterable[tuple[datetime, datetime, int]]) -> None:
+        self._entries = sorted(intervals)
+        self._starts = [start for start, _, _ in self._entries]
+        self._max_duration = max(
+            (end - start for start, end, _ in self._entries),
+            default=timedelta(0),
+        )
+
+    def overlapping(self, start: datetime, end: datetime) -> list[int]:
+        lo = bisect_left(self._starts, start - self._max_duration)
+        hi = bisect_left(self._starts, end)
+
+        return sorted(
+            {
+                entry_id
+                for _, entry_end, entry_id in self._entries[lo:hi]
+                if entry_end > start
+            },
+        )
+
+
+def occurrence_interval(
+    occurrence_date: date,
+    start_time: time,
+    end_time: time,
+) -> Interval:
+    start = datetime.combine(occurrence_date, start_time)
+    end = datetime.combine(occurrence_date, end_time)
+
+    if end <= start:
+        end += timedelta(days=1)
+
+    return start, end
+
+
+def merge_intervals(intervals: Iterable[Interval]) -> list[Interval]:
+    merged: list[Interval] = []
+
+    for start, end in intervals:
+        if merged and start <= merged[-1][1]:
+            if end > merged[-1][1]:
+                merged[-1] = (merged[-1][0], end)
+            continue
+
+        merged.append((start, end))
+
+    return merged
+
+
+def clip_intervals(
+    intervals: Iterable[Interval],
+    window_start: datetime,
+    window_end: datetime,
+) -> list[Interval]:
+    return [
+        (max(start, window_start), min(end, window_end))
+        for start, end in intervals
+        if end > window_start and start < window_end
+    ]
+
+
+def free_slots(
+    busy: list[Interval],
+    window_start: datetime,
+    window_end: datetime,
+    min_slot: timedelta,
+) -> list[Interval]:
+    slots: list[Interval] = []
+    cursor = window_start
+
+    for start, end in busy:
+        gap_end = min(start, window_end)
+
+        if gap_end - cursor >= min_slot:
+            slots.append((cursor, gap_end))
+
+        cursor = max(cursor, end)
+
+        if cursor >= window_end:
+            return slots
+
+    if window_end - cursor >= min_slot:
+        slots.append((cursor, window_end))
+
+    return slots
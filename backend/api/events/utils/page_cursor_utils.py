@@ -0,0 +1,44 @@
+import base64
+import binascii
+from datetime import date, time
+
+from api.events.errors.invalid_page_cursor_error import InvalidPageCursorError
+
+PAGE_CURSOR_PREFIX: str = "p1:"
+
+PageCursor = tuple[date, time, int]
+
+
+def encode_page_cursor(occurrence_date: date, start_time: time, event_id: int) -> str:
+    raw = (
+        f"{PAGE_CURSOR_PREFIX}{occurrence_date.isoformat()},"
+        f"{start_time.isoformat()},{event_id}"
+    ).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_page_cursor(cursor: str) -> PageCursor:
+    padded = cursor + "=" * (-len(cursor) % 4)
+
+    try:
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+    except (binascii.Error, UnicodeDecodeError, ValueError) as err:
+        msg = "Malformed page cursor"
+        raise InvalidPageCursorError(msg) from err
+
+    if not raw.startswith(PAGE_CURSOR_PREFIX):
+        msg = "Unsupported page cursor"
+        raise InvalidPageCursorError(msg)
+
+    try:
+        occurrence_date, start_time, event_id = raw.removeprefix(
+            PAGE_CURSOR_PREFIX,
+        ).split(",")
+        return (
+            date.fromisoformat(occurrence_date),
+            time.fromisoformat(start_time),
+            int(event_id),
+        )
+    except ValueError as err:
+        msg = "Malformed page cursor"
+        raise InvalidPageCursorError(msg) from err
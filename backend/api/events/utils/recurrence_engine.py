@@ -0,0 +1,231 @@
+import calendar
+import re
+from datetime import date, datetime, time
+from functools import lru_cache
+
+from dateutil.tz import UTC
+
+WEEKDAYS: dict[str, int] = {
+    "MO": 0,
+    "TU": 1,
+    "WE": 2,
+    "TH": 3,
+    "FR": 4,
+    "SA": 5,
+    "SU": 6,
+}
+
+SUPPORTED_FREQUENCIES: frozenset[str] = frozenset({"DAILY", "WEEKLY", "MONTHLY"})
+SUPPORTED_PARTS: frozenset[str] = frozenset(
+    {"FREQ", "INTERVAL", "COUNT", "UNTIL", "BYDAY", "WKST"},
+)
+
+UNTIL_PATTERN = re.compile(r"^\d{8}T\d{6}Z$")
+
+
+class SimpleRule:
+    def __init__(
+        self,
+        frequency: str,
+        interval: int,
+        count: int | None,
+        until: datetime | None,
+        weekdays: tuple[int, ...] | None,
+    ) -> None:
+        self.frequency = frequency
+        self.interval = interval
+        self.count = count
+        self.until = until
+        self.weekdays = weekdays
+
+
+@lru_cache(maxsize=1024)
+def parse_simple_rule(rrule: str) -> SimpleRule | None:
+    parts = _split_rule(rrule)
+
+    if parts is None or parts.get("FREQ") not in SUPPORTED_FREQUENCIES:
+        return None
+
+    if parts.get("WKST", "MO") != "MO" or ("COUNT" in parts and "UNTIL" in parts):
+        return None
+
+    try:
+        interval = int(parts.get("INTERVAL", "1"))
+        count = int(parts["COUNT"]) if "COUNT" in parts else None
+    except ValueError:
+        return None
+
+    if interval < 1 or (count is not None and count < 1):
+        return None
+
+    until: datetime | None = None
+    if "UNTIL" in parts:
+        if not UNTIL_PATTERN.match(parts["UNTIL"]):
+            return None
+        until = datetime.strptime(parts["UNTIL"], "%Y%m%dT%H%M%SZ").replace(tzinfo=UTC)
+
+    weekdays: tuple[int, ...] | None = None
+    if "BYDAY" in parts:
+        weekdays = _parse_weekdays(parts["FREQ"], parts["BYDAY"])
+        if weekdays is None:
+            return None
+
+    return SimpleRule(parts["FREQ"], interval, count, until, weekdays)
+
+
+def _split_rule(rrule: str) -> dict[str, str] | None:
+    text = rrule.strip().upper()
+    text = text.removeprefix("RRULE:")
+
+    if not text or "\n" in text or ":" in text:
+        return None
+
+    parts: dict[str, str] = {}
+    for part in text.split(";"):
+        key, sep, value = part.partition("=")
+        if not sep or key not in SUPPORTED_PARTS or key in parts:
+            return None
+        parts[key] = value
+
+    return parts
+
+
+def _parse_weekdays(frequency: str, byday: str) -> tuple[int, ...] | None:
+    codes = byday.split(",")
+
+    if frequency != "WEEKLY" or any(code not in WEEKDAYS for code in codes):
+        return None
+
+    return tuple(sorted({WEEKDAYS[code] for code in codes}))
+
+
+def expand_simple_rule(  # noqa: PLR0913
+    rule: SimpleRule,
+    dtstart: date,
+    start_time: time,
+    end_time: time,
+    start_date: date,
+    end_date: date,
+) -> list[date]:
+    last_ordinal = end_date.toordinal()
+    if start_time > end_time:
+        last_ordinal -= 1
+
+    if rule.until is not None:
+        until_date = rule.until.date()
+        until_ordinal = until_date.toordinal()
+        if datetime.combine(until_date, start_time, tzinfo=UTC) > rule.until:
+            until_ordinal -= 1
+        last_ordinal = min(last_ordinal, until_ordinal)
+
+    first_ordinal = max(start_date.toordinal(), dtstart.toordinal())
+
+    if first_ordinal > last_ordinal:
+        return []
+
+    if rule.frequency == "DAILY":
+        ordinals = _daily_ordinals(rule, dtstart, first_ordinal, last_ordinal)
+    elif rule.frequency == "WEEKLY":
+        ordinals = _weekly_ordinals(rule, dtstart, first_ordinal, last_ordinal)
+    else:
+        ordinals = _monthly_ordinals(rule, dtstart, first_ordinal, last_ordinal)
+
+    return [date.fromordinal(ordinal) for ordinal in ordinals]
+
+
+def _daily_ordinals(
+    rule: SimpleRule,
+    dtstart: date,
+    first_ordinal: int,
+    last_ordinal: int,
+) -> range:
+    start_ordinal = dtstart.toordinal()
+    first_index = -(-(first_ordinal - start_ordinal) // rule.interval)
+    last_index = (last_ordinal - start_ordinal) // rule.interval
+
+    if rule.count is not None:
+        last_index = min(last_index, rule.count - 1)
+
+    return range(
+        start_ordinal + first_index * rule.interval,
+        start_ordinal + last_index * rule.interval + 1,
+        rule.interval,
+    )
+
+
+def _weekly_ordinals(
+    rule: SimpleRule,
+    dtstart: date,
+    first_ordinal: int,
+    last_ordinal: int,
+) -> list[int]:
+    start_ordinal = dtstart.toordinal()
+    week_ordinal = start_ordinal - dtstart.weekday()
+    weekdays = rule.weekdays or (dtstart.weekday(),)
+    step = 7 * rule.interval
+
+    if rule.count is not None:
+        first_week = 0
+    else:
+        first_week = max(0, (first_ordinal - week_ordinal) // step)
+
+    ordinals: list[int] = []
+    remaining = rule.count
+    week_start = week_ordinal + first_week * step
+
+    while week_start <= last_ordinal:
+        for weekday in weekdays:
+            ordinal = week_start + weekday
+            if ordinal < start_ordinal:
+                continue
+            if ordinal > last_ordinal:
+                return ordinals
+            if ordinal >= first_ordinal:
+                ordinals.append(ordinal)
+            if remaining is not None:
+                remaining -= 1
+                if remaining == 0:
+                    return ordinals
+        week_start += step
+
+    return ordinals
+
+
+def _monthly_ordinals(
+    rule: SimpleRule,
+    dtstart: date,
+    first_ordinal: int,
+    last_ordinal: int,
+) -> list[int]:
+    start_month = dtstart.year * 12 + dtstart.month - 1
+    last_date = date.fromordinal(last_ordinal)
+    last_month = last_date.year * 12 + last_date.month - 1
+
+    if rule.count is not None:
+        month = start_month
+    else:
+        first_date = date.fromordinal(first_ordinal)
+        first_month = first_date.year * 12 + first_date.month - 1
+        month = (
+            start_month
+            + max(0, (first_month - start_month) // rule.interval) * rule.interval
+        )
+
+    ordinals: list[int] = []
+    remaining = rule.count
+
+    while month <= last_month:
+        year, month_index = divmod(month, 12)
+        if dtstart.day <= calendar.monthrange(year, month_index + 1)[1]:
+            ordinal = date(year, month_index + 1, dtstart.day).toordinal()
+            if ordinal > last_ordinal:
+                break
+            if ordinal >= first_ordinal:
+                ordinals.append(ordinal)
+            if remaining is not None:
+                remaining -= 1
+                if remaining == 0:
+                    break
+        month += rule.interval
+
+    return ordinals
@@ -0,0 +1,235 @@
+from collections.abc import Iterable, Iterator
+from datetime import date, datetime, time
+from itertools import groupby, islice, takewhile
+from math import ceil, prod
+
+from dateutil import parser as date_parser
+from dateutil.rrule import rrulestr
+from dateutil.tz import UTC
+
+from api.events.utils.recurrence_engine import expand_simple_rule, parse_simple_rule
+from api.system.models.models import EXDATE_FORMAT, Event
+
+NO_REPEAT_RULE: str = "DNR"
+
+MAX_YEARLY_INSTANCES: int = 366
+MAX_SERIES_INSTANCES: int = 10_000
+
+DAYS_PER_YEAR: int = 366
+SECONDS_PER_DAY: int = 86_400
+
+FREQUENCY_SECONDS: dict[str, int] = {
+    "SECONDLY": 1,
+    "MINUTELY": 60,
+    "HOURLY": 3_600,
+    "DAILY": SECONDS_PER_DAY,
+    "WEEKLY": 7 * SECONDS_PER_DAY,
+    "MONTHLY": 31 * SECONDS_PER_DAY,
+    "YEARLY": DAYS_PER_YEAR * SECONDS_PER_DAY,
+}
+DAY_PARTS: frozenset[str] = frozenset(
+    {"BYMONTH", "BYWEEKNO", "BYYEARDAY", "BYMONTHDAY", "BYDAY"},
+)
+TIME_PART_SECONDS: dict[str, int] = {"BYHOUR": 3_600, "BYMINUTE": 60, "BYSECOND": 1}
+
+
+def is_recurring(rrule: str | None) -> bool:
+    return rrule is not None and rrule != NO_REPEAT_RULE
+
+
+def parse_exdates(exdate: str | None) -> set[date]:
+    excluded: set[date] = set()
+
+    if not exdate:
+        return excluded
+
+    for ex in exdate.split(","):
+        excluded_dt = date_parser.parse(ex)
+        if excluded_dt.tzinfo is None:
+            excluded_dt = excluded_dt.replace(tzinfo=UTC)
+        excluded.add(excluded_dt.date())
+
+    return excluded
+
+
+def expand_occurrence_dates(
+    event: Event,
+    start_date: date,
+    end_date: date,
+    limit: int | None = None,
+) -> list[date]:
+    return expand_rule_dates(
+        event.rrule,  # type: ignore  # noqa: PGH003
+        event.date,  # type: ignore  # noqa: PGH003
+        event.start_time,  # type: ignore  # noqa: PGH003
+        event.end_time,  # type: ignore  # noqa: PGH003
+        {exdate.exdate for exdate in event.exdates},  # type: ignore  # noqa: PGH003
+        start_date,
+        end_date,
+        limit,
+    )
+
+
+def estimate_yearly_instances(rrule: str) -> int | None:
+    parts = _rule_parts(rrule)
+    frequency_seconds = FREQUENCY_SECONDS.get(parts.get("FREQ", ""))
+
+    if frequency_seconds is None:
+        return None
+
+    try:
+        rrulestr(rrule)
+        interval = int(parts.get("INTERVAL", "1"))
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+    if interval < 1:
+        return None
+
+    instances = ceil(DAYS_PER_YEAR * SECONDS_PER_DAY / (frequency_seconds * interval))
+
+    if frequency_seconds > SECONDS_PER_DAY and DAY_PARTS.intersection(parts):
+        instances = DAYS_PER_YEAR
+
+    return instances * prod(
+        len(parts[part].split(","))
+        for part, part_seconds in TIME_PART_SECONDS.items()
+        if part in parts and part_seconds < frequency_seconds
+    )
+
+
+def within_instance_limit(rrule: str | None) -> bool:
+    if rrule is None or not is_recurring(rrule):
+        return True
+
+    instances = estimate_yearly_instances(rrule)
+
+    return instances is not None and instances <= MAX_YEARLY_INSTANCES
+
+
+def expand_rule_dates(  # noqa: PLR0913
+    rrule: str,
+    dtstart: date,
+    start_time: time,
+    end_time: time,
+    excluded: set[date],
+    start_date: date,
+    end_date: date,
+    limit: int | None = None,
+) -> list[date]:
+    simple_rule = parse_simple_rule(rrule)
+    candidates: Iterable[date]
+
+    if simple_rule is not None:
+        candidates = expand_simple_rule(
+            simple_rule,
+            dtstart,
+            start_time,
+            end_time,
+            start_date,
+            end_date,
+        )
+    else:
+        candidates = _expand_with_dateutil(
+            rrule,
+            datetime.combine(dtstart, start_time).replace(tzinfo=UTC),
+            datetime.combine(start_date, start_time).replace(tzinfo=UTC),
+            datetime.combine(end_date, end_time).replace(tzinfo=UTC),
+        )
+
+    # Sub-daily rules repeat a date; occurrences are stored one per date.
+    return list(
+        islice(
+            (
+                occ_date
+                for occ_date, _ in groupby(candidates)
+                if occ_date != dtstart and occ_date not in excluded
+            ),
+            limit,
+        ),
+    )
+
+
+def series_end(rrule: str | None, dtstart: date, start_time: time) -> date | None:
+    if rrule is None or not is_recurring(rrule):
+        return dtstart
+
+    simple_rule = parse_simple_rule(rrule)
+
+    if simple_rule is not None:
+        if simple_rule.count is None and simple_rule.until is None:
+            return None
+
+        return max(
+            expand_simple_rule(
+                simple_rule,
+                dtstart,
+                start_time,
+                start_time,
+                dtstart,
+                date.max,
+            ),
+            default=dtstart,
+        )
+
+    return _series_end_with_dateutil(rrule, dtstart, start_time)
+
+
+def format_exdates(exdates: list[date]) -> str | None:
+    if not exdates:
+        return None
+
+    return ",".join(sorted(exdate.strftime(EXDATE_FORMAT) for exdate in exdates))
+
+
+def _expand_with_dateutil(
+    rrule: str,
+    dtstart: datetime,
+    start_dt: datetime,
+    end_dt: datetime,
+) -> Iterator[date]:
+    rule = rrulestr(rrule, dtstart=dtstart)
+
+    return (
+        occ.date()
+        for occ in takewhile(
+            lambda occ: occ <= end_dt,
+            rule.xafter(start_dt, inc=True),
+        )
+    )
+
+
+def _rule_parts(rrule: str) -> dict[str, str]:
+    return dict(
+        part.partition("=")[::2]
+        for part in rrule.strip().upper().removeprefix("RRULE:").split(";")
+    )
+
+
+def _series_end_with_dateutil(
+    rrule: str,
+    dtstart: date,
+    start_time: time,
+) -> date | None:
+    parts = _rule_parts(rrule)
+
+    try:
+        if "UNTIL" in parts:
+            return max(date_parser.parse(parts["UNTIL"]).date(), dtstart)
+
+        if "COUNT" not in parts:
+            return None
+
+        if int(parts["COUNT"]) > MAX_SERIES_INSTANCES:
+            return None
+
+        occurrences = list(
+            rrulestr(
+                rrule,
+                dtstart=datetime.combine(dtstart, start_time).replace(tzinfo=UTC),
+            ),
+        )
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+    return max(occurrences[-1].date(), dtstart) if occurrences else dtstart
@@ -0,0 +1,33 @@
+import base64
+import binascii
+
+from api.events.errors.invalid_sync_token_error import InvalidSyncTokenError
+
+SYNC_TOKEN_PREFIX: str = "v1:"  # noqa: S105  # nosec B105
+
+
+def encode_sync_token(change_id: int) -> str:
+    raw = f"{SYNC_TOKEN_PREFIX}{change_id}".encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_sync_token(sync_token: str) -> int:
+    padded = sync_token + "=" * (-len(sync_token) % 4)
+
+    try:
+        raw = base64.urlsafe_b64decode(padded.encode()).decode()
+    except (binascii.Error, UnicodeDecodeError, ValueError) as err:
+        msg = "Malformed sync token"
+        raise InvalidSyncTokenError(msg) from err
+
+    if not raw.startswith(SYNC_TOKEN_PREFIX):
+        msg = "Unsupported sync token"
+        raise InvalidSyncTokenError(msg)
+
+    change_id = raw.removeprefix(SYNC_TOKEN_PREFIX)
+
+    if not change_id.isdigit():
+        msg = "Malformed sync token"
+        raise InvalidSyncTokenError(msg)
+
+    return int(change_id)
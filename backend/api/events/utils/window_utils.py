@@ -0,0 +1,34 @@
+from datetime import date, datetime, timedelta
+
+from dateutil.tz import UTC
+
+from api.events.errors.invalid_event_window_error import InvalidEventWindowError
+
+DEFAULT_WINDOW_DAYS: int = 365
+MAX_WINDOW_DAYS: int = 2 * DEFAULT_WINDOW_DAYS
+
+
+def resolve_window(
+    start_date: date | None,
+    end_date: date | None,
+    default_days: int = DEFAULT_WINDOW_DAYS,
+    max_days: int = MAX_WINDOW_DAYS,
+) -> tuple[date, date]:
+    if start_date is None and end_date is None:
+        today = datetime.now(tz=UTC).date()
+        start_date = today - timedelta(days=default_days)
+        end_date = today + timedelta(days=default_days)
+    elif start_date is None:
+        start_date = end_date - timedelta(days=default_days)  # type: ignore  # noqa: PGH003
+    elif end_date is None:
+        end_date = start_date + timedelta(days=default_days)
+
+    if end_date < start_date:  # type: ignore  # noqa: PGH003
+        msg = "End date must not be before start date"
+        raise InvalidEventWindowError(msg)
+
+    if (end_date - start_date).days > max_days:  # type: ignore  # noqa: PGH003
+        msg = f"Date window must not exceed {max_days} days"
+        raise InvalidEventWindowError(msg)
+
+    return start_date, end_date  # type: ignore  # noqa: PGH003
@@ -20,6 +20,7 @@ from api.system.schemas.integration import (
     OAuthCallbackData,
     OAuthConnect,
 )
+from api.system.schemas.user import CurrentUser
 
 integrations = APIRouter()
 
@@ -34,7 +35,7 @@ def connect_integration(
         ConnectIntegrationUseCase,
         Depends(connect_integration_use_case),
     ],
-    current_user: Annotated[str, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
 ):
     return connect_integration_use_case.execute(provider, current_user)
 
@@ -50,7 +51,7 @@ async def handle_redirect_for_integration(
         HandleRedirectUseCase,
         Depends(handle_redirect_use_case),
     ],
-    current_user: Annotated[str, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
 ):
     return await handle_redirect_use_case.execute(
         OAuthCallbackData,
@@ -65,7 +66,7 @@ def retrieve_integrations(
         RetrieveIntegrationsUseCase,
         Depends(retrieve_integrations_use_case),
     ],
-    current_user: Annotated[str, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
 ):
     return retrieve_integration_use_case.execute(
         current_user,
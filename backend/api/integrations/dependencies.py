@@ -5,9 +5,9 @@ from fastapi import Depends
 from api.config import Config
 from api.dependencies import (
     IntegrationRepository,
-    UserRepository,
+    UnitOfWork,
     get_integration_repository,
-    get_user_repository,
+    get_unit_of_work,
 )
 from api.integrations.use_cases.connect_integration_use_case import (
     ConnectIntegrationUseCase,
@@ -26,10 +26,9 @@ def connect_integration_use_case(
         IntegrationRepository,
         Depends(get_integration_repository),
     ],
-    user_repository: Annotated[UserRepository, Depends(get_user_repository)],
     config: Annotated[Config, Depends(Config)],
 ) -> ConnectIntegrationUseCase:
-    return ConnectIntegrationUseCase(integration_repository, user_repository, config)
+    return ConnectIntegrationUseCase(integration_repository, config)
 
 
 def handle_redirect_use_case(
@@ -37,10 +36,14 @@ def handle_redirect_use_case(
         IntegrationRepository,
         Depends(get_integration_repository),
     ],
-    user_repository: Annotated[UserRepository, Depends(get_user_repository)],
     config: Annotated[Config, Depends(Config)],
+    unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
 ) -> HandleRedirectUseCase:
-    return HandleRedirectUseCase(integration_repository, user_repository, config)
+    return HandleRedirectUseCase(
+        integration_repository,
+        config,
+        unit_of_work,
+    )
 
 
 def retrieve_integrations_use_case(
@@ -48,9 +51,8 @@ def retrieve_integrations_use_case(
         IntegrationRepository,
         Depends(get_integration_repository),
     ],
-    user_repository: Annotated[UserRepository, Depends(get_user_repository)],
 ) -> RetrieveIntegrationsUseCase:
-    return RetrieveIntegrationsUseCase(integration_repository, user_repository)
+    return RetrieveIntegrationsUseCase(integration_repository)
 
 
 def search_integration_use_case(
@@ -58,6 +60,9 @@ def search_integration_use_case(
         IntegrationRepository,
         Depends(get_integration_repository),
     ],
-    user_repository: Annotated[UserRepository, Depends(get_user_repository)],
+    unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
 ) -> SearchIntegrationUseCase:
-    return SearchIntegrationUseCase(integration_repository, user_repository)
+    return SearchIntegrationUseCase(
+        integration_repository,
+        unit_of_work,
+    )
@@ -1,9 +1,21 @@
 from datetime import datetime
 
+from sqlalchemy import func
 from sqlalchemy.orm import Session
 
 from api.system.interfaces.repositories import Repository
 from api.system.models.models import Integration
+from api.system.utils.insert_utils import insert_for_dialect
+
+INTEGRATION_COLUMNS: tuple[str, ...] = (
+    "access_token",
+    "refresh_token",
+    "expires_at",
+    "scope",
+    "workspace_name",
+    "workspace_id",
+    "bot_id",
+)
 
 
 class IntegrationRepository(Repository):
@@ -14,8 +26,28 @@ class IntegrationRepository(Repository):
         self.db.query(Integration).filter_by()
 
         self.db.add(entity)
-        self.db.commit()
-        self.db.refresh(entity)
+        self.db.flush()
+
+    def upsert(self, entity: Integration) -> None:
+        statement = insert_for_dialect(self.db, Integration).values(
+            user_id=entity.user_id,
+            provider=entity.provider,
+            **{column: getattr(entity, column) for column in INTEGRATION_COLUMNS},
+        )
+
+        self.db.execute(
+            statement.on_conflict_do_update(
+                index_elements=[Integration.user_id, Integration.provider],
+                set_={
+                    **{
+                        column: statement.excluded[column]
+                        for column in INTEGRATION_COLUMNS
+                    },
+                    "is_active": True,
+                    "updated_at": func.now(),
+                },
+            ),
+        )
 
     def find_by_id(self, entity_id: int) -> Integration | None:
         return self.db.query(Integration).filter_by(id=entity_id).first()
@@ -33,7 +65,7 @@ class IntegrationRepository(Repository):
 
     def delete(self, entity: Integration) -> None:
         self.db.delete(entity)
-        self.db.commit()
+        self.db.flush()
 
     def retrieve_integrations_for_user(
         self,
@@ -66,7 +98,6 @@ class IntegrationRepository(Repository):
         integration.refresh_token = refresh_token  # type: ignore  # noqa: PGH003
         integration.expires_at = expires_at  # type: ignore  # noqa: PGH003
 
-        self.db.commit()
-        self.db.refresh(integration)
+        self.db.flush()
 
         return integration
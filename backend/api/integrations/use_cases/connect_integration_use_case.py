@@ -8,28 +8,19 @@ from api.integrations.providers.provider_registry import ProviderRegistry
 from api.integrations.repositories.integration_repository import IntegrationRepository
 from api.system.interfaces.use_cases import UseCase
 from api.system.schemas.integration import OAuthConnect
-from api.users.errors.user_not_found_error import UserNotFoundError
-from api.users.repositories.user_repository import UserRepository
+from api.system.schemas.user import CurrentUser
 
 
 class ConnectIntegrationUseCase(UseCase):
     def __init__(
         self,
         integration_repository: IntegrationRepository,
-        user_repository: UserRepository,
         config: Config,
     ) -> None:
         self.integration_repository = integration_repository
-        self.user_repository = user_repository
         self.config = config
 
-    def execute(self, provider: str, current_user: str) -> OAuthConnect:
-        user = self.user_repository.find_by_email(current_user)
-
-        if user is None:
-            msg = "User not found"
-            raise UserNotFoundError(msg)
-
+    def execute(self, provider: str, current_user: CurrentUser) -> OAuthConnect:
         provider_cls = ProviderRegistry()
         concrete_provider_cls = provider_cls.get_provider(provider)
 
@@ -45,7 +36,7 @@ class ConnectIntegrationUseCase(UseCase):
 
         return OAuthConnect.model_validate(oauth_connect)
 
-    def _generate_state(self, current_user: str, provider: str) -> str:
+    def _generate_state(self, current_user: CurrentUser, provider: str) -> str:
         if not self.config.JWT_SECRET_KEY:
             msg = "Missing JWT secret"
             raise ValueError(msg)
@@ -53,7 +44,7 @@ class ConnectIntegrationUseCase(UseCase):
         expiry = datetime.now(UTC) + timedelta(minutes=10)
 
         payload = {
-            "sub": current_user,
+            "sub": current_user.email_address,
             "provider": provider,
             "nonce": secrets.token_urlsafe(16),
             "exp": expiry,
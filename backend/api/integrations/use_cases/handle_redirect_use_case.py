@@ -5,36 +5,30 @@ import jwt
 from api.config import Config
 from api.integrations.providers.provider_registry import ProviderRegistry
 from api.integrations.repositories.integration_repository import IntegrationRepository
+from api.system.interfaces.units_of_work import UnitOfWork
 from api.system.interfaces.use_cases import UseCase
 from api.system.models.models import Integration
 from api.system.schemas.integration import IntegrationStatus, OAuthCallbackData
-from api.users.errors.user_not_found_error import UserNotFoundError
-from api.users.repositories.user_repository import UserRepository
+from api.system.schemas.user import CurrentUser
 
 
 class HandleRedirectUseCase(UseCase):
     def __init__(
         self,
         integration_repository: IntegrationRepository,
-        user_repository: UserRepository,
         config: Config,
+        unit_of_work: UnitOfWork,
     ) -> None:
         self.integration_repository = integration_repository
-        self.user_repository = user_repository
         self.config = config
+        self.unit_of_work = unit_of_work
 
     async def execute(
         self,
         OAuthCallbackData: OAuthCallbackData,  # noqa: N803
         provider: str,
-        current_user: str,
+        current_user: CurrentUser,
     ) -> IntegrationStatus:
-        user = self.user_repository.find_by_email(current_user)
-
-        if user is None:
-            msg = "User not found"
-            raise UserNotFoundError(msg)
-
         provider_cls = ProviderRegistry()
         concrete_provider_cls = provider_cls.get_provider(provider)
 
@@ -49,7 +43,7 @@ class HandleRedirectUseCase(UseCase):
         integration_data = {
             "provider": provider,
             "access_token": token_response["access_token"],
-            "user_id": user.id,
+            "user_id": current_user.id,
         }
 
         optional_fields = [
@@ -72,19 +66,17 @@ class HandleRedirectUseCase(UseCase):
 
         integration = Integration(**integration_data)
 
-        db_integration = self.integration_repository.find_by_user_and_provider(
-            user.id,  # type: ignore  # noqa: PGH003
-            provider,
-        )
-
-        if db_integration is not None:
-            self.integration_repository.delete(db_integration)
-
-        self.integration_repository.add(integration)
+        with self.unit_of_work:
+            self.integration_repository.upsert(integration)
 
         return IntegrationStatus(connected=True)
 
-    def _validate_state(self, state: str, current_user: str, provider: str) -> None:
+    def _validate_state(
+        self,
+        state: str,
+        current_user: CurrentUser,
+        provider: str,
+    ) -> None:
         if not self.config.JWT_SECRET_KEY:
             msg = "Missing JWT secret"
             raise ValueError(msg)
@@ -102,6 +94,6 @@ class HandleRedirectUseCase(UseCase):
         payload_user = payload.get("sub")
         payload_provider = payload.get("provider")
 
-        if payload_user != current_user or payload_provider != provider:
+        if payload_user != current_user.email_address or payload_provider != provider:
             msg = "State mismatch"
             raise ValueError(msg)
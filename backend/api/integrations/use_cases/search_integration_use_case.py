@@ -3,32 +3,26 @@ from typing import Any
 
 from api.integrations.providers.provider_registry import ProviderRegistry
 from api.integrations.repositories.integration_repository import IntegrationRepository
+from api.system.interfaces.units_of_work import UnitOfWork
 from api.system.interfaces.use_cases import AsyncUseCase
-from api.users.errors.user_not_found_error import UserNotFoundError
-from api.users.repositories.user_repository import UserRepository
+from api.system.schemas.user import CurrentUser
 
 
 class SearchIntegrationUseCase(AsyncUseCase):
     def __init__(
         self,
         integration_repository: IntegrationRepository,
-        user_repository: UserRepository,
+        unit_of_work: UnitOfWork,
     ) -> None:
         self.integration_repository = integration_repository
-        self.user_repository = user_repository
+        self.unit_of_work = unit_of_work
 
     async def execute(
         self,
         query: str,
-        current_user: str,
+        current_user: CurrentUser,
         provider: str,
     ) -> dict[str, Any]:
-        user = self.user_repository.find_by_email(current_user)
-
-        if user is None:
-            msg = "User not found"
-            raise UserNotFoundError(msg)
-
         provider_cls = ProviderRegistry()
         concrete_provider_cls = provider_cls.get_provider(provider)
 
@@ -36,7 +30,7 @@ class SearchIntegrationUseCase(AsyncUseCase):
 
         integration = (
             self.integration_repository.retrieve_access_token_for_provider_for_user(
-                user.id,  # type: ignore  # noqa: PGH003
+                current_user.id,
                 provider,
             )
         )
@@ -80,12 +74,13 @@ class SearchIntegrationUseCase(AsyncUseCase):
                     msg = "Linear response missing access_token"
                     raise ValueError(msg)
 
-                self.integration_repository.update_tokens(
-                    integration,
-                    new_access_token,
-                    new_refresh_token,
-                    new_expires_at,
-                )
+                with self.unit_of_work:
+                    self.integration_repository.update_tokens(
+                        integration,
+                        new_access_token,
+                        new_refresh_token,
+                        new_expires_at,
+                    )
 
                 access_token = new_access_token
 
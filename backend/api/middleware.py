@@ -10,8 +10,19 @@ from api.ai.errors.audio_transcription_error import AudioTranscriptionError
 from api.ai.errors.audio_transformation_error import AudioTransformationError
 from api.ai.errors.chat_analysis_error import ChatAnalysisError
 from api.config import config
+from api.events.errors.duplicate_batch_event_error import DuplicateBatchEventError
 from api.events.errors.event_not_found_error import EventNotFoundError
+from api.events.errors.event_version_conflict_error import (
+    EventVersionConflictError,
+)
 from api.events.errors.events_not_found_error import EventsNotFoundError
+from api.events.errors.invalid_event_window_error import InvalidEventWindowError
+from api.events.errors.invalid_exdate_error import InvalidExdateError
+from api.events.errors.invalid_page_cursor_error import InvalidPageCursorError
+from api.events.errors.invalid_recurrence_rule_error import (
+    InvalidRecurrenceRuleError,
+)
+from api.events.errors.invalid_sync_token_error import InvalidSyncTokenError
 from api.events.errors.recurring_event_edit_error import RecurringEventEditError
 from api.users.errors.invalid_credentials_error import InvalidCredentialsError
 from api.users.errors.invalid_token_error import InvalidTokenError
@@ -131,6 +142,76 @@ async def error_handling_middleware(  # noqa: C901, PLR0912
             status_code=404,
             content={"detail": "Events not found"},
         )
+    except InvalidEventWindowError:
+        logger.exception(
+            "Business logic error on %s %s",
+            request.method,
+            request.url.path,
+        )
+        return JSONResponse(
+            status_code=400,
+            content={"detail": "Invalid date window"},
+        )
+    except InvalidPageCursorError:
+        logger.exception(
+            "Business logic error on %s %s",
+            request.method,
+            request.url.path,
+        )
+        return JSONResponse(
+            status_code=400,
+            content={"detail": "Invalid page cursor"},
+        )
+    except InvalidRecurrenceRuleError:
+        logger.exception(
+            "Business logic error on %s %s",
+            request.method,
+            request.url.path,
+        )
+        return JSONResponse(
+            status_code=400,
+            content={"detail": "Recurrence rule is invalid or too frequent"},
+        )
+    except InvalidExdateError:
+        logger.exception(
+            "Business logic error on %s %s",
+            request.method,
+            request.url.path,
+        )
+        return JSONResponse(
+            status_code=400,
+            content={"detail": "Excluded dates are invalid"},
+        )
+    except DuplicateBatchEventError:
+        logger.exception(
+            "Business logic error on %s %s",
+            request.method,
+            request.url.path,
+        )
+        return JSONResponse(
+            status_code=400,
+            content={"detail": "Each event can only be edited once per batch"},
+        )
+    except InvalidSyncTokenError:
+        logger.exception(
+            "Business logic error on %s %s",
+            request.method,
+            request.url.path,
+        )
+        return JSONResponse(
+            status_code=400,
+            content={"detail": "Invalid sync token"},
+        )
+    except EventVersionConflictError:
+        logger.exception(
+            "Business logic error on %s %s",
+            request.method,
+            request.url.path,
+        )
+        return JSONResponse(
+            status_code=409,
+            content={"detail": "Event was changed by another request"},
+        )
     except RecurringEventEditError:
         logger.exception(
             "Business logic error on %s %s",
@@ -0,0 +1,51 @@
+import threading
+import time
+from collections import OrderedDict
+
+from api.system.interfaces.cache_backends import CacheBackend
+
+MAX_ENTRIES: int = 2048
+
+
+class InMemoryCacheBackend(CacheBackend):
+    def __init__(self, max_entries: int = MAX_ENTRIES) -> None:
+        self.max_entries = max_entries
+
+        self._entries: OrderedDict[str, tuple[float | None, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str) -> bytes | None:
+        with self._lock:
+            entry = self._entries.get(key)
+
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+
+            self._entries.move_to_end(key)
+
+            return value
+
+    def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl_seconds: int | None = None,
+    ) -> None:
+        expires_at = None if ttl_seconds is None else time.monotonic() + ttl_seconds
+
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
@@ -0,0 +1,140 @@
+import logging
+import socket
+import threading
+from typing import BinaryIO
+from urllib.parse import unquote, urlparse
+
+from api.system.errors.redis_protocol_error import RedisProtocolError
+from api.system.interfaces.cache_backends import CacheBackend
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PORT: int = 6379
+SOCKET_TIMEOUT_SECONDS: float = 0.25
+
+
+class RedisCacheBackend(CacheBackend):
+    def __init__(
+        self,
+        url: str,
+        timeout_seconds: float = SOCKET_TIMEOUT_SECONDS,
+    ) -> None:
+        parsed = urlparse(url)
+
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or DEFAULT_PORT
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.username = unquote(parsed.username) if parsed.username else None
+        self.database = int(parsed.path.lstrip("/") or 0)
+        self.timeout_seconds = timeout_seconds
+
+        self._local = threading.local()
+
+    def get(self, key: str) -> bytes | None:
+        return self._execute(b"GET", key.encode())  # type: ignore  # noqa: PGH003
+
+    def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl_seconds: int | None = None,
+    ) -> None:
+        command = [b"SET", key.encode(), value]
+
+        if ttl_seconds is not None:
+            command.extend([b"EX", str(ttl_seconds).encode()])
+
+        self._execute(*command)
+
+    def delete(self, key: str) -> None:
+        self._execute(b"DEL", key.encode())
+
+    def _execute(self, *command: bytes) -> bytes | int | None:
+        try:
+            connection, reader = self._connection()
+            connection.sendall(self._encode(command))
+            return self._read_reply(reader)
+        except (OSError, RedisProtocolError):
+            logger.warning("Redis cache unavailable, treating as a miss")
+            self._close()
+            return None
+
+    def _connection(self) -> tuple[socket.socket, BinaryIO]:
+        existing: tuple[socket.socket, BinaryIO] | None = getattr(
+            self._local,
+            "connection",
+            None,
+        )
+
+        if existing is not None:
+            return existing
+
+        connection = socket.create_connection(
+            (self.host, self.port),
+            timeout=self.timeout_seconds,
+        )
+        reader = connection.makefile("rb")
+        self._local.connection = (connection, reader)
+
+        if self.password is not None:
+            credentials = [self.password.encode()]
+            if self.username is not None:
+                credentials.insert(0, self.username.encode())
+            connection.sendall(self._encode([b"AUTH", *credentials]))
+            self._read_reply(reader)
+
+        if self.database:
+            connection.sendall(self._encode([b"SELECT", str(self.database).encode()]))
+            self._read_reply(reader)
+
+        return connection, reader
+
+    def _close(self) -> None:
+        existing: tuple[socket.socket, BinaryIO] | None = getattr(
+            self._local,
+            "connection",
+            None,
+        )
+        self._local.connection = None
+
+        if existing is not None:
+            existing[1].close()
+            existing[0].close()
+
+    @staticmethod
+    def _encode(command: list[bytes] | tuple[bytes, ...]) -> bytes:
+        parts = [b"*%d\r\n" % len(command)]
+        parts.extend(
+            b"$%d\r\n%s\r\n" % (len(argument), argument) for argument in command
+        )
+
+        return b"".join(parts)
+
+    @staticmethod
+    def _read_reply(reader: BinaryIO) -> bytes | int | None:
+        line = reader.readline()
+
+        if not line.endswith(b"\r\n"):
+            msg = "Connection closed"
+            raise RedisProtocolError(msg)
+
+        prefix, payload = line[:1], line[1:-2]
+
+        if prefix == b"+":
+            return payload
+        if prefix == b":":
+            return int(payload)
+        if prefix == b"$":
+            length = int(payload)
+            if length < 0:
+                return None
+            data = reader.read(length + 2)
+            if len(data) != length + 2:
+                msg = "Connection closed"
+                raise RedisProtocolError(msg)
+            return data[:-2]
+        if prefix == b"-":
+            raise RedisProtocolError(payload.decode(errors="replace"))
+
+        msg = f"Unexpected reply prefix {prefix!r}"
+        raise RedisProtocolError(msg)
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+
+
+class CacheBackend(ABC):
+    @abstractmethod
+    def get(self, key: str) -> bytes | None:
+        pass
+
+    @abstractmethod
+    def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl_seconds: int | None = None,
+    ) -> None:
+        pass
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        pass
@@ -1,20 +1,29 @@
 from sqlalchemy import (
+    DDL,
     Boolean,
     Column,
     Date,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
-    Text,
     Time,
+    UniqueConstraint,
 )
+from sqlalchemy.event import listen
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
 Base = declarative_base()
 
+EXDATE_FORMAT = "%Y%m%d"
+
+EVENT_CHANGE_UPSERT = "upsert"
+EVENT_CHANGE_DELETE = "delete"
+EVENT_CHANGE_EXDATE = "exdate"
+
 
 class User(Base):
     __tablename__ = "users"
@@ -26,6 +35,8 @@ class User(Base):
     email_address = Column(String(256), unique=True, index=True)
     password = Column(String(256), nullable=False)
 
+    calendar_version = Column(Integer, nullable=False, default=0, server_default="0")
+
     events = relationship("Event", back_populates="user")
     integrations = relationship("Integration", back_populates="user")
 
@@ -44,13 +55,137 @@ class Event(Base):
     end_time = Column(Time, nullable=False)
 
     rrule = Column(String(512), nullable=True)
-    exdate = Column(Text, nullable=True)
 
     colour = Column(String(256), nullable=False)
 
+    occurrences_until = Column(Date, nullable=True)
+    series_end = Column(Date, nullable=True)
+
+    version = Column(Integer, nullable=False, default=1, server_default="1")
+
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
 
     user = relationship("User", back_populates="events")
+    occurrences = relationship(
+        "EventOccurrence",
+        back_populates="event",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+    )
+    exdates = relationship(
+        "EventExdate",
+        back_populates="event",
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="selectin",
+    )
+
+    @property
+    def exdate(self) -> str | None:
+        if not self.exdates:
+            return None
+
+        return ",".join(
+            sorted(exdate.exdate.strftime(EXDATE_FORMAT) for exdate in self.exdates)
+        )
+
+    __table_args__ = (
+        Index(
+            "ix_events_user_id_series_end_date",
+            "user_id",
+            "series_end",
+            "date",
+        ),
+    )
+
+
+class EventExdate(Base):
+    __tablename__ = "event_exdates"
+
+    event_id = Column(
+        Integer,
+        ForeignKey("events.id", ondelete="CASCADE"),
+        primary_key=True,
+    )
+    exdate = Column(Date, primary_key=True)
+
+    event = relationship("Event", back_populates="exdates")
+
+
+class EventChange(Base):
+    __tablename__ = "event_changes"
+
+    id = Column(Integer, primary_key=True, autoincrement=True)
+
+    event_id = Column(Integer, nullable=False)
+    change_type = Column(String(16), nullable=False)
+    occurrence_date = Column(Date, nullable=True)
+
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+
+    created_at = Column(DateTime, default=func.now())
+
+    __table_args__ = (Index("ix_event_changes_user_id_id", "user_id", "id"),)
+
+
+class EventOccurrence(Base):
+    __tablename__ = "event_occurrences"
+
+    id = Column(Integer, primary_key=True, index=True, autoincrement=True)
+
+    occurrence_date = Column(Date, nullable=False)
+    start_time = Column(Time, nullable=False)
+    end_time = Column(Time, nullable=False)
+
+    event_id = Column(
+        Integer,
+        ForeignKey("events.id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+
+    event = relationship("Event", back_populates="occurrences")
+
+    __table_args__ = (
+        UniqueConstraint("event_id", "occurrence_date"),
+        Index(
+            "ix_event_occurrences_user_id_occurrence_date_start_time",
+            "user_id",
+            "occurrence_date",
+            "start_time",
+            "event_id",
+        ),
+    )
+
+
+OCCURRENCE_TIME_RANGE_DDL: tuple[str, ...] = (
+    "CREATE EXTENSION IF NOT EXISTS btree_gist",
+    """
+    ALTER TABLE event_occurrences ADD COLUMN time_range tsrange
+    GENERATED ALWAYS AS (
+        tsrange(
+            occurrence_date + start_time,
+            CASE
+                WHEN end_time > start_time THEN occurrence_date + end_time
+                ELSE occurrence_date + 1 + end_time
+            END
+        )
+    ) STORED
+    """,
+)
+# The migration builds the index concurrently, so only its name is shared.
+OCCURRENCE_TIME_RANGE_INDEX = "ix_event_occurrences_user_id_time_range"
+
+for statement in (
+    *OCCURRENCE_TIME_RANGE_DDL,
+    f"CREATE INDEX {OCCURRENCE_TIME_RANGE_INDEX} "
+    "ON event_occurrences USING gist (user_id, time_range)",
+):
+    listen(
+        EventOccurrence.__table__,
+        "after_create",
+        DDL(statement).execute_if(dialect="postgresql"),
+    )
 
 
 class Integration(Base):
@@ -75,3 +210,12 @@ class Integration(Base):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
 
     user = relationship("User", back_populates="integrations")
+
+    __table_args__ = (
+        Index(
+            "ix_integrations_user_id_provider",
+            "user_id",
+            "provider",
+            unique=True,
+        ),
+    )
@@ -1,8 +1,9 @@
 from datetime import date as date_type
+from datetime import datetime as datetime_type
 from datetime import time as time_type
 from typing import Annotated
 
-from pydantic import StringConstraints
+from pydantic import Field, StringConstraints
 
 from api.system.schemas.base import FrozenBaseModel
 
@@ -39,15 +40,82 @@ class EventBase(FrozenBaseModel):
 
 class Event(EventBase):
     id: int
+    version: int = 1
+
+
+class EventWithConflicts(Event):
+    conflicts: list[int] | None = None
+
+
+class EventBatch(FrozenBaseModel):
+    events: Annotated[list[EventBase], Field(min_length=1, max_length=500)]
+
+
+class EventBatchResult(FrozenBaseModel):
+    ids: list[int]
+
+
+class ConflictCheck(FrozenBaseModel):
+    check_conflicts: bool = False
 
 
 class GetEvent(FrozenBaseModel):
-    start_date: date_type
-    end_date: date_type
+    start_date: date_type | None = None
+    end_date: date_type | None = None
 
 
 class EventList(FrozenBaseModel):
     events: list[Event]
+    truncated: bool = False
+
+
+class GetEventPage(FrozenBaseModel):
+    start_date: date_type | None = None
+    end_date: date_type | None = None
+    limit: Annotated[int, Field(ge=1, le=1000)] = 200
+    cursor: str | None = None
+
+
+class EventPage(EventList):
+    next_cursor: str | None = None
+
+
+class EventListPayload(FrozenBaseModel):
+    etag: str
+    content: bytes | None = None
+
+
+class GetFreeBusy(FrozenBaseModel):
+    start_date: date_type | None = None
+    end_date: date_type | None = None
+    min_slot_minutes: Annotated[int, Field(ge=1, le=1440)] = 30
+
+
+class TimeInterval(FrozenBaseModel):
+    start: datetime_type
+    end: datetime_type
+
+
+class FreeBusy(FrozenBaseModel):
+    busy: list[TimeInterval]
+    free: list[TimeInterval]
+
+
+class SyncEvents(FrozenBaseModel):
+    sync_token: str | None = None
+
+
+class EventExdateTombstone(FrozenBaseModel):
+    event_id: int
+    date: date_type
+
+
+class EventSync(FrozenBaseModel):
+    events: list[Event]
+    deleted: list[int]
+    exdates: list[EventExdateTombstone]
+    sync_token: str
+    has_more: bool = False
 
 
 class DeleteEvent(FrozenBaseModel):
@@ -86,6 +154,20 @@ class EditEvent(FrozenBaseModel):
     previous_start_time: time_type | None = None
     previous_end_time: time_type | None = None
 
+    version: int | None = None
+
+
+class EventEdit(EditEvent):
+    event_id: int
+
+
+class EventBatchEdit(FrozenBaseModel):
+    events: Annotated[list[EventEdit], Field(min_length=1, max_length=500)]
+
+
+class EventBatchDelete(FrozenBaseModel):
+    events: Annotated[list[DeleteEvent], Field(min_length=1, max_length=500)]
+
 
 class ImportReport(FrozenBaseModel):
     imported_count: int = 0
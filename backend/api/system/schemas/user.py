@@ -58,3 +58,11 @@ class AccessToken(FrozenBaseModel):
         str,
         StringConstraints(strip_whitespace=True, max_length=4096),
     ]
+
+
+class CurrentUser(FrozenBaseModel):
+    id: int
+
+    first_name: str
+    last_name: str
+    email_address: str
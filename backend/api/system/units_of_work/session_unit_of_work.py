@@ -0,0 +1,15 @@
+from sqlalchemy.orm import Session
+
+from api.system.interfaces.units_of_work import UnitOfWork
+
+
+class SessionUnitOfWork(UnitOfWork):
+    def __init__(self, db: Session) -> None:
+        super().__init__()
+        self.db = db
+
+    def commit(self) -> None:
+        self.db.commit()
+
+    def rollback(self) -> None:
+        self.db.rollback()
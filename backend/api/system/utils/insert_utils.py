@@ -0,0 +1,14 @@
+from typing import Any
+
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.orm import Session
+
+
+def insert_for_dialect(
+    db: Session,
+    table: Any,  # noqa: ANN401
+) -> postgresql.Insert | sqlite.Insert:
+    if db.get_bind().dialect.name == "postgresql":
+        return postgresql.insert(table)
+
+    return sqlite.insert(table)
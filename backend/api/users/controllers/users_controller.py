@@ -14,6 +14,7 @@ from api.config import config
 from api.dependencies import get_current_user
 from api.system.schemas.user import (
     AccessToken,
+    CurrentUser,
     EditUser,
     User,
     UserBase,
@@ -117,7 +118,7 @@ def refresh_access_token(
 def edit_user(
     request: EditUser,
     edit_user_use_case: Annotated[EditUserUseCase, Depends(edit_user_use_case)],
-    current_user: Annotated[str, Depends(get_current_user)],
+    current_user: Annotated[CurrentUser, Depends(get_current_user)],
     password_validator: Annotated[PasswordValidator, Depends(get_password_validator)],
 ) -> UserBase:
     if request.password is not None:
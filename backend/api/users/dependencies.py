@@ -3,7 +3,12 @@ from typing import Annotated
 from fastapi import Depends
 
 from api.config import Config
-from api.dependencies import UserRepository, get_user_repository
+from api.dependencies import (
+    UnitOfWork,
+    UserRepository,
+    get_unit_of_work,
+    get_user_repository,
+)
 from api.services.email_service import EmailService
 from api.users.hashers.bcrypt_hasher import BCryptHasher
 from api.users.use_cases.edit_user_use_case import EditUserUseCase
@@ -33,8 +38,14 @@ def register_user_use_case(
     user_repository: Annotated[UserRepository, Depends(get_user_repository)],
     bcrypt_hasher: Annotated[BCryptHasher, Depends(get_bcrypt_hasher)],
     email_service: Annotated[EmailService, Depends(get_email_service)],
+    unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
 ) -> RegisterUserUseCase:
-    return RegisterUserUseCase(user_repository, bcrypt_hasher, email_service)
+    return RegisterUserUseCase(
+        user_repository,
+        bcrypt_hasher,
+        email_service,
+        unit_of_work,
+    )
 
 
 def login_user_use_case(
@@ -48,11 +59,13 @@ def login_user_use_case(
 def edit_user_use_case(
     user_repository: Annotated[UserRepository, Depends(get_user_repository)],
     bcrypt_hasher: Annotated[BCryptHasher, Depends(get_bcrypt_hasher)],
+    unit_of_work: Annotated[UnitOfWork, Depends(get_unit_of_work)],
 ) -> EditUserUseCase:
-    return EditUserUseCase(user_repository, bcrypt_hasher)
+    return EditUserUseCase(user_repository, bcrypt_hasher, unit_of_work)
 
 
 def refresh_access_token_use_case(
+    user_repository: Annotated[UserRepository, Depends(get_user_repository)],
     config: Annotated[Config, Depends(Config)],
 ) -> RefreshAccessTokenUseCase:
-    return RefreshAccessTokenUseCase(config)
+    return RefreshAccessTokenUseCase(user_repository, config)
@@ -3,6 +3,14 @@ from sqlalchemy.orm import Session
 from api.system.interfaces.repositories import Repository
 from api.system.models.models import User
 from api.system.schemas.user import EditUser
+from api.system.utils.insert_utils import insert_for_dialect
+
+USER_COLUMNS: tuple[str, ...] = (
+    "first_name",
+    "last_name",
+    "email_address",
+    "password",
+)
 
 
 class UserRepository(Repository):
@@ -11,9 +19,15 @@ class UserRepository(Repository):
 
     def add(self, entity: User) -> None:
         self.db.add(entity)
-        self.db.commit()
+        self.db.flush()
 
-        self.db.refresh(entity)
+    def add_if_absent(self, entity: User) -> User | None:
+        return self.db.scalars(
+            insert_for_dialect(self.db, User)
+            .values({column: getattr(entity, column) for column in USER_COLUMNS})
+            .on_conflict_do_nothing(index_elements=[User.email_address])
+            .returning(User),
+        ).first()
 
     def find_by_id(self, entity_id: int) -> User | None:
         return self.db.query(User).filter_by(id=entity_id).first()
@@ -34,11 +48,19 @@ class UserRepository(Repository):
                 elif key != "password":
                     setattr(entity, key, value)
 
-        self.db.commit()
-        self.db.refresh(entity)
+        self.db.flush()
 
         return entity
 
+    def get_calendar_version(self, entity_id: int) -> int | None:
+        return self.db.query(User.calendar_version).filter_by(id=entity_id).scalar()
+
+    def bump_calendar_version(self, entity_id: int) -> None:
+        self.db.query(User).filter_by(id=entity_id).update(
+            {User.calendar_version: User.calendar_version + 1},
+            synchronize_session=False,
+        )
+
     def delete(self, entity: User) -> None:
         self.db.delete(entity)
-        self.db.commit()
+        self.db.flush()
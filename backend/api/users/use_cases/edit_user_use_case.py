@@ -1,4 +1,6 @@
+from api.system.interfaces.units_of_work import UnitOfWork
 from api.system.interfaces.use_cases import UseCase
+from api.system.schemas.user import CurrentUser
 from api.system.schemas.user import EditUser as EditUserSchema
 from api.system.schemas.user import UserBase as UserBaseSchema
 from api.users.errors.user_not_found_error import UserNotFoundError
@@ -11,16 +13,18 @@ class EditUserUseCase(UseCase):
         self,
         user_repository: UserRepository,
         bcrypt_hasher: BCryptHasher,
+        unit_of_work: UnitOfWork,
     ) -> None:
         self.user_repository = user_repository
         self.bcrypt_hasher = bcrypt_hasher
+        self.unit_of_work = unit_of_work
 
     def execute(
         self,
         request: EditUserSchema,
-        current_user: str,
+        current_user: CurrentUser,
     ) -> UserBaseSchema:
-        user = self.user_repository.find_by_email(current_user)
+        user = self.user_repository.find_by_id(current_user.id)
 
         if user is None:
             msg = "User not found"
@@ -30,7 +34,8 @@ class EditUserUseCase(UseCase):
         if request.password is not None:
             hashed_password = self.bcrypt_hasher.hash(request.password)
 
-        self.user_repository.edit(user, request, hashed_password)
+        with self.unit_of_work:
+            self.user_repository.edit(user, request, hashed_password)
 
         user_base = UserBaseSchema(
             first_name=str(user.first_name),
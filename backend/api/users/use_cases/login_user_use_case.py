@@ -5,11 +5,13 @@ from fastapi.security import OAuth2PasswordRequestForm
 
 from api.config import Config
 from api.system.interfaces.use_cases import UseCase
+from api.system.models.models import User
 from api.system.schemas.user import UserWithToken
 from api.users.errors.invalid_credentials_error import InvalidCredentialsError
 from api.users.errors.user_not_found_error import UserNotFoundError
 from api.users.hashers.bcrypt_hasher import BCryptHasher
 from api.users.repositories.user_repository import UserRepository
+from api.users.utils.token_utils import access_token_claims
 
 
 class LoginUserUseCase(UseCase):
@@ -34,7 +36,7 @@ class LoginUserUseCase(UseCase):
             msg = "Invalid Credentials provided."
             raise InvalidCredentialsError(msg)
 
-        access_token = self.create_access_token(str(user.email_address))
+        access_token = self.create_access_token(user)
         refresh_token = self.create_refresh_token(str(user.email_address))
 
         return UserWithToken(
@@ -46,15 +48,9 @@ class LoginUserUseCase(UseCase):
             email_address=str(user.email_address),
         )
 
-    def create_access_token(self, subject: str) -> str:
-        expire = datetime.now(UTC) + timedelta(
-            seconds=self.config.JWT_ACCESS_TOKEN_EXPIRE_SECONDS,
-        )
-
-        expiry_and_subject = {"exp": expire, "sub": str(subject)}
-
+    def create_access_token(self, user: User) -> str:
         return jwt.encode(
-            expiry_and_subject,
+            access_token_claims(user, self.config.JWT_ACCESS_TOKEN_EXPIRE_SECONDS),
             self.config.JWT_SECRET_KEY,  # type: ignore  # noqa: PGH003
             algorithm=self.config.JWT_ALGORITHM,
         )
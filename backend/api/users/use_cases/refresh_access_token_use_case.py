@@ -1,15 +1,16 @@
-from datetime import UTC, datetime, timedelta
-
 import jwt
 
 from api.config import Config
 from api.system.interfaces.use_cases import UseCase
 from api.system.schemas.user import AccessToken
 from api.users.errors.refresh_token_error import RefreshTokenError
+from api.users.repositories.user_repository import UserRepository
+from api.users.utils.token_utils import access_token_claims
 
 
 class RefreshAccessTokenUseCase(UseCase):
-    def __init__(self, config: Config) -> None:
+    def __init__(self, user_repository: UserRepository, config: Config) -> None:
+        self.user_repository = user_repository
         self.config = config
 
     def execute(self, refresh_token: str) -> AccessToken:
@@ -29,12 +30,14 @@ class RefreshAccessTokenUseCase(UseCase):
             msg = "Invalid refresh token"
             raise RefreshTokenError(msg)
 
-        exp = datetime.now(UTC) + timedelta(
-            seconds=self.config.JWT_ACCESS_TOKEN_EXPIRE_SECONDS,
-        )
+        user = self.user_repository.find_by_email(subject)
+
+        if user is None:
+            msg = "Invalid refresh token"
+            raise RefreshTokenError(msg)
 
         access_token = jwt.encode(
-            {"sub": subject, "exp": exp},
+            access_token_claims(user, self.config.JWT_ACCESS_TOKEN_EXPIRE_SECONDS),
             self.config.JWT_SECRET_KEY,
             algorithm=self.config.JWT_ALGORITHM,
         )
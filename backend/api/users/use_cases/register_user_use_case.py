@@ -1,6 +1,7 @@
 from fastapi import BackgroundTasks
 
 from api.services.email_service import EmailService
+from api.system.interfaces.units_of_work import UnitOfWork
 from api.system.interfaces.use_cases import UseCase
 from api.system.models.models import User
 from api.system.schemas.user import User as UserSchema
@@ -16,20 +17,18 @@ class RegisterUserUseCase(UseCase):
         user_repository: UserRepository,
         bcrypt_hasher: BCryptHasher,
         email_service: EmailService,
+        unit_of_work: UnitOfWork,
     ) -> None:
         self.user_repository = user_repository
         self.bcrypt_hasher = bcrypt_hasher
         self.email_service = email_service
+        self.unit_of_work = unit_of_work
 
     def execute(
         self,
         request: UserDetails,
         background_tasks: BackgroundTasks,
     ) -> UserSchema:
-        if self.user_repository.find_by_email(request.email_address):
-            msg = "User already exists."
-            raise UserAlreadyExistsError(msg)
-
         hashed_password = self.bcrypt_hasher.hash(request.password)
 
         user = User(
@@ -39,10 +38,16 @@ class RegisterUserUseCase(UseCase):
             password=hashed_password,
         )
 
-        self.user_repository.add(user)
+        with self.unit_of_work:
+            created = self.user_repository.add_if_absent(user)
+
+            if created is None:
+                msg = "User already exists."
+                raise UserAlreadyExistsError(msg)
+
         background_tasks.add_task(
             self.email_service.send_welcome_email,
-            str(user.email_address),
+            str(created.email_address),
         )
 
-        return user
+        return created
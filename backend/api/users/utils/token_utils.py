@@ -0,0 +1,29 @@
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+from pydantic import ValidationError
+
+from api.system.models.models import User
+from api.system.schemas.user import CurrentUser
+
+
+def access_token_claims(user: User, expires_in_seconds: int) -> dict[str, Any]:
+    return {
+        "exp": datetime.now(UTC) + timedelta(seconds=expires_in_seconds),
+        "sub": str(user.email_address),
+        "user_id": user.id,
+        "first_name": str(user.first_name),
+        "last_name": str(user.last_name),
+    }
+
+
+def current_user_from_claims(payload: dict[str, Any]) -> CurrentUser | None:
+    try:
+        return CurrentUser(
+            id=payload.get("user_id"),  # type: ignore  # noqa: PGH003
+            email_address=payload.get("sub"),  # type: ignore  # noqa: PGH003
+            first_name=payload.get("first_name"),  # type: ignore  # noqa: PGH003
+            last_name=payload.get("last_name"),  # type: ignore  # noqa: PGH003
+        )
+    except ValidationError:
+        return None
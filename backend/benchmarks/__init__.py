@@ -0,0 +1,13 @@
+import os
+import tempfile
+from pathlib import Path
+
+os.environ.setdefault(
+    "ALLOCATE_DATABASE",
+    f"sqlite:///{Path(tempfile.mkdtemp()) / 'benchmark.db'}",
+)
+os.environ.setdefault("ALLOCATE_JWT_SECRET_KEY", "benchmark-secret-key-" * 2)
+os.environ.setdefault("ALLOCATE_JWT_REFRESH_KEY", "benchmark-refresh-key-" * 2)
+
+# Time the list query itself rather than the calendar response cache.
+os.environ.setdefault("ALLOCATE_CALENDAR_CACHE_TTL_SECONDS", "0")
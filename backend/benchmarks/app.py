@@ -0,0 +1,34 @@
+import gc
+import logging
+
+from fastapi.testclient import TestClient
+
+from api import create_app
+
+logging.disable(logging.CRITICAL)
+
+client = TestClient(create_app())
+# The app freezes its startup objects in lifespan, which TestClient only runs
+# as a context manager. Freeze here instead of starting the horizon job.
+gc.freeze()
+
+
+def login(email_address: str = "benchmark@example.com") -> dict[str, str]:
+    password = "benchmark-password"  # noqa: S105
+
+    client.post(
+        "/api/v1/users",
+        json={
+            "first_name": "Bench",
+            "last_name": "Mark",
+            "email_address": email_address,
+            "password": password,
+        },
+    )
+    response = client.post(
+        "/api/v1/users/login",
+        data={"username": email_address, "password": password},
+    )
+    response.raise_for_status()
+
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
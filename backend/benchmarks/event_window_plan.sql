@@ -0,0 +1,53 @@
+-- Plan check for the events window queries.
+--
+-- Run against a scratch Postgres database migrated to head:
+--
+--   alembic upgrade head
+--   psql -d <scratch> -f benchmarks/event_window_plan.sql
+--
+-- Loads 500 users with 1,500 events each (mostly in the past, plus open-ended
+-- and finished weekly series) and prints the plan of the list query issued by
+-- EventRepository.get_events.
+
+INSERT INTO users (first_name, last_name, email_address, password)
+SELECT 'Bench', 'User', 'bench' || g || '@example.com', 'x'
+FROM generate_series(1, 500) g;
+
+INSERT INTO events (
+    title, description, location, date, start_time, end_time, colour,
+    series_end, occurrences_until, user_id
+)
+SELECT 'Meeting ' || e, repeat('notes ', 20), 'Room ' || (e % 9), d,
+       '09:00', '10:00', '#aabbcc', d, d, u
+FROM generate_series(1, 500) u, generate_series(1, 1400) e,
+     LATERAL (SELECT date '2026-10-18' - 1825 + ((e * 7919 + u) % 2190) AS d) x;
+
+INSERT INTO events (
+    title, description, location, date, start_time, end_time, colour, rrule,
+    series_end, user_id
+)
+SELECT 'Weekly ' || e, repeat('agenda ', 20), 'Room 1',
+       date '2026-10-18' - ((e * 37 + u) % 1500), '11:00', '11:30', '#ccbbaa',
+       'FREQ=WEEKLY', NULL, u
+FROM generate_series(1, 500) u, generate_series(1, 40) e;
+
+INSERT INTO events (
+    title, description, location, date, start_time, end_time, colour, rrule,
+    series_end, user_id
+)
+SELECT 'Course ' || e, repeat('syllabus ', 20), 'Room 2', d, '14:00', '15:00',
+       '#bbccaa', 'FREQ=WEEKLY;COUNT=10', d + 63, u
+FROM generate_series(1, 500) u, generate_series(1, 60) e,
+     LATERAL (SELECT date '2026-10-18' - 1500 + ((e * 53 + u) % 1200) AS d) x;
+
+VACUUM ANALYZE events;
+
+SELECT min(id) + 249 AS user_id FROM users WHERE email_address LIKE 'bench%' \gset
+
+EXPLAIN (ANALYZE, BUFFERS, COSTS OFF, SUMMARY OFF)
+SELECT id, title, description, location, date, start_time, end_time, colour,
+       rrule, version
+FROM events
+WHERE user_id = :user_id
+  AND date <= '2026-10-18'
+  AND (series_end >= '2026-10-12' OR series_end IS NULL);
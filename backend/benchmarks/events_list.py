@@ -0,0 +1,195 @@
+"""Time GET /api/v1/events on a materialized and an expanded window.
+
+Each window is also rendered through the previous path, which loaded ORM
+events, built a Pydantic Event per instance and serialized an EventList
+the way response_model did. That path is timed without the HTTP stack,
+so its figures slightly understate it.
+
+Run from backend/ against a scratch database (SQLite by default):
+
+    python -m benchmarks.events_list
+"""
+
+import json
+import time as clock
+from datetime import date, time, timedelta
+
+from sqlalchemy import or_
+from sqlalchemy.orm import Session
+
+from api.database import SessionLocal
+from api.events.repositories.event_occurrence_repository import (
+    EventOccurrenceRepository,
+)
+from api.events.services.occurrence_service import OccurrenceService
+from api.events.utils.recurrence_utils import expand_occurrence_dates, is_recurring
+from api.system.models.models import Event, EventOccurrence, User
+from api.system.schemas import event as schemas
+from benchmarks.app import client, login
+
+SERIES = 150
+ONE_OFF_EVENTS = 1_000
+REQUESTS = 10
+
+
+def seed(today: date) -> None:
+    db = SessionLocal()
+    user_id = db.query(User.id).scalar()
+
+    events = [
+        Event(
+            title=f"Series {i}",
+            description="Weekly sync",
+            location="Room 1",
+            date=today - timedelta(days=i),
+            start_time=time(9),
+            end_time=time(10),
+            colour="#aabbcc",
+            rrule="FREQ=WEEKLY;BYDAY=MO,WE,FR",
+            user_id=user_id,
+        )
+        for i in range(SERIES)
+    ]
+    events += [
+        Event(
+            title=f"Event {i}",
+            date=today + timedelta(days=i % 300),
+            start_time=time(9),
+            end_time=time(10),
+            colour="#aabbcc",
+            rrule="DNR",
+            user_id=user_id,
+        )
+        for i in range(ONE_OFF_EVENTS)
+    ]
+    db.add_all(events)
+    db.commit()
+
+    occurrence_service = OccurrenceService(EventOccurrenceRepository(db))
+    for event in events:
+        occurrence_service.materialize(event)
+    db.commit()
+
+    db.close()
+
+
+def render_previous(
+    db: Session,
+    user_id: int,
+    start_date: date,
+    end_date: date,
+    expanded_dates: dict[int, list[date]],
+) -> bytes:
+    if end_date <= OccurrenceService.read_horizon():
+        events = [
+            schemas.Event.model_validate(event)
+            if occurrence.occurrence_date == event.date
+            else schemas.Event(
+                id=event.id,
+                title=event.title,
+                description=event.description,
+                location=event.location,
+                date=occurrence.occurrence_date,
+                start_time=occurrence.start_time,
+                end_time=occurrence.end_time,
+                colour=event.colour,
+                repeated=True,
+            )
+            for occurrence, event in db.query(EventOccurrence, Event)
+            .join(Event, EventOccurrence.event_id == Event.id)
+            .filter(
+                EventOccurrence.user_id == user_id,
+                EventOccurrence.occurrence_date >= start_date,
+                EventOccurrence.occurrence_date <= end_date,
+            )
+        ]
+    else:
+        events = []
+
+        for event in db.query(Event).filter(
+            Event.user_id == user_id,
+            Event.date <= end_date,
+            or_(Event.series_end >= start_date, Event.series_end.is_(None)),
+        ):
+            if start_date <= event.date <= end_date:
+                events.append(schemas.Event.model_validate(event))
+
+            if is_recurring(event.rrule):
+                # The previous path cached expansions per series, so only the
+                # first request pays for dateutil.
+                if event.id not in expanded_dates:
+                    expanded_dates[event.id] = expand_occurrence_dates(
+                        event,
+                        start_date,
+                        end_date,
+                    )
+                events.extend(
+                    schemas.Event(
+                        id=event.id,
+                        title=event.title,
+                        description=event.description,
+                        location=event.location,
+                        date=occurrence_date,
+                        start_time=event.start_time,
+                        end_time=event.end_time,
+                        colour=event.colour,
+                        repeated=True,
+                    )
+                    for occurrence_date in expanded_dates[event.id]
+                )
+
+    event_list = schemas.EventList(events=events)
+
+    return json.dumps(
+        event_list.model_dump(mode="json"),
+        ensure_ascii=False,
+        separators=(",", ":"),
+    ).encode()
+
+
+def main() -> None:
+    headers = login()
+    today = date.today()  # noqa: DTZ011
+    seed(today)
+
+    db = SessionLocal()
+    user_id = db.query(User.id).scalar()
+
+    windows = {
+        "materialized": (today, today + timedelta(days=180)),
+        "expanded": (today + timedelta(days=200), today + timedelta(days=560)),
+    }
+
+    for label, (start_date, end_date) in windows.items():
+        params = {"start_date": str(start_date), "end_date": str(end_date)}
+        response = client.get("/api/v1/events", headers=headers, params=params)
+        instances = len(response.json()["events"])
+
+        started = clock.perf_counter()
+        for _ in range(REQUESTS):
+            client.get("/api/v1/events", headers=headers, params=params)
+        elapsed = (clock.perf_counter() - started) / REQUESTS
+
+        print(f"{label}: {instances} instances, {elapsed * 1000:.0f} ms/request")
+
+        expanded_dates: dict[int, list[date]] = {}
+        previous = render_previous(db, user_id, start_date, end_date, expanded_dates)
+        instances = len(json.loads(previous)["events"])
+
+        started = clock.perf_counter()
+        for _ in range(REQUESTS):
+            # Each request used a fresh session, so load every event again.
+            db.expunge_all()
+            render_previous(db, user_id, start_date, end_date, expanded_dates)
+        elapsed = (clock.perf_counter() - started) / REQUESTS
+
+        print(
+            f"{label} (previous): {instances} instances, "
+            f"{elapsed * 1000:.0f} ms/request",
+        )
+
+    db.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""Measure the memory and time spent on expanded recurring rows.
+
+Seeds 50 weekly series and lists a five-year window past the read horizon,
+so every instance comes from the expansion path. Run from backend/:
+
+    python -m benchmarks.expanded_rows_memory
+"""
+
+import gc
+import time as clock
+import tracemalloc
+from datetime import date, timedelta
+
+from api.database import SessionLocal
+from api.dependencies import (
+    get_calendar_cache,
+    get_recurrence_cache,
+    get_recurrence_metrics,
+)
+from api.events.repositories.event_occurrence_repository import (
+    EventOccurrenceRepository,
+)
+from api.events.repositories.event_repository import EventRepository
+from api.events.use_cases.get_events_for_user_use_case import (
+    GetEventsForUserUseCase,
+)
+from api.events.utils.event_rows import render_event_list
+from api.system.models.models import User
+from api.users.repositories.user_repository import UserRepository
+from benchmarks.app import client, login
+
+SERIES = 50
+REQUESTS = 10
+
+
+def seed(headers: dict[str, str], today: date) -> None:
+    for i in range(SERIES):
+        response = client.post(
+            "/api/v1/events",
+            headers=headers,
+            json={
+                "title": f"Weekly {i}",
+                "description": "Standup notes " * 4,
+                "location": "Room 1",
+                "date": str(today + timedelta(days=i % 7)),
+                "start_time": "09:00:00",
+                "end_time": "10:00:00",
+                "colour": "#aabbcc",
+                "rrule": "FREQ=WEEKLY",
+            },
+        )
+        response.raise_for_status()
+
+
+def main() -> None:
+    headers = login()
+    today = date.today()  # noqa: DTZ011
+    seed(headers, today)
+
+    db = SessionLocal()
+    user_id = db.query(User.id).scalar()
+    use_case = GetEventsForUserUseCase(
+        EventRepository(db),
+        UserRepository(db),
+        get_recurrence_cache(),
+        get_calendar_cache(),
+        EventOccurrenceRepository(db),
+        get_recurrence_metrics(),
+    )
+    start_date = today + timedelta(days=400)
+    end_date = start_date + timedelta(days=365 * 5)
+
+    # Warm the query and the recurrence cache before measuring.
+    use_case._get_expanded_events(user_id, start_date, end_date)  # noqa: SLF001
+
+    gc.collect()
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    rows, _ = use_case._get_expanded_events(user_id, start_date, end_date)  # noqa: SLF001
+    after = tracemalloc.take_snapshot()
+    render_event_list(rows)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+
+    stats = after.compare_to(before, "filename")
+    retained = sum(stat.size_diff for stat in stats)
+    blocks = sum(stat.count_diff for stat in stats)
+    instances = len(rows)
+    del rows
+
+    expanded = rendered = 0.0
+    for _ in range(REQUESTS):
+        started = clock.perf_counter()
+        rows, _ = use_case._get_expanded_events(user_id, start_date, end_date)  # noqa: SLF001
+        expanded += clock.perf_counter() - started
+
+        started = clock.perf_counter()
+        render_event_list(rows)
+        rendered += clock.perf_counter() - started
+        del rows
+
+    db.close()
+
+    print(f"instances: {instances}")
+    print(
+        f"retained by rows: {retained / 1024:.0f} KiB "
+        f"({retained / instances:.0f} B/instance)",
+    )
+    print(f"allocated blocks: {blocks / instances:.2f} per instance")
+    print(f"peak incl. render: {peak / 1024 / 1024:.1f} MB")
+    print(
+        f"expand / render: {expanded * 1000 / REQUESTS:.1f} / "
+        f"{rendered * 1000 / REQUESTS:.1f} ms",
+    )
+
+
+if __name__ == "__main__":
+    main()
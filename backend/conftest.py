@@ -0,0 +1,10 @@
+import os
+import tempfile
+from pathlib import Path
+
+os.environ.setdefault(
+    "ALLOCATE_DATABASE",
+    f"sqlite:///{Path(tempfile.mkdtemp()) / 'allocate.db'}",
+)
+os.environ.setdefault("ALLOCATE_JWT_SECRET_KEY", "test-secret-key-" * 2)
+os.environ.setdefault("ALLOCATE_JWT_REFRESH_KEY", "test-refresh-key-" * 2)
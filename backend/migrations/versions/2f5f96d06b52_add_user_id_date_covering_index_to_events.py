@@ -0,0 +1,47 @@
+"""add user_id date covering index to events
+
+Revision ID: 2f5f96d06b52
+Revises: 71a6360c0a2a
+Create Date: 2026-10-18 09:12:41.318207
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "2f5f96d06b52"
+down_revision: Union[str, Sequence[str], None] = "71a6360c0a2a"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_events_user_id_date_covering",
+            "events",
+            ["user_id", "date"],
+            postgresql_include=[
+                "id",
+                "title",
+                "start_time",
+                "end_time",
+                "colour",
+                "rrule",
+            ],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_events_user_id_date_covering",
+            table_name="events",
+            postgresql_concurrently=True,
+        )
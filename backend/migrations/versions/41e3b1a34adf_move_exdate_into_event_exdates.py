@@ -0,0 +1,95 @@
+"""move exdate into event exdates
+
+Revision ID: 41e3b1a34adf
+Revises: 6ffc40de57e2
+Create Date: 2026-10-18 10:48:53.207731
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from dateutil import parser as date_parser
+
+
+# revision identifiers, used by Alembic.
+revision: str = "41e3b1a34adf"
+down_revision: Union[str, Sequence[str], None] = "6ffc40de57e2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+EXDATE_FORMAT = "%Y%m%d"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "event_exdates",
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("exdate", sa.Date(), nullable=False),
+        sa.ForeignKeyConstraint(["event_id"], ["events.id"], ondelete="CASCADE"),
+        sa.PrimaryKeyConstraint("event_id", "exdate"),
+    )
+
+    connection = op.get_bind()
+    event_exdates = sa.table(
+        "event_exdates",
+        sa.column("event_id", sa.Integer()),
+        sa.column("exdate", sa.Date()),
+    )
+
+    rows = connection.execute(
+        sa.text("SELECT id, exdate FROM events WHERE exdate IS NOT NULL")
+    ).fetchall()
+
+    for row in rows:
+        exdates = {
+            date_parser.parse(entry).date()
+            for entry in row.exdate.split(",")
+            if entry.strip()
+        }
+
+        if exdates:
+            op.bulk_insert(
+                event_exdates,
+                [{"event_id": row.id, "exdate": exdate} for exdate in sorted(exdates)],
+            )
+
+    op.drop_column("events", "exdate")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column("events", sa.Column("exdate", sa.Text(), nullable=True))
+
+    connection = op.get_bind()
+    events = sa.table(
+        "events",
+        sa.column("id", sa.Integer()),
+        sa.column("exdate", sa.Text()),
+    )
+
+    rows = connection.execute(
+        sa.text(
+            "SELECT event_id, exdate FROM event_exdates ORDER BY event_id, exdate"
+        ).columns(
+            sa.column("event_id", sa.Integer()),
+            sa.column("exdate", sa.Date()),
+        )
+    ).fetchall()
+
+    exdates_by_event: dict[int, list[str]] = {}
+    for row in rows:
+        exdates_by_event.setdefault(row.event_id, []).append(
+            row.exdate.strftime(EXDATE_FORMAT)
+        )
+
+    for event_id, exdates in exdates_by_event.items():
+        connection.execute(
+            events.update()
+            .where(events.c.id == event_id)
+            .values(exdate=",".join(exdates))
+        )
+
+    op.drop_table("event_exdates")
@@ -0,0 +1,32 @@
+"""add calendar version to users
+
+Revision ID: 5560b867aa3b
+Revises: 41e3b1a34adf
+Create Date: 2026-10-18 11:36:04.512893
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5560b867aa3b"
+down_revision: Union[str, Sequence[str], None] = "41e3b1a34adf"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "users",
+        sa.Column("calendar_version", sa.Integer(), server_default="0", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("users", "calendar_version")
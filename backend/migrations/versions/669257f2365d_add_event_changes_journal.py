@@ -0,0 +1,46 @@
+"""add event changes journal
+
+Revision ID: 669257f2365d
+Revises: 5560b867aa3b
+Create Date: 2026-10-18 12:14:37.906215
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "669257f2365d"
+down_revision: Union[str, Sequence[str], None] = "5560b867aa3b"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "event_changes",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("change_type", sa.String(length=16), nullable=False),
+        sa.Column("occurrence_date", sa.Date(), nullable=True),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_event_changes_user_id_id",
+        "event_changes",
+        ["user_id", "id"],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_event_changes_user_id_id", table_name="event_changes")
+    op.drop_table("event_changes")
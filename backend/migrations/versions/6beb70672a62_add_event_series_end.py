@@ -0,0 +1,112 @@
+"""add event series end
+
+Revision ID: 6beb70672a62
+Revises: 8d2c5a9e71f4
+Create Date: 2026-10-18 18:21:47.306215
+
+"""
+
+from datetime import UTC, date, datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from dateutil import parser as date_parser
+from dateutil.rrule import rrulestr
+
+from api.events.utils.recurrence_utils import MAX_SERIES_INSTANCES
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6beb70672a62"
+down_revision: Union[str, Sequence[str], None] = "8d2c5a9e71f4"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def _series_end(row) -> date | None:
+    parts = dict(
+        part.partition("=")[::2]
+        for part in row.rrule.strip().upper().removeprefix("RRULE:").split(";")
+    )
+
+    try:
+        if "UNTIL" in parts:
+            return max(date_parser.parse(parts["UNTIL"]).date(), row.date)
+
+        if "COUNT" not in parts:
+            return None
+
+        # Leave oversized series open-ended, as the runtime guard does,
+        # rather than expanding them all inside the migration.
+        if int(parts["COUNT"]) > MAX_SERIES_INSTANCES:
+            return None
+
+        dtstart = datetime.combine(row.date, row.start_time).replace(tzinfo=UTC)
+        occurrences = list(rrulestr(row.rrule, dtstart=dtstart))
+    except (ValueError, TypeError, OverflowError):
+        return None
+
+    return max(occurrences[-1].date(), row.date) if occurrences else row.date
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column("events", sa.Column("series_end", sa.Date(), nullable=True))
+
+    op.execute(
+        """
+        UPDATE events SET series_end = date
+        WHERE rrule IS NULL OR rrule = 'DNR'
+        """
+    )
+
+    connection = op.get_bind()
+
+    series = connection.execute(
+        sa.text(
+            """
+            SELECT id, date, start_time, rrule
+            FROM events
+            WHERE rrule IS NOT NULL AND rrule != 'DNR'
+              AND (rrule LIKE '%COUNT=%' OR rrule LIKE '%UNTIL=%')
+            """
+        ).columns(
+            sa.column("id", sa.Integer()),
+            sa.column("date", sa.Date()),
+            sa.column("start_time", sa.Time()),
+            sa.column("rrule", sa.String()),
+        )
+    ).fetchall()
+
+    events = sa.table(
+        "events",
+        sa.column("id", sa.Integer()),
+        sa.column("series_end", sa.Date()),
+    )
+
+    for row in series:
+        connection.execute(
+            events.update()
+            .where(events.c.id == row.id)
+            .values(series_end=_series_end(row))
+        )
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_events_user_id_series_end",
+            "events",
+            ["user_id", "series_end"],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_events_user_id_series_end",
+            table_name="events",
+            postgresql_concurrently=True,
+        )
+    op.drop_column("events", "series_end")
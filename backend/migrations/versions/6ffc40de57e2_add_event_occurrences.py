@@ -0,0 +1,179 @@
+"""add event occurrences
+
+Revision ID: 6ffc40de57e2
+Revises: 2f5f96d06b52
+Create Date: 2026-10-18 10:02:17.845512
+
+"""
+
+from datetime import UTC, date, datetime, timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from dateutil import parser as date_parser
+from dateutil.rrule import rrulestr
+
+
+# revision identifiers, used by Alembic.
+revision: str = "6ffc40de57e2"
+down_revision: Union[str, Sequence[str], None] = "2f5f96d06b52"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+OCCURRENCE_HORIZON_DAYS = 400
+OCCURRENCE_HISTORY_DAYS = 365
+EXPANSION_BUDGET = 50_000
+
+
+def _expand(row, floor: date, horizon: date, limit: int) -> list[date] | None:
+    dtstart = datetime.combine(row.date, row.start_time).replace(tzinfo=UTC)
+    rule = rrulestr(row.rrule, dtstart=dtstart)
+    start_dt = datetime.combine(max(row.date, floor), row.start_time).replace(
+        tzinfo=UTC
+    )
+    end_dt = datetime.combine(horizon, row.end_time).replace(tzinfo=UTC)
+
+    excluded = set()
+    for ex in (row.exdate or "").split(","):
+        if ex:
+            excluded.add(date_parser.parse(ex).date())
+
+    occurrence_dates = [row.date]
+    for occ in rule.xafter(start_dt, inc=True):
+        if occ > end_dt:
+            break
+        occ_date = occ.date()
+        if occ_date == occurrence_dates[-1]:
+            continue
+        if occ_date != row.date and occ_date not in excluded:
+            occurrence_dates.append(occ_date)
+        if len(occurrence_dates) > limit:
+            return None
+
+    return occurrence_dates
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table(
+        "event_occurrences",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("occurrence_date", sa.Date(), nullable=False),
+        sa.Column("start_time", sa.Time(), nullable=False),
+        sa.Column("end_time", sa.Time(), nullable=False),
+        sa.Column("event_id", sa.Integer(), nullable=False),
+        sa.Column("user_id", sa.Integer(), nullable=False),
+        sa.ForeignKeyConstraint(["event_id"], ["events.id"], ondelete="CASCADE"),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("event_id", "occurrence_date"),
+    )
+    op.create_index(
+        op.f("ix_event_occurrences_id"),
+        "event_occurrences",
+        ["id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_event_occurrences_user_id_occurrence_date",
+        "event_occurrences",
+        ["user_id", "occurrence_date"],
+        unique=False,
+    )
+    op.add_column("events", sa.Column("occurrences_until", sa.Date(), nullable=True))
+
+    op.execute(
+        """
+        INSERT INTO event_occurrences
+            (event_id, user_id, occurrence_date, start_time, end_time)
+        SELECT id, user_id, date, start_time, end_time
+        FROM events
+        WHERE rrule IS NULL OR rrule = 'DNR'
+        """
+    )
+    op.execute(
+        """
+        UPDATE events SET occurrences_until = date
+        WHERE rrule IS NULL OR rrule = 'DNR'
+        """
+    )
+
+    connection = op.get_bind()
+    today = datetime.now(tz=UTC).date()
+    floor = today - timedelta(days=OCCURRENCE_HISTORY_DAYS)
+    horizon = today + timedelta(days=OCCURRENCE_HORIZON_DAYS)
+
+    series = connection.execute(
+        sa.text(
+            """
+            SELECT id, user_id, date, start_time, end_time, rrule, exdate
+            FROM events
+            WHERE rrule IS NOT NULL AND rrule != 'DNR'
+            """
+        ).columns(
+            sa.column("id", sa.Integer()),
+            sa.column("user_id", sa.Integer()),
+            sa.column("date", sa.Date()),
+            sa.column("start_time", sa.Time()),
+            sa.column("end_time", sa.Time()),
+            sa.column("rrule", sa.String()),
+            sa.column("exdate", sa.Text()),
+        )
+    ).fetchall()
+
+    event_occurrences = sa.table(
+        "event_occurrences",
+        sa.column("event_id", sa.Integer()),
+        sa.column("user_id", sa.Integer()),
+        sa.column("occurrence_date", sa.Date()),
+        sa.column("start_time", sa.Time()),
+        sa.column("end_time", sa.Time()),
+    )
+    events = sa.table(
+        "events",
+        sa.column("id", sa.Integer()),
+        sa.column("occurrences_until", sa.Date()),
+    )
+
+    # Series past the budget keep occurrences_until NULL. Reads fall back to
+    # expansion for them until the horizon job materializes them in batches.
+    budget = EXPANSION_BUDGET
+
+    for row in series:
+        occurrence_dates = _expand(row, floor, horizon, budget)
+
+        if occurrence_dates is None:
+            budget = 0
+            continue
+
+        budget -= len(occurrence_dates)
+        op.bulk_insert(
+            event_occurrences,
+            [
+                {
+                    "event_id": row.id,
+                    "user_id": row.user_id,
+                    "occurrence_date": occurrence_date,
+                    "start_time": row.start_time,
+                    "end_time": row.end_time,
+                }
+                for occurrence_date in occurrence_dates
+            ],
+        )
+        connection.execute(
+            events.update()
+            .where(events.c.id == row.id)
+            .values(occurrences_until=horizon)
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("events", "occurrences_until")
+    op.drop_index(
+        "ix_event_occurrences_user_id_occurrence_date",
+        table_name="event_occurrences",
+    )
+    op.drop_index(op.f("ix_event_occurrences_id"), table_name="event_occurrences")
+    op.drop_table("event_occurrences")
@@ -0,0 +1,46 @@
+"""extend occurrence index for paging
+
+Revision ID: 715c7c2c29c2
+Revises: 669257f2365d
+Create Date: 2026-10-18 15:02:41.118204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "715c7c2c29c2"
+down_revision: Union[str, Sequence[str], None] = "669257f2365d"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        "ix_event_occurrences_user_id_occurrence_date_start_time",
+        "event_occurrences",
+        ["user_id", "occurrence_date", "start_time", "event_id"],
+        unique=False,
+    )
+    op.drop_index(
+        "ix_event_occurrences_user_id_occurrence_date",
+        table_name="event_occurrences",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        "ix_event_occurrences_user_id_occurrence_date",
+        "event_occurrences",
+        ["user_id", "occurrence_date"],
+        unique=False,
+    )
+    op.drop_index(
+        "ix_event_occurrences_user_id_occurrence_date_start_time",
+        table_name="event_occurrences",
+    )
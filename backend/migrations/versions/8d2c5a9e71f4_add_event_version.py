@@ -0,0 +1,32 @@
+"""add event version
+
+Revision ID: 8d2c5a9e71f4
+Revises: b3e81f0a4c27
+Create Date: 2026-10-18 17:40:12.518843
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = "8d2c5a9e71f4"
+down_revision: Union[str, Sequence[str], None] = "b3e81f0a4c27"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column(
+        "events",
+        sa.Column("version", sa.Integer(), server_default="1", nullable=False),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column("events", "version")
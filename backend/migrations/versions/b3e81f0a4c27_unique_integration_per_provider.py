@@ -0,0 +1,37 @@
+"""unique integration per provider
+
+Revision ID: b3e81f0a4c27
+Revises: 715c7c2c29c2
+Create Date: 2026-10-18 16:21:09.402816
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "b3e81f0a4c27"
+down_revision: Union[str, Sequence[str], None] = "715c7c2c29c2"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute(
+        "DELETE FROM integrations WHERE id NOT IN "
+        "(SELECT MAX(id) FROM integrations GROUP BY user_id, provider)"
+    )
+    op.create_index(
+        "ix_integrations_user_id_provider",
+        "integrations",
+        ["user_id", "provider"],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_integrations_user_id_provider", table_name="integrations")
@@ -0,0 +1,57 @@
+"""add occurrence time range
+
+Revision ID: c901c90b21fe
+Revises: 6beb70672a62
+Create Date: 2026-10-18 19:05:33.914027
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+from api.system.models.models import (
+    OCCURRENCE_TIME_RANGE_DDL,
+    OCCURRENCE_TIME_RANGE_INDEX,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = "c901c90b21fe"
+down_revision: Union[str, Sequence[str], None] = "6beb70672a62"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    # A stored generated column is computed for every existing row when it is
+    # added, so adding it is also the backfill.
+    for statement in OCCURRENCE_TIME_RANGE_DDL:
+        op.execute(statement)
+
+    with op.get_context().autocommit_block():
+        op.create_index(
+            OCCURRENCE_TIME_RANGE_INDEX,
+            "event_occurrences",
+            ["user_id", "time_range"],
+            postgresql_using="gist",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    if op.get_context().dialect.name != "postgresql":
+        return
+
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            OCCURRENCE_TIME_RANGE_INDEX,
+            table_name="event_occurrences",
+            postgresql_concurrently=True,
+        )
+    op.drop_column("event_occurrences", "time_range")
@@ -0,0 +1,69 @@
+"""cover event window query
+
+Revision ID: e4a7c19b2d53
+Revises: c901c90b21fe
+Create Date: 2026-10-18 21:48:09.402716
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "e4a7c19b2d53"
+down_revision: Union[str, Sequence[str], None] = "c901c90b21fe"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_events_user_id_series_end_date",
+            "events",
+            ["user_id", "series_end", "date"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_events_user_id_series_end",
+            table_name="events",
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_events_user_id_date_covering",
+            table_name="events",
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_events_user_id_date_covering",
+            "events",
+            ["user_id", "date"],
+            postgresql_include=[
+                "id",
+                "title",
+                "start_time",
+                "end_time",
+                "colour",
+                "rrule",
+            ],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            "ix_events_user_id_series_end",
+            "events",
+            ["user_id", "series_end"],
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            "ix_events_user_id_series_end_date",
+            table_name="events",
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,49 @@
+from fastapi.testclient import TestClient
+
+
+def create_event(client: TestClient, headers: dict[str, str], title: str) -> int:
+    response = client.post(
+        "/api/v1/events",
+        headers=headers,
+        json={
+            "title": title,
+            "date": "2026-08-03",
+            "start_time": "09:00:00",
+            "end_time": "10:00:00",
+            "colour": "#aabbcc",
+            "rrule": "DNR",
+        },
+    )
+    response.raise_for_status()
+
+    return response.json()["id"]
+
+
+def test_apply_does_not_look_up_the_user(
+    client: TestClient,
+    headers: dict[str, str],
+    statements: list[str],
+) -> None:
+    edited_id = create_event(client, headers, "Review")
+    deleted_id = create_event(client, headers, "Retro")
+
+    statements.clear()
+    response = client.post(
+        "/api/v1/ai/audio/apply",
+        headers=headers,
+        json={
+            "session_id": "session",
+            "llm_output": "\n".join(
+                [
+                    "2026-08-04|add||09:00|10:00|Planning",
+                    f"2026-08-05|edit|{edited_id}|11:00|11:30|Review moved",
+                    f"|delete|{deleted_id}|||",
+                ],
+            ),
+        },
+    )
+    response.raise_for_status()
+
+    assert [event["title"] for event in response.json()] == ["Planning"]
+    assert any(statement.startswith("DELETE FROM events") for statement in statements)
+    assert not [statement for statement in statements if "FROM users" in statement]
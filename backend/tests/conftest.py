@@ -0,0 +1,70 @@
+import logging
+from collections.abc import Iterator
+from uuid import uuid4
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlalchemy.engine import Connection
+from sqlalchemy.orm import Session
+
+from api import create_app
+from api.database import SessionLocal, engine
+from api.system.models.models import User
+
+
+@pytest.fixture(scope="session")
+def client() -> TestClient:
+    logging.disable(logging.CRITICAL)
+    return TestClient(create_app())
+
+
+@pytest.fixture
+def db() -> Iterator[Session]:
+    session = SessionLocal()
+    try:
+        yield session
+    finally:
+        session.close()
+
+
+@pytest.fixture
+def statements() -> Iterator[list[str]]:
+    executed: list[str] = []
+
+    def record(_: Connection, __: object, statement: str, *_args: object) -> None:
+        executed.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield executed
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+@pytest.fixture
+def user(client: TestClient, db: Session) -> User:
+    email_address = f"{uuid4().hex}@example.com"
+    response = client.post(
+        "/api/v1/users",
+        json={
+            "first_name": "Test",
+            "last_name": "User",
+            "email_address": email_address,
+            "password": "test-password",
+        },
+    )
+    response.raise_for_status()
+
+    return db.query(User).filter_by(email_address=email_address).one()
+
+
+@pytest.fixture
+def headers(client: TestClient, user: User) -> dict[str, str]:
+    response = client.post(
+        "/api/v1/users/login",
+        data={"username": user.email_address, "password": "test-password"},
+    )
+    response.raise_for_status()
+
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
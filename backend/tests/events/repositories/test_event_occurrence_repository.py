@@ -0,0 +1,98 @@
+from datetime import date, datetime, time
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from api.database import SessionLocal, engine
+from api.events.repositories.event_occurrence_repository import (
+    EventOccurrenceRepository,
+)
+from api.events.services.occurrence_service import OccurrenceService
+from api.system.models.models import Event, User
+
+
+def create_event(
+    client: TestClient,
+    headers: dict[str, str],
+    start_time: str,
+    end_time: str,
+) -> int:
+    response = client.post(
+        "/api/v1/events",
+        headers=headers,
+        json={
+            "title": "One-off",
+            "date": "2026-06-01",
+            "start_time": start_time,
+            "end_time": end_time,
+            "colour": "#aabbcc",
+            "rrule": "DNR",
+        },
+    )
+    response.raise_for_status()
+
+    return response.json()["id"]
+
+
+@pytest.fixture
+def event_ids(client: TestClient, headers: dict[str, str]) -> list[int]:
+    return [
+        create_event(client, headers, "09:00:00", "10:00:00"),
+        create_event(client, headers, "09:30:00", "11:00:00"),
+        create_event(client, headers, "23:00:00", "01:00:00"),
+    ]
+
+
+def test_find_overlapping_matches_partial_overlaps(
+    db: Session,
+    user: User,
+    event_ids: list[int],
+) -> None:
+    overlapping = EventOccurrenceRepository(db).find_overlapping(
+        user.id,  # type: ignore  # noqa: PGH003
+        datetime.combine(date(2026, 6, 1), time(9, 45)),
+        datetime.combine(date(2026, 6, 2), time(0, 30)),
+    )
+
+    assert overlapping == event_ids
+
+
+def test_find_contained_skips_partial_overlaps(
+    db: Session,
+    user: User,
+    event_ids: list[int],
+) -> None:
+    contained = EventOccurrenceRepository(db).find_contained(
+        user.id,  # type: ignore  # noqa: PGH003
+        datetime.combine(date(2026, 6, 1), time(9, 15)),
+        datetime.combine(date(2026, 6, 2), time(1)),
+    )
+
+    assert contained == event_ids[1:]
+
+
+@pytest.mark.skipif(
+    engine.dialect.name != "postgresql",
+    reason="SQLite has no row locks",
+)
+def test_get_events_to_extend_skips_events_a_request_holds(
+    db: Session,
+    event_ids: list[int],
+) -> None:
+    db.query(Event).filter(Event.id.in_(event_ids)).update(
+        {Event.occurrences_until: None},
+    )
+    db.commit()
+    horizon = OccurrenceService.horizon()
+
+    with SessionLocal() as request:
+        request.query(Event).filter_by(id=event_ids[0]).update({Event.title: "Held"})
+        skipped = EventOccurrenceRepository(db).get_events_to_extend(horizon, 500)
+        db.rollback()
+
+    extended = EventOccurrenceRepository(db).get_events_to_extend(horizon, 500)
+    db.rollback()
+
+    assert event_ids[0] not in {event.id for event in skipped}
+    assert set(event_ids) <= {event.id for event in extended}
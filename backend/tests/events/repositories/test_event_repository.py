@@ -0,0 +1,64 @@
+from datetime import date, time
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from api.events.repositories.event_repository import EventRepository
+from api.system.models.models import Event, User
+
+
+def create_event(client: TestClient, headers: dict[str, str]) -> dict:
+    response = client.post(
+        "/api/v1/events",
+        headers=headers,
+        json={
+            "title": "One-off",
+            "date": "2026-03-10",
+            "start_time": "09:00:00",
+            "end_time": "10:00:00",
+            "colour": "#aabbcc",
+            "rrule": "DNR",
+        },
+    )
+    response.raise_for_status()
+
+    return response.json()
+
+
+def test_update_many_checks_every_version(
+    client: TestClient,
+    db: Session,
+    user: User,
+    headers: dict[str, str],
+) -> None:
+    first, second = create_event(client, headers), create_event(client, headers)
+    event_repository = EventRepository(db)
+    updates = {
+        event["id"]: {
+            "title": title,
+            "date": date(2026, 3, 11),
+            "start_time": time(9),
+            "end_time": time(10),
+        }
+        for event, title in [(first, "First"), (second, "Second")]
+    }
+
+    stale = event_repository.update_many(
+        user.id,
+        updates,
+        {first["id"]: first["version"], second["id"]: second["version"] + 1},
+    )
+    db.rollback()
+    current = event_repository.update_many(
+        user.id,
+        updates,
+        {first["id"]: first["version"], second["id"]: second["version"]},
+    )
+    db.commit()
+
+    assert not stale
+    assert current
+    assert {
+        (event.title, event.version)
+        for event in db.query(Event).filter(Event.id.in_(updates))
+    } == {("First", first["version"] + 1), ("Second", second["version"] + 1)}
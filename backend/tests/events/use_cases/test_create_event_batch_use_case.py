@@ -0,0 +1,35 @@
+from fastapi.testclient import TestClient
+
+
+def test_batch_create_statements_do_not_grow_with_batch_size(
+    client: TestClient,
+    headers: dict[str, str],
+    statements: list[str],
+) -> None:
+    counts = []
+
+    for size in (1, 25):
+        statements.clear()
+        response = client.post(
+            "/api/v1/events/batch",
+            headers=headers,
+            json={
+                "events": [
+                    {
+                        "title": f"Event {i}",
+                        "date": "2026-11-02",
+                        "start_time": "09:00:00",
+                        "end_time": "10:00:00",
+                        "colour": "#aabbcc",
+                        "rrule": "FREQ=WEEKLY" if i % 2 else "DNR",
+                    }
+                    for i in range(size)
+                ],
+            },
+        )
+        response.raise_for_status()
+        # SQLite runs an ordered RETURNING insert row by row, so compare the
+        # distinct statements rather than how many times each was executed.
+        counts.append(len(set(statements)))
+
+    assert counts[0] == counts[1]
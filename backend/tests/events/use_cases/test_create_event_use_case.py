@@ -0,0 +1,25 @@
+from fastapi.testclient import TestClient
+
+
+def test_create_does_not_look_up_the_user(
+    client: TestClient,
+    headers: dict[str, str],
+    statements: list[str],
+) -> None:
+    statements.clear()
+    response = client.post(
+        "/api/v1/events",
+        headers=headers,
+        params={"check_conflicts": True},
+        json={
+            "title": "Standup",
+            "date": "2026-07-06",
+            "start_time": "09:00:00",
+            "end_time": "09:15:00",
+            "colour": "#aabbcc",
+            "rrule": "FREQ=WEEKLY",
+        },
+    )
+    response.raise_for_status()
+
+    assert not [statement for statement in statements if "FROM users" in statement]
@@ -0,0 +1,112 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
+
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from api.system.models.models import EventExdate, EventOccurrence
+
+SERIES = {
+    "title": "Standup",
+    "date": "2026-05-04",
+    "start_time": "09:00:00",
+    "end_time": "09:15:00",
+    "colour": "#aabbcc",
+    "rrule": "FREQ=WEEKLY",
+}
+
+
+def create_series(client: TestClient, headers: dict[str, str]) -> int:
+    response = client.post("/api/v1/events", headers=headers, json=SERIES)
+    response.raise_for_status()
+
+    return response.json()["id"]
+
+
+def delete_instance(
+    client: TestClient,
+    headers: dict[str, str],
+    event_id: int,
+    instance: date,
+) -> int:
+    return client.request(
+        "DELETE",
+        f"/api/v1/events/{event_id}",
+        headers=headers,
+        json={"event_id": event_id, "date": str(instance)},
+    ).status_code
+
+
+def test_concurrent_instance_deletes_keep_every_exdate(
+    client: TestClient,
+    db: Session,
+    headers: dict[str, str],
+) -> None:
+    event_id = create_series(client, headers)
+    instances = [date(2026, 5, 11) + timedelta(weeks=week) for week in range(8)]
+
+    with ThreadPoolExecutor(max_workers=len(instances)) as executor:
+        statuses = list(
+            executor.map(
+                lambda instance: delete_instance(client, headers, event_id, instance),
+                instances,
+            ),
+        )
+
+    exdates = db.query(EventExdate.exdate).filter_by(event_id=event_id).all()
+
+    assert statuses == [200] * len(instances)
+    assert sorted(exdate for (exdate,) in exdates) == instances
+
+
+def test_deleting_an_instance_twice_is_idempotent(
+    client: TestClient,
+    headers: dict[str, str],
+) -> None:
+    event_id = create_series(client, headers)
+
+    statuses = [
+        delete_instance(client, headers, event_id, date(2026, 5, 11)) for _ in range(2)
+    ]
+
+    assert statuses == [200, 200]
+
+
+def test_deleting_a_series_removes_its_exdates_and_occurrences(
+    client: TestClient,
+    db: Session,
+    headers: dict[str, str],
+) -> None:
+    event_id = create_series(client, headers)
+    delete_instance(client, headers, event_id, date(2026, 5, 11))
+
+    response = client.request(
+        "DELETE",
+        f"/api/v1/events/{event_id}",
+        headers=headers,
+        json={"event_id": event_id},
+    )
+    response.raise_for_status()
+
+    assert db.query(EventExdate).filter_by(event_id=event_id).count() == 0
+    assert db.query(EventOccurrence).filter_by(event_id=event_id).count() == 0
+
+
+def test_delete_does_not_look_up_the_user(
+    client: TestClient,
+    headers: dict[str, str],
+    statements: list[str],
+) -> None:
+    event_id = create_series(client, headers)
+
+    statements.clear()
+    delete_instance(client, headers, event_id, date(2026, 5, 11))
+    response = client.request(
+        "DELETE",
+        f"/api/v1/events/{event_id}",
+        headers=headers,
+        json={"event_id": event_id},
+    )
+    response.raise_for_status()
+
+    assert not [statement for statement in statements if "FROM users" in statement]
@@ -0,0 +1,110 @@
+from fastapi.testclient import TestClient
+
+SERIES = {
+    "title": "Standup",
+    "date": "2026-03-02",
+    "start_time": "09:00:00",
+    "end_time": "09:15:00",
+    "colour": "#aabbcc",
+    "rrule": "FREQ=WEEKLY",
+}
+
+
+def create_series(client: TestClient, headers: dict[str, str]) -> dict:
+    response = client.post("/api/v1/events", headers=headers, json=SERIES)
+    response.raise_for_status()
+
+    return response.json()
+
+
+def test_conflicting_split_edits_only_apply_once(
+    client: TestClient,
+    headers: dict[str, str],
+) -> None:
+    series = create_series(client, headers)
+
+    responses = [
+        client.put(
+            f"/api/v1/events/{series['id']}",
+            headers=headers,
+            json={
+                "title": title,
+                "previous_date": previous_date,
+                "version": series["version"],
+            },
+        )
+        for title, previous_date in [("Moved", "2026-03-09"), ("Also", "2026-03-16")]
+    ]
+
+    assert [response.status_code for response in responses] == [200, 409]
+
+
+def test_conflicting_batch_split_edits_only_apply_once(
+    client: TestClient,
+    headers: dict[str, str],
+) -> None:
+    series = create_series(client, headers)
+
+    responses = [
+        client.put(
+            "/api/v1/events/batch",
+            headers=headers,
+            json={
+                "events": [
+                    {
+                        "event_id": series["id"],
+                        "title": title,
+                        "previous_date": previous_date,
+                        "version": series["version"],
+                    },
+                ],
+            },
+        )
+        for title, previous_date in [("Moved", "2026-03-09"), ("Also", "2026-03-16")]
+    ]
+
+    assert [response.status_code for response in responses] == [200, 409]
+
+
+def test_batch_edit_rejects_duplicate_events(
+    client: TestClient,
+    headers: dict[str, str],
+) -> None:
+    series = create_series(client, headers)
+
+    response = client.put(
+        "/api/v1/events/batch",
+        headers=headers,
+        json={
+            "events": [
+                {"event_id": series["id"], "title": "Moved", "previous_date": date}
+                for date in ["2026-03-09", "2026-03-16"]
+            ],
+        },
+    )
+
+    assert response.status_code == 400
+
+
+def test_edit_does_not_look_up_the_user(
+    client: TestClient,
+    headers: dict[str, str],
+    statements: list[str],
+) -> None:
+    event = create_series(client, headers)
+    split = client.put(
+        f"/api/v1/events/{event['id']}",
+        headers=headers,
+        json={"title": "Moved", "previous_date": "2026-03-09"},
+    )
+    split.raise_for_status()
+
+    statements.clear()
+    response = client.put(
+        f"/api/v1/events/{split.json()['id']}",
+        headers=headers,
+        json={"title": "Renamed"},
+    )
+    response.raise_for_status()
+
+    assert not [statement for statement in statements if "FROM users" in statement]
@@ -0,0 +1,124 @@
+from datetime import UTC, date, datetime, time, timedelta
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.orm import Session
+
+from api.system.models.models import Event, User
+from api.users.repositories.user_repository import UserRepository
+
+WINDOW = {"start_date": "2026-03-01", "end_date": "2026-03-31"}
+
+
+def create_event(client: TestClient, headers: dict[str, str], title: str) -> None:
+    response = client.post(
+        "/api/v1/events",
+        headers=headers,
+        json={
+            "title": title,
+            "date": "2026-03-10",
+            "start_time": "09:00:00",
+            "end_time": "10:00:00",
+            "colour": "#aabbcc",
+            "rrule": "DNR",
+        },
+    )
+    response.raise_for_status()
+
+
+def test_cached_list_is_not_served_after_calendar_version_changes(
+    client: TestClient,
+    db: Session,
+    user: User,
+    headers: dict[str, str],
+) -> None:
+    create_event(client, headers, "First")
+    first = client.get("/api/v1/events", headers=headers, params=WINDOW)
+    cached = client.get("/api/v1/events", headers=headers, params=WINDOW)
+
+    assert cached.content == first.content
+
+    # A write handled by another worker never touches this process's cache.
+    db.add(
+        Event(
+            title="Second",
+            date=date(2026, 3, 11),
+            start_time=time(9),
+            end_time=time(10),
+            colour="#aabbcc",
+            rrule="DNR",
+            user_id=user.id,
+        ),
+    )
+    UserRepository(db).bump_calendar_version(user.id)  # type: ignore  # noqa: PGH003
+    db.commit()
+
+    second = client.get("/api/v1/events", headers=headers, params=WINDOW)
+
+    assert second.headers["ETag"] != first.headers["ETag"]
+    assert sorted(event["title"] for event in second.json()["events"]) == [
+        "First",
+        "Second",
+    ]
+
+
+def test_unchanged_list_answers_304_for_its_etag(
+    client: TestClient,
+    headers: dict[str, str],
+) -> None:
+    create_event(client, headers, "First")
+    first = client.get("/api/v1/events", headers=headers, params=WINDOW)
+
+    response = client.get(
+        "/api/v1/events",
+        headers={**headers, "If-None-Match": first.headers["ETag"]},
+        params=WINDOW,
+    )
+
+    assert response.status_code == 304
+
+
+@pytest.mark.parametrize(
+    ("offset_days", "expected_statements"),
+    [
+        # Materialized: calendar version, pending-series check, occurrences.
+        (7, 3),
+        # Past the read horizon: calendar version, events, exdates.
+        (400, 3),
+    ],
+)
+def test_list_statements_do_not_grow_with_series(
+    client: TestClient,
+    headers: dict[str, str],
+    statements: list[str],
+    offset_days: int,
+    expected_statements: int,
+) -> None:
+    today = datetime.now(tz=UTC).date()
+    window = {
+        "start_date": str(today + timedelta(days=offset_days)),
+        "end_date": str(today + timedelta(days=offset_days + 13)),
+    }
+    counts = []
+
+    for added in (1, 9):
+        for _ in range(added):
+            response = client.post(
+                "/api/v1/events",
+                headers=headers,
+                json={
+                    "title": "Daily",
+                    "date": str(today),
+                    "start_time": "09:00:00",
+                    "end_time": "10:00:00",
+                    "colour": "#aabbcc",
+                    "rrule": "FREQ=DAILY",
+                },
+            )
+            response.raise_for_status()
+
+        statements.clear()
+        response = client.get("/api/v1/events", headers=headers, params=window)
+        counts.append((len(response.json()["events"]), len(statements)))
+
+    assert counts == [(14, expected_statements), (140, expected_statements)]
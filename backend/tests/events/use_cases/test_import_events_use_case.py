@@ -0,0 +1,49 @@
+import io
+
+from fastapi.testclient import TestClient
+
+
+def calendar(days: range) -> bytes:
+    events = "".join(
+        "BEGIN:VEVENT\r\n"
+        f"SUMMARY:Imported {day}\r\n"
+        f"DTSTART:202611{day:02d}T090000\r\n"
+        f"DTEND:202611{day:02d}T100000\r\n"
+        "END:VEVENT\r\n"
+        for day in days
+    )
+
+    return f"BEGIN:VCALENDAR\r\nVERSION:2.0\r\n{events}END:VCALENDAR\r\n".encode()
+
+
+def import_calendar(
+    client: TestClient,
+    headers: dict[str, str],
+    content: bytes,
+) -> None:
+    response = client.post(
+        "/api/v1/events/import",
+        headers=headers,
+        files={"file": ("calendar.ics", io.BytesIO(content), "text/calendar")},
+    )
+    response.raise_for_status()
+
+
+def test_import_does_not_look_up_the_user_per_event(
+    client: TestClient,
+    headers: dict[str, str],
+    statements: list[str],
+) -> None:
+    statements.clear()
+    import_calendar(client, headers, calendar(range(1, 2)))
+    single = list(statements)
+
+    statements.clear()
+    import_calendar(client, headers, calendar(range(10, 20)))
+
+    assert not [
+        statement
+        for statement in single + statements
+        if statement.startswith("SELECT") and "FROM users" in statement
+    ]
+    assert len(statements) == 10 * len(single)
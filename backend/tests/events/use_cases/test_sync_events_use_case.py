@@ -0,0 +1,95 @@
+from collections.abc import Callable
+
+import pytest
+from fastapi.testclient import TestClient
+from httpx import Response
+
+EVENT = {
+    "title": "Standup",
+    "date": "2026-04-06",
+    "start_time": "09:00:00",
+    "end_time": "09:15:00",
+    "colour": "#aabbcc",
+    "rrule": "FREQ=WEEKLY",
+}
+
+
+def create_event(client: TestClient, headers: dict[str, str]) -> int:
+    response = client.post("/api/v1/events", headers=headers, json=EVENT)
+    response.raise_for_status()
+
+    return response.json()["id"]
+
+
+WRITES: dict[str, Callable[[TestClient, dict[str, str], int], Response]] = {
+    "create": lambda client, headers, _: client.post(
+        "/api/v1/events",
+        headers=headers,
+        json=EVENT,
+    ),
+    "split": lambda client, headers, event_id: client.put(
+        f"/api/v1/events/{event_id}",
+        headers=headers,
+        json={"title": "Moved", "previous_date": "2026-04-13"},
+    ),
+    "delete instance": lambda client, headers, event_id: client.request(
+        "DELETE",
+        f"/api/v1/events/{event_id}",
+        headers=headers,
+        json={"event_id": event_id, "date": "2026-04-20"},
+    ),
+    "delete": lambda client, headers, event_id: client.request(
+        "DELETE",
+        f"/api/v1/events/{event_id}",
+        headers=headers,
+        json={"event_id": event_id},
+    ),
+    "batch create": lambda client, headers, _: client.post(
+        "/api/v1/events/batch",
+        headers=headers,
+        json={"events": [EVENT, EVENT]},
+    ),
+    "batch edit": lambda client, headers, event_id: client.put(
+        "/api/v1/events/batch",
+        headers=headers,
+        json={
+            "events": [
+                {"event_id": event_id, "title": "Moved", "previous_date": "2026-04-13"},
+            ],
+        },
+    ),
+    "batch delete": lambda client, headers, event_id: client.request(
+        "DELETE",
+        "/api/v1/events/batch",
+        headers=headers,
+        json={"events": [{"event_id": event_id}]},
+    ),
+}
+
+
+@pytest.mark.parametrize("write", WRITES)
+def test_writes_lock_the_calendar_before_journaling(
+    client: TestClient,
+    headers: dict[str, str],
+    statements: list[str],
+    write: str,
+) -> None:
+    event_id = create_event(client, headers)
+
+    statements.clear()
+    WRITES[write](client, headers, event_id).raise_for_status()
+
+    # The calendar version bump takes the per-user row lock, so journal ids
+    # are only handed out once earlier writes for the user have committed.
+    bump = next(
+        index
+        for index, statement in enumerate(statements)
+        if statement.startswith("UPDATE users")
+    )
+    journal = next(
+        index
+        for index, statement in enumerate(statements)
+        if statement.startswith("INSERT INTO event_changes")
+    )
+
+    assert bump < journal
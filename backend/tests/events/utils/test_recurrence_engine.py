@@ -0,0 +1,99 @@
+import random
+from datetime import UTC, date, datetime, time, timedelta
+
+import pytest
+
+from api.events.utils.recurrence_engine import expand_simple_rule, parse_simple_rule
+from api.events.utils.recurrence_utils import _expand_with_dateutil
+
+RULES_PER_SEED = 2_000
+WEEKDAYS = ["MO", "TU", "WE", "TH", "FR", "SA", "SU"]
+
+
+def random_rule(rng: random.Random) -> str:
+    frequency = rng.choice(["DAILY", "WEEKLY", "MONTHLY"])
+    parts = [f"FREQ={frequency}"]
+
+    if rng.random() < 0.6:
+        parts.append(f"INTERVAL={rng.randint(1, 5)}")
+
+    if frequency == "WEEKLY" and rng.random() < 0.7:
+        weekdays = rng.sample(WEEKDAYS, rng.randint(1, 4))
+        parts.append(f"BYDAY={','.join(weekdays)}")
+
+    bound = rng.random()
+    if bound < 0.3:
+        parts.append(f"COUNT={rng.randint(1, 60)}")
+    elif bound < 0.6:
+        until = date(2026, 1, 1) + timedelta(days=rng.randint(-100, 800))
+        hour = rng.randint(0, 23)
+        minute = rng.choice([0, 30])
+        parts.append(f"UNTIL={until:%Y%m%d}T{hour:02d}{minute:02d}00Z")
+
+    rng.shuffle(parts)
+    return ";".join(parts)
+
+
+def random_dtstart(rng: random.Random) -> date:
+    dtstart = date(2025, 1, 1) + timedelta(days=rng.randint(0, 700))
+
+    # Month-end starts exercise the months dateutil skips for MONTHLY rules.
+    if rng.random() < 0.3 and dtstart.month in {1, 3, 5, 7, 8, 10, 12}:
+        dtstart = dtstart.replace(day=rng.choice([29, 30, 31]))
+
+    return dtstart
+
+
+@pytest.mark.parametrize("seed", [7, 42, 2024, 31337, 90210])
+def test_simple_rule_expansion_matches_dateutil(seed: int) -> None:
+    rng = random.Random(seed)
+
+    for _ in range(RULES_PER_SEED):
+        rrule = random_rule(rng)
+        dtstart = random_dtstart(rng)
+        start_time = time(rng.randint(0, 22), rng.choice([0, 15, 30]))
+        end_time = (
+            time(rng.randint(0, 23), rng.choice([0, 45]))
+            if rng.random() < 0.1
+            else time(start_time.hour + 1, start_time.minute)
+        )
+        start_date = date(2025, 1, 1) + timedelta(days=rng.randint(0, 900))
+        end_date = start_date + timedelta(days=rng.randint(0, 730))
+
+        rule = parse_simple_rule(rrule)
+        assert rule is not None, rrule
+
+        expected = list(
+            _expand_with_dateutil(
+                rrule,
+                datetime.combine(dtstart, start_time, tzinfo=UTC),
+                datetime.combine(start_date, start_time, tzinfo=UTC),
+                datetime.combine(end_date, end_time, tzinfo=UTC),
+            ),
+        )
+        actual = expand_simple_rule(
+            rule,
+            dtstart,
+            start_time,
+            end_time,
+            start_date,
+            end_date,
+        )
+
+        assert actual == expected, (rrule, dtstart, start_date, end_date)
+
+
+@pytest.mark.parametrize(
+    "rrule",
+    [
+        "FREQ=YEARLY",
+        "FREQ=HOURLY",
+        "FREQ=MONTHLY;BYMONTHDAY=15",
+        "FREQ=WEEKLY;BYDAY=1MO",
+        "FREQ=DAILY;COUNT=3;UNTIL=20260101T000000Z",
+        "FREQ=DAILY;WKST=SU",
+        "FREQ=DAILY;INTERVAL=0",
+    ],
+)
+def test_unsupported_rules_fall_back_to_dateutil(rrule: str) -> None:
+    assert parse_simple_rule(rrule) is None
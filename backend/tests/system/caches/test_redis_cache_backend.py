@@ -0,0 +1,125 @@
+import socket
+import socketserver
+import threading
+from collections.abc import Iterator
+
+import pytest
+
+from api.system.caches.redis_cache_backend import RedisCacheBackend
+
+ERROR_KEY = b"wrong-type"
+
+
+class FakeRedisHandler(socketserver.StreamRequestHandler):
+    server: "FakeRedisServer"
+
+    def handle(self) -> None:
+        self.server.connections.append(self.connection)
+
+        while line := self.rfile.readline():
+            command = []
+
+            for _ in range(int(line[1:])):
+                length = int(self.rfile.readline()[1:])
+                command.append(self.rfile.read(length + 2)[:-2])
+
+            self.server.commands.append(command)
+            self.wfile.write(self.server.reply(command))
+
+
+class FakeRedisServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), FakeRedisHandler)
+        self.store: dict[bytes, bytes] = {}
+        self.commands: list[list[bytes]] = []
+        self.connections: list[socket.socket] = []
+
+    def reply(self, command: list[bytes]) -> bytes:
+        name, key, *arguments = command
+
+        if key == ERROR_KEY:
+            return b"-WRONGTYPE Operation against a key holding the wrong kind\r\n"
+
+        if name == b"GET":
+            value = self.store.get(key)
+            if value is None:
+                return b"$-1\r\n"
+            return b"$%d\r\n%s\r\n" % (len(value), value)
+
+        if name == b"SET":
+            self.store[key] = arguments[0]
+            return b"+OK\r\n"
+
+        return b":%d\r\n" % (self.store.pop(key, None) is not None)
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+        for connection in self.connections:
+            if connection.fileno() != -1:
+                connection.shutdown(socket.SHUT_RDWR)
+                connection.close()
+
+
+@pytest.fixture
+def server() -> Iterator[FakeRedisServer]:
+    server = FakeRedisServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+
+    try:
+        yield server
+    finally:
+        server.stop()
+
+
+@pytest.fixture
+def backend(server: FakeRedisServer) -> RedisCacheBackend:
+    host, port = server.server_address
+    return RedisCacheBackend(f"redis://{host}:{port}/0")
+
+
+def test_get_returns_a_stored_value(backend: RedisCacheBackend) -> None:
+    backend.set("events", b"\r\npayload\r\n")
+
+    assert backend.get("events") == b"\r\npayload\r\n"
+
+
+def test_get_returns_none_for_a_missing_key(backend: RedisCacheBackend) -> None:
+    assert backend.get("missing") is None
+
+
+def test_set_sends_the_ttl_as_ex(
+    server: FakeRedisServer,
+    backend: RedisCacheBackend,
+) -> None:
+    backend.set("events", b"payload", ttl_seconds=60)
+
+    assert server.commands == [[b"SET", b"events", b"payload", b"EX", b"60"]]
+
+
+def test_error_reply_is_a_miss_and_reconnects(
+    server: FakeRedisServer,
+    backend: RedisCacheBackend,
+) -> None:
+    backend.set("events", b"payload")
+
+    assert backend.get(ERROR_KEY.decode()) is None
+    assert backend.get("events") == b"payload"
+    assert len(server.connections) == 2
+
+
+def test_server_going_away_is_a_miss(
+    server: FakeRedisServer,
+    backend: RedisCacheBackend,
+) -> None:
+    backend.set("events", b"payload")
+    server.stop()
+
+    assert backend.get("events") is None
+    assert backend.get("events") is None
+    backend.set("events", b"payload")
+    backend.delete("events")